@@ -8,6 +8,7 @@ python manage.py migrate
 if [ "$(python manage.py shell -c 'from cities_light.models import City; print(City.objects.count())')" = "0" ]; then
   echo "Loading cities_light data..."
   python manage.py cities_light
+  python manage.py build_region_centroids
 else
   echo "cities_light data already loaded. Skipping."
 fi
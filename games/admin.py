@@ -1,10 +1,13 @@
 from django.contrib import admin
+from django.db.models import Exists, OuterRef, Q
 
 from core.admin_mixins import AuditAdminMixin
 from cities_light.models import Country, Region, City, SubRegion
 
+from games.catalog import bump_catalog_generation
+from games.detail_cache import evict_game_detail
 from games.form import GameAdminForm
-from .models import Game, GameDate, GameImages, Season
+from .models import Game, GameDate, GameImages, ImageJob, Season
 
 admin.site.unregister(Country)
 admin.site.unregister(Region)
@@ -12,6 +15,39 @@ admin.site.unregister(City)
 admin.site.unregister(SubRegion)
 
 
+def _failed_image_jobs(kind):
+    """Failed jobs of kind that no later upload has superseded."""
+    later = ImageJob.objects.filter(
+        kind=kind, object_id=OuterRef("object_id"), created__gt=OuterRef("created")
+    )
+    return ImageJob.objects.filter(kind=kind, status=ImageJob.Status.FAILED).exclude(
+        Exists(later)
+    )
+
+
+def _image_job_error(kind, object_id):
+    """Why the worker gave up on object_id's current upload (None if it didn't)."""
+    job = _failed_image_jobs(kind).filter(object_id=object_id).last()
+    return (job.error or "Failed") if job else None
+
+
+class ImageProcessingFailedFilter(admin.SimpleListFilter):
+    """Games whose logo or a gallery image the image worker gave up on."""
+
+    title = "image processing"
+    parameter_name = "image_failed"
+
+    def lookups(self, request, model_admin):
+        return (("yes", "Failed"),)
+
+    def queryset(self, request, queryset):
+        if self.value() != "yes":
+            return queryset
+        logos = _failed_image_jobs(ImageJob.Kind.LOGO).values("object_id")
+        images = _failed_image_jobs(ImageJob.Kind.IMAGE).values("object_id")
+        return queryset.filter(Q(pk__in=logos) | Q(images__pk__in=images)).distinct()
+
+
 class SeasonInline(admin.TabularInline):
     model = Season
     extra = 1
@@ -37,12 +73,17 @@ class GameDateInline(admin.TabularInline):
 class GameImagesInline(admin.TabularInline):
     model = GameImages
     extra = 1
-    fields = ["image", "description"]
+    fields = ["image", "description", "image_processing", "image_error"]
+    readonly_fields = ["image_processing", "image_error"]
 
     def get_queryset(self, request):
         qs = super().get_queryset(request)
         return qs.filter(is_removed=False)
 
+    @admin.display(description="Processing error")
+    def image_error(self, obj):
+        return _image_job_error(ImageJob.Kind.IMAGE, obj.pk) if obj.pk else None
+
 
 @admin.register(Game)
 class GameAdmin(AuditAdminMixin):
@@ -50,9 +91,12 @@ class GameAdmin(AuditAdminMixin):
     inlines = [GameDateInline, SeasonInline, GameImagesInline]
     exclude = ("slug",)
 
+    readonly_fields = ("logo_processing", "logo_error")
+
     list_display = (
         "name",
         "game_format",
+        "logo_processing",
         "created",
         "created_by",
         "modified",
@@ -60,6 +104,7 @@ class GameAdmin(AuditAdminMixin):
     )
     list_filter = (
         "game_format",
+        ImageProcessingFailedFilter,
         "created_by",
         "modified_by",
     )
@@ -76,6 +121,25 @@ class GameAdmin(AuditAdminMixin):
                 form.base_fields[field_name].widget.can_view_related = False
         return form
 
+    @admin.display(description="Logo processing error")
+    def logo_error(self, obj):
+        return _image_job_error(ImageJob.Kind.LOGO, obj.pk) if obj.pk else None
+
     def get_queryset(self, request):
         qs = super().get_queryset(request)
         return qs.filter(is_removed=False)
+
+    def delete_queryset(self, request, queryset):
+        # Bulk soft delete is a single UPDATE, so no post_save signals fire
+        slugs = list(queryset.values_list("slug", flat=True))
+        super().delete_queryset(request, queryset)
+        bump_catalog_generation()
+        evict_game_detail(slugs)
+
+
+@admin.register(ImageJob)
+class ImageJobAdmin(admin.ModelAdmin):
+    list_display = ("kind", "object_id", "status", "attempts", "created", "modified")
+    list_filter = ("status", "kind")
+    readonly_fields = ("kind", "object_id", "attempts", "started_at", "error")
+    ordering = ("-created",)
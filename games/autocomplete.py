@@ -1,31 +1,44 @@
 from dal import autocomplete
 from cities_light.models import Country, Region, City
 
+from .fuzzy import fuzzy_filter
 
-class CountryAutocomplete(autocomplete.Select2QuerySetView):
+
+class FuzzyNameSearchMixin:
+    """
+    Filter on name__icontains, falling back to trigram similarity when that
+    finds nothing so typos still return the closest names.
+    """
+
+    def search_names(self, qs):
+        if not self.q:
+            return qs
+        matches = qs.filter(name__icontains=self.q)
+        if matches.exists():
+            return matches
+        return fuzzy_filter(qs, "name", self.q)
+
+
+class CountryAutocomplete(FuzzyNameSearchMixin, autocomplete.Select2QuerySetView):
     def get_queryset(self):
         qs = Country.objects.all()
-        if self.q:
-            qs = qs.filter(name__icontains=self.q)
-        return qs
+        return self.search_names(qs)
 
 
-class RegionAutocomplete(autocomplete.Select2QuerySetView):
+class RegionAutocomplete(FuzzyNameSearchMixin, autocomplete.Select2QuerySetView):
     def get_queryset(self):
         qs = Region.objects.all()
         country_id = self.forwarded.get("country")
         if not country_id:
             return Region.objects.none()
         qs = qs.filter(country_id=country_id)
-        if self.q:
-            qs = qs.filter(name__icontains=self.q)
-        return qs
+        return self.search_names(qs)
 
     def get_result_label(self, item):
         return item.name
 
 
-class CityAutocomplete(autocomplete.Select2QuerySetView):
+class CityAutocomplete(FuzzyNameSearchMixin, autocomplete.Select2QuerySetView):
     def get_queryset(self):
         qs = City.objects.all()
         region_id = self.forwarded.get("region")
@@ -33,9 +46,7 @@ class CityAutocomplete(autocomplete.Select2QuerySetView):
             return City.objects.none()
         if region_id:
             qs = qs.filter(region_id=region_id)
-        if self.q:
-            qs = qs.filter(name__icontains=self.q)
-        return qs
+        return self.search_names(qs)
 
     def get_result_label(self, item):
         return item.name
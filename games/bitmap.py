@@ -0,0 +1,210 @@
+"""
+Per-process bitmap index over the live catalog, for resolving list filters.
+
+Every live game gets a rank in (name, id) order. For each filterable column
+the index keeps one bitset (a Python int, bit n = rank n) per distinct value,
+so a filter combination is a handful of ANDs/ORs and a count is a popcount.
+Only the page of ids that will actually be shown is fetched from the database.
+
+The snapshot is tagged with the catalog generation it was built under
+(games.catalog) and rebuilt on the first lookup after the generation moves,
+or once it is older than the catalog cache timeout.
+"""
+
+import threading
+import time
+from collections.abc import Sequence
+from typing import Any, Dict, Iterable, List, Optional
+
+from django.db.models import QuerySet
+
+from .catalog import CATALOG_CACHE_TIMEOUT, get_catalog_generation
+from .facets import TRI_STATE_FILTERS
+from .models import Game
+from .search import get_search_backend
+
+# Model columns indexed as-is; has_casting is derived from casting_link
+INDEXED_COLUMNS = (
+    "game_format",
+    "game_duration",
+    "filming_status",
+    "country_id",
+    "region_id",
+    "city_id",
+    "active",
+    "college_game",
+    "friends_and_family",
+    "for_charity",
+)
+
+
+def _as_int(value) -> Optional[int]:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class CatalogSnapshot:
+    def __init__(self, generation: int, rows: Iterable[tuple]):
+        self.generation = generation
+        self.built_at = time.monotonic()
+        self.pks: List[Any] = []
+        self.rank_of: Dict[Any, int] = {}
+        self.bitsets: Dict[str, Dict[Any, int]] = {
+            column: {} for column in INDEXED_COLUMNS + ("has_casting",)
+        }
+        for rank, (pk, *values, casting_link) in enumerate(rows):
+            self.pks.append(pk)
+            self.rank_of[pk] = rank
+            bit = 1 << rank
+            for column, value in zip(INDEXED_COLUMNS, values):
+                column_bits = self.bitsets[column]
+                column_bits[value] = column_bits.get(value, 0) | bit
+            casting = self.bitsets["has_casting"]
+            casting[bool(casting_link)] = casting.get(bool(casting_link), 0) | bit
+        self.all = (1 << len(self.pks)) - 1
+
+    def any_of(self, column: str, values: Iterable) -> int:
+        column_bits = self.bitsets[column]
+        bits = 0
+        for value in values:
+            bits |= column_bits.get(value, 0)
+        return bits
+
+    def match(self, filters: Dict[str, Any]) -> int:
+        """Bitset of games matching filters (same semantics as _apply_filters)."""
+        bits = self.all
+        if filters.get("query"):
+            matching = get_search_backend().search(Game.objects.all(), filters["query"])
+            query_bits = 0
+            for pk in matching.values_list("pk", flat=True):
+                rank = self.rank_of.get(pk)
+                if rank is not None:
+                    query_bits |= 1 << rank
+            bits &= query_bits
+
+        for column, key in (
+            ("game_format", "game_formats"),
+            ("game_duration", "game_durations"),
+            ("filming_status", "filming_statuses"),
+        ):
+            if filters.get(key):
+                bits &= self.any_of(column, filters[key])
+
+        if filters.get("country_id"):
+            bits &= self.any_of("country_id", [_as_int(filters["country_id"])])
+        if filters.get("no_region"):
+            bits &= self.any_of("region_id", [None])
+        if filters.get("region_id"):
+            bits &= self.any_of("region_id", [_as_int(filters["region_id"])])
+        if filters.get("no_city"):
+            bits &= self.any_of("city_id", [None])
+        if filters.get("city_id"):
+            bits &= self.any_of("city_id", [_as_int(filters["city_id"])])
+
+        for name, (column, exclude, only) in TRI_STATE_FILTERS.items():
+            mode = filters.get(name, "")
+            if mode in ("exclude", "only"):
+                check = exclude if mode == "exclude" else only
+                bits &= self.any_of(
+                    column, [v for v in self.bitsets[column] if check(v)]
+                )
+        return bits
+
+    def pks_for(self, bits: int, start: int = 0, stop: Optional[int] = None) -> list:
+        """pks of the set bits in rank order, sliced [start:stop]."""
+        # bin() walks the int in C; reversed so string index == rank
+        digits = bin(bits)[:1:-1]
+        pks = []
+        seen = 0
+        rank = digits.find("1")
+        while rank != -1 and (stop is None or seen < stop):
+            if seen >= start:
+                pks.append(self.pks[rank])
+            seen += 1
+            rank = digits.find("1", rank + 1)
+        return pks
+
+
+class CatalogBitmapIndex:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._snapshot: Optional[CatalogSnapshot] = None
+
+    @staticmethod
+    def _is_current(snapshot: Optional[CatalogSnapshot], generation: int) -> bool:
+        # The age check covers writes that bypass signals (QuerySet.update)
+        return (
+            snapshot is not None
+            and snapshot.generation == generation
+            and time.monotonic() - snapshot.built_at < CATALOG_CACHE_TIMEOUT
+        )
+
+    def snapshot(self) -> CatalogSnapshot:
+        """The current snapshot, rebuilt if the catalog generation has moved."""
+        generation = get_catalog_generation()
+        snapshot = self._snapshot
+        if self._is_current(snapshot, generation):
+            return snapshot
+        with self._lock:
+            snapshot = self._snapshot
+            if not self._is_current(snapshot, generation):
+                rows = Game.objects.order_by("name", "id").values_list(
+                    "pk", *INDEXED_COLUMNS, "casting_link"
+                )
+                # Tagged with the generation read before the build, so an edit
+                # landing mid-build just triggers another rebuild
+                snapshot = CatalogSnapshot(generation, rows)
+                self._snapshot = snapshot
+        return snapshot
+
+    def reset(self) -> None:
+        with self._lock:
+            self._snapshot = None
+
+    def filter(self, queryset: QuerySet, filters: Dict[str, Any]) -> "IndexedGames":
+        snapshot = self.snapshot()
+        return IndexedGames(queryset, snapshot, snapshot.match(filters))
+
+
+class IndexedGames(Sequence):
+    """
+    Lazy, Paginator-friendly result of a bitmap lookup: len() is a popcount and
+    slicing fetches just that slice from queryset, in (name, id) order.
+    """
+
+    def __init__(self, queryset: QuerySet, snapshot: CatalogSnapshot, bits: int):
+        self.queryset = queryset
+        self.snapshot = snapshot
+        self.bits = bits
+
+    def count(self) -> int:
+        return self.bits.bit_count()
+
+    def __len__(self) -> int:
+        return self.count()
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            if index.step not in (None, 1):
+                return list(self)[index]
+            start, stop, _ = index.indices(len(self))
+            return self._fetch(self.snapshot.pks_for(self.bits, start, stop))
+        items = self[index : index + 1] if index >= 0 else list(self)[index:]
+        if not items:
+            raise IndexError(index)
+        return items[0]
+
+    def __iter__(self):
+        return iter(self._fetch(self.snapshot.pks_for(self.bits)))
+
+    def _fetch(self, pks: list) -> list:
+        if not pks:
+            return []
+        objs = self.queryset.in_bulk(pks)
+        # A row deleted without a signal can be in the snapshot but not the DB
+        return [objs[pk] for pk in pks if pk in objs]
+
+
+catalog_index = CatalogBitmapIndex()
@@ -0,0 +1,68 @@
+"""
+Precomputed "card" payloads for the map side panel.
+
+Each game's card (name, url, logo, location label) is cached under its pk, so
+map_location_games only has to look cards up for the page it returns rather
+than resolving logos and locations per request. games.signals rebuilds a card
+whenever its game is saved and drops it when the game is deleted.
+"""
+
+from typing import Any, Dict, Iterable, List
+
+from django.core.cache import cache
+from django.urls import reverse
+
+from .catalog import CATALOG_CACHE_TIMEOUT
+from .models import Game
+
+# Safety net for location renames and writes that bypass signals
+CARD_CACHE_TIMEOUT = CATALOG_CACHE_TIMEOUT
+
+
+def card_cache_key(pk) -> str:
+    return f"games:card:{pk}"
+
+
+def build_card(game: Game) -> Dict[str, Any]:
+    """
+    logo_url is whatever storage returned (absolute for S3, a path for static
+    files); the view makes it absolute for the requesting host.
+    """
+    if game.logo:
+        logo_url = game.logo.url
+    else:
+        logo_url = game.get_default_logo_url()
+    return {
+        "name": game.name,
+        "slug": game.slug,
+        "url": reverse("game_detail", args=[game.slug]),
+        "logo_url": logo_url,
+        "location_display": game.location_display(),
+        "college_name": game.college_name or None,
+    }
+
+
+def store_card(game: Game) -> None:
+    cache.set(card_cache_key(game.pk), build_card(game), CARD_CACHE_TIMEOUT)
+
+
+def evict_cards(pks: Iterable) -> None:
+    keys = [card_cache_key(pk) for pk in pks]
+    if keys:
+        cache.delete_many(keys)
+
+
+def game_cards(pks: List) -> List[Dict[str, Any]]:
+    """Cards for pks, in order; misses are built in one query and cached."""
+    keys = {pk: card_cache_key(pk) for pk in pks}
+    found = cache.get_many(list(keys.values()))
+    missing = [pk for pk in pks if keys[pk] not in found]
+    if missing:
+        games = Game.objects.select_related("country", "region", "city").in_bulk(
+            missing
+        )
+        built = {keys[pk]: build_card(game) for pk, game in games.items()}
+        cache.set_many(built, CARD_CACHE_TIMEOUT)
+        found.update(built)
+    # A game deleted without a signal may still be in the bitmap snapshot
+    return [found[keys[pk]] for pk in pks if keys[pk] in found]
@@ -0,0 +1,214 @@
+"""
+Catalog generation counter and whole-response caching for catalog pages.
+
+Every edit to a Game or one of its child rows (dates, seasons, images) bumps a
+single "catalog generation" number (see games.signals). Cache keys embed the
+generation, so a bump makes every cached catalog page unreachable at once
+without having to know which pages a change affected.
+"""
+
+import hashlib
+import json
+import time
+from datetime import date, datetime, time as dt_time, timezone
+from functools import wraps
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpRequest, HttpResponse, QueryDict
+from django.utils.cache import patch_cache_control
+from django.utils.http import urlencode
+from django.views.decorators.http import condition
+
+CATALOG_GENERATION_KEY = "games:catalog_generation"
+CATALOG_MODIFIED_KEY = "games:catalog_modified"
+
+# Safety net for writes that bypass signals (e.g. QuerySet.update)
+CATALOG_CACHE_TIMEOUT = 60 * 60
+
+
+def _initial_generation() -> int:
+    # Time-based start so a counter lost to cache eviction or a restart never
+    # reuses a generation that older cache entries were stored under.
+    return time.time_ns() // 1000
+
+
+def get_catalog_generation() -> int:
+    generation = cache.get(CATALOG_GENERATION_KEY)
+    if generation is None:
+        cache.add(CATALOG_GENERATION_KEY, _initial_generation(), timeout=None)
+        generation = cache.get(CATALOG_GENERATION_KEY)
+    return generation
+
+
+def bump_catalog_generation() -> Optional[int]:
+    """Move to a new generation; returns it, or None if the counter was lost."""
+    try:
+        generation = cache.incr(CATALOG_GENERATION_KEY)
+    except ValueError:
+        cache.add(CATALOG_GENERATION_KEY, _initial_generation(), timeout=None)
+        generation = None
+    cache.set(CATALOG_MODIFIED_KEY, time.time(), timeout=None)
+    return generation
+
+
+def get_catalog_last_modified() -> datetime:
+    """When the catalog last changed (or, if unknown, when we started tracking)."""
+    modified = cache.get(CATALOG_MODIFIED_KEY)
+    if modified is None:
+        # Unknown means "now": clients revalidate once more rather than keep stale pages
+        cache.add(CATALOG_MODIFIED_KEY, time.time(), timeout=None)
+        modified = cache.get(CATALOG_MODIFIED_KEY)
+    return datetime.fromtimestamp(modified, tz=timezone.utc)
+
+
+def canonical_querystring(
+    params: QueryDict, allowed: Iterable[str], multi_valued: Iterable[str] = ()
+) -> Optional[str]:
+    """
+    Normalize a querystring so equivalent filter URLs share a cache key: keys
+    sorted, empty values dropped. Keys in multi_valued (read with getlist) keep
+    all their values, sorted; any other key keeps only its last value, the one
+    GET.get() returns, so URLs that render differently never share a key.
+    Returns None if any parameter isn't in allowed (tracking params etc.
+    aren't worth caching).
+    """
+    allowed = set(allowed)
+    multi_valued = set(multi_valued)
+    items = []
+    for key in sorted(params.keys()):
+        if key not in allowed:
+            return None
+        if key in multi_valued:
+            items.extend((key, value) for value in sorted(params.getlist(key)) if value)
+        elif params[key]:
+            items.append((key, params[key]))
+    return urlencode(items)
+
+
+def _is_cacheable_request(request: HttpRequest) -> bool:
+    # Anything carrying a session or flashed messages may render per-user output
+    return (
+        request.method in ("GET", "HEAD")
+        and settings.SESSION_COOKIE_NAME not in request.COOKIES
+        and "messages" not in request.COOKIES
+    )
+
+
+def catalog_cache_key(prefix: str, request: HttpRequest, canonical: str) -> str:
+    digest = hashlib.sha1(
+        f"{request.scheme}://{request.get_host()}{request.path}?{canonical}".encode()
+    ).hexdigest()
+    return f"games:{prefix}:{get_catalog_generation()}:{digest}"
+
+
+def cached_for_filters(prefix: str, filters: Dict[str, Any], compute: Callable) -> Any:
+    """
+    compute(), cached per filter set and catalog generation, for derived data
+    several endpoints share (counts, map aggregates).
+    """
+    digest = hashlib.sha1(
+        json.dumps(filters, sort_keys=True, default=str).encode()
+    ).hexdigest()
+    key = f"games:{prefix}:{get_catalog_generation()}:{digest}"
+    return cache.get_or_set(key, compute, CATALOG_CACHE_TIMEOUT)
+
+
+def cached_catalog_count(prefix: str, filters: Dict[str, Any], queryset) -> int:
+    """
+    COUNT(*) of queryset, cached per filter set and catalog generation so
+    cursor-paginated pages can show a total without recounting each request.
+    """
+    return cached_for_filters(prefix, filters, queryset.count)
+
+
+def cache_catalog_page(
+    prefix: str, allowed_params: Iterable[str], multi_valued: Iterable[str] = ()
+) -> Callable:
+    """
+    Cache a view's full anonymous response per canonical querystring and
+    catalog generation. multi_valued names the params the view reads with
+    getlist (see canonical_querystring).
+    """
+    allowed_params = tuple(allowed_params)
+    multi_valued = tuple(multi_valued)
+
+    def decorator(view_func):
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            if not _is_cacheable_request(request):
+                return view_func(request, *args, **kwargs)
+            canonical = canonical_querystring(request.GET, allowed_params, multi_valued)
+            if canonical is None:
+                return view_func(request, *args, **kwargs)
+
+            key = catalog_cache_key(prefix, request, canonical)
+            cached = cache.get(key)
+            if cached is not None:
+                content, content_type = cached
+                return HttpResponse(content, content_type=content_type)
+
+            response = view_func(request, *args, **kwargs)
+            if response.status_code == 200 and not response.streaming:
+                cache.set(
+                    key,
+                    (response.content, response["Content-Type"]),
+                    CATALOG_CACHE_TIMEOUT,
+                )
+            return response
+
+        return wrapper
+
+    return decorator
+
+
+def catalog_conditional(
+    view_func: Optional[Callable] = None,
+    *,
+    variant: Optional[Callable[..., str]] = None,
+    daily: bool = False,
+) -> Callable:
+    """
+    ETag/Last-Modified from the catalog generation for anonymous GETs, answering
+    If-None-Match/If-Modified-Since with a 304 before the view runs. Responses
+    are marked no-cache so browsers revalidate instead of guessing freshness.
+
+    variant(request, *args, **kwargs) names the representation when one URL
+    serves different bytes (e.g. gzip or identity) and is added to the ETag.
+    daily=True is for pages that also change at midnight (upcoming dates): the
+    date joins the ETag and Last-Modified is at least today's midnight.
+    """
+    if view_func is None:
+        return lambda func: catalog_conditional(func, variant=variant, daily=daily)
+
+    def etag(request: HttpRequest, *args, **kwargs) -> str:
+        # ETags are per URL, so the generation (plus variant) identifies it
+        parts = [f"catalog-{get_catalog_generation()}"]
+        if daily:
+            parts.append(date.today().isoformat())
+        if variant is not None and (name := variant(request, *args, **kwargs)):
+            parts.append(name)
+        return '"' + "-".join(parts) + '"'
+
+    def last_modified(request: HttpRequest, *args, **kwargs) -> datetime:
+        modified = get_catalog_last_modified()
+        if daily:
+            midnight = datetime.combine(date.today(), dt_time.min).astimezone()
+            modified = max(modified, midnight.astimezone(timezone.utc))
+        return modified
+
+    conditional_view = condition(etag_func=etag, last_modified_func=last_modified)(
+        view_func
+    )
+
+    @wraps(view_func)
+    def wrapper(request, *args, **kwargs):
+        if not _is_cacheable_request(request):
+            return view_func(request, *args, **kwargs)
+        response = conditional_view(request, *args, **kwargs)
+        if response.status_code in (200, 304):
+            patch_cache_control(response, no_cache=True)
+        return response
+
+    return wrapper
@@ -0,0 +1,61 @@
+"""
+Rendered game_detail responses, cached per slug.
+
+Unlike catalog pages (games.catalog) these entries aren't keyed by the catalog
+generation, so an edit to one game doesn't throw away every other game's page.
+Instead games.signals evicts a game's entry whenever the game or one of its
+dates, seasons or images is saved or deleted, including the old slug's entry
+when a rename changes the slug.
+"""
+
+from datetime import date
+from functools import wraps
+from typing import Callable, Iterable, Optional
+
+from django.core.cache import cache
+from django.http import HttpResponse
+
+from .catalog import CATALOG_CACHE_TIMEOUT, _is_cacheable_request
+
+# Safety net for writes that bypass signals; same as the catalog pages
+DETAIL_CACHE_TIMEOUT = CATALOG_CACHE_TIMEOUT
+
+
+def detail_cache_key(slug: str) -> str:
+    return f"games:detail:{slug}"
+
+
+def evict_game_detail(slugs: Iterable[Optional[str]]) -> None:
+    keys = {detail_cache_key(slug) for slug in slugs if slug}
+    if keys:
+        cache.delete_many(list(keys))
+
+
+def cache_game_detail(view_func: Callable) -> Callable:
+    """
+    Cache a detail view's anonymous response under its slug. One cache entry
+    holds every host variant, so evicting a slug is a single delete.
+    """
+
+    @wraps(view_func)
+    def wrapper(request, slug, *args, **kwargs):
+        if not _is_cacheable_request(request) or request.GET:
+            return view_func(request, slug, *args, **kwargs)
+
+        key = detail_cache_key(slug)
+        # The Event JSON-LD only lists upcoming dates, so each day is a new variant
+        today = date.today().isoformat()
+        variant = f"{request.scheme}://{request.get_host()}|{today}"
+        variants = cache.get(key) or {}
+        if variant in variants:
+            content, content_type = variants[variant]
+            return HttpResponse(content, content_type=content_type)
+
+        response = view_func(request, slug, *args, **kwargs)
+        if response.status_code == 200 and not response.streaming:
+            variants = {v: e for v, e in variants.items() if v.endswith(f"|{today}")}
+            variants[variant] = (response.content, response["Content-Type"])
+            cache.set(key, variants, DETAIL_CACHE_TIMEOUT)
+        return response
+
+    return wrapper
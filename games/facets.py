@@ -0,0 +1,221 @@
+"""
+Facet counts for the game_list filter sidebar.
+
+One grouped query collapses the live games into a small table: one row per
+distinct combination of filterable columns, with a game count. The table is
+cached per catalog generation and search query; every option count in every
+dropdown is then worked out from it in Python under the current filters.
+
+Counts are disjunctive: an option's count applies every filter except the
+one it belongs to, so it says how many games choosing that option would show.
+Location is hierarchical, so the country counts ignore region/city filters
+and region counts ignore city filters.
+"""
+
+import hashlib
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from django.core.cache import cache
+from django.db.models import BooleanField, Case, Count, Q, Value, When
+
+from .catalog import CATALOG_CACHE_TIMEOUT, get_catalog_generation
+from .models import Game
+from .search import get_search_backend
+
+FACET_COLUMNS = (
+    "game_format",
+    "game_duration",
+    "filming_status",
+    "country_id",
+    "region_id",
+    "city_id",
+    "active",
+    "college_game",
+    "friends_and_family",
+    "for_charity",
+    "has_casting",
+)
+
+# Tri-state filter -> (column, "exclude" predicate, "only" predicate); mirrors
+# the querysets built in views._apply_filters
+TRI_STATE_FILTERS: Dict[str, tuple] = {
+    "inactive_filter": ("active", lambda v: bool(v), lambda v: v is not None and not v),
+    "college_filter": ("college_game", lambda v: not v, lambda v: bool(v)),
+    "friends_and_family_filter": (
+        "friends_and_family",
+        lambda v: not v,
+        lambda v: bool(v),
+    ),
+    "charity_filter": ("for_charity", lambda v: not v, lambda v: bool(v)),
+    "casting_filter": ("has_casting", lambda v: not v, lambda v: bool(v)),
+}
+
+# Facet -> filter groups ignored when counting its options
+_FACET_IGNORES = {
+    "game_format": {"game_format"},
+    "game_duration": {"game_duration"},
+    "filming_status": {"filming_status"},
+    "country": {"country", "region", "city"},
+    "region": {"region", "city"},
+    "city": {"city"},
+    **{name: {name} for name in TRI_STATE_FILTERS},
+}
+
+
+@dataclass
+class FacetCounts:
+    game_formats: Dict[str, int] = field(default_factory=dict)
+    game_durations: Dict[str, int] = field(default_factory=dict)
+    filming_statuses: Dict[str, int] = field(default_factory=dict)
+    countries: Dict[int, int] = field(default_factory=dict)
+    regions: Dict[int, int] = field(default_factory=dict)
+    cities: Dict[int, int] = field(default_factory=dict)
+    # Tri-state filter -> {"all": n, "exclude": n, "only": n}
+    tri_state: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    # Locations with any live game, regardless of the other filters
+    countries_with_games: Set[int] = field(default_factory=set)
+    regions_with_games: Set[int] = field(default_factory=set)
+    cities_with_games: Set[int] = field(default_factory=set)
+
+
+def facet_table(query: str = "") -> List[Dict[str, Any]]:
+    """
+    Grouped (FACET_COLUMNS..., n) rows over all live games. With a search query
+    each row also carries ``matched``: whether those games match the query.
+    """
+    digest = hashlib.sha1(query.encode()).hexdigest()
+    key = f"games:facets:{get_catalog_generation()}:{digest}"
+    rows = cache.get(key)
+    if rows is not None:
+        return rows
+
+    games = Game.objects.annotate(
+        has_casting=Case(
+            When(Q(casting_link__isnull=True) | Q(casting_link=""), then=Value(False)),
+            default=Value(True),
+            output_field=BooleanField(),
+        )
+    )
+    columns = list(FACET_COLUMNS)
+    if query:
+        matching = get_search_backend().search(Game.objects.all(), query)
+        games = games.annotate(
+            matched=Case(
+                When(pk__in=matching.values("pk"), then=Value(True)),
+                default=Value(False),
+                output_field=BooleanField(),
+            )
+        )
+        columns.append("matched")
+    rows = list(games.values(*columns).annotate(n=Count("id")).order_by())
+    cache.set(key, rows, CATALOG_CACHE_TIMEOUT)
+    return rows
+
+
+def _in(selected: List[str]) -> Optional[Callable[[Any], bool]]:
+    if not selected:
+        return None
+    selected = set(selected)
+    return lambda value: value in selected
+
+
+def _location_predicates(filters: Dict[str, Any]) -> Dict[str, Callable]:
+    predicates = {}
+    if filters.get("country_id"):
+        country = str(filters["country_id"])
+        predicates["country"] = lambda row: str(row["country_id"]) == country
+
+    region_checks = []
+    if filters.get("no_region"):
+        region_checks.append(lambda row: row["region_id"] is None)
+    if filters.get("region_id"):
+        region = str(filters["region_id"])
+        region_checks.append(lambda row: str(row["region_id"]) == region)
+    if region_checks:
+        predicates["region"] = lambda row: all(c(row) for c in region_checks)
+
+    city_checks = []
+    if filters.get("no_city"):
+        city_checks.append(lambda row: row["city_id"] is None)
+    if filters.get("city_id"):
+        city = str(filters["city_id"])
+        city_checks.append(lambda row: str(row["city_id"]) == city)
+    if city_checks:
+        predicates["city"] = lambda row: all(c(row) for c in city_checks)
+    return predicates
+
+
+def _filter_predicates(filters: Dict[str, Any]) -> Dict[str, Callable]:
+    """Filter group -> row predicate, for each filter that is set."""
+    predicates = _location_predicates(filters)
+    for group, key in (
+        ("game_format", "game_formats"),
+        ("game_duration", "game_durations"),
+        ("filming_status", "filming_statuses"),
+    ):
+        check = _in(filters.get(key) or [])
+        if check is not None:
+            predicates[group] = lambda row, c=check, g=group: c(row[g])
+
+    for name, (column, exclude, only) in TRI_STATE_FILTERS.items():
+        mode = filters.get(name, "")
+        if mode in ("exclude", "only"):
+            check = exclude if mode == "exclude" else only
+            predicates[name] = lambda row, c=check, col=column: c(row[col])
+    return predicates
+
+
+def _bump(counts: Dict, key, n: int) -> None:
+    counts[key] = counts.get(key, 0) + n
+
+
+def facet_counts(filters: Dict[str, Any]) -> FacetCounts:
+    """Option counts for every filter dropdown under filters (see _apply_filters)."""
+    rows = facet_table(filters.get("query") or "")
+    predicates = _filter_predicates(filters)
+    selected_country = str(filters.get("country_id") or "")
+    selected_region = str(filters.get("region_id") or "")
+    result = FacetCounts(tri_state={name: {} for name in TRI_STATE_FILTERS})
+
+    for row in rows:
+        country_id, region_id, city_id = (
+            row["country_id"],
+            row["region_id"],
+            row["city_id"],
+        )
+        result.countries_with_games.add(country_id)
+        if str(country_id) == selected_country and region_id is not None:
+            result.regions_with_games.add(region_id)
+        if str(region_id) == selected_region and city_id is not None:
+            result.cities_with_games.add(city_id)
+
+        if not row.get("matched", True):
+            continue
+        failing = {group for group, check in predicates.items() if not check(row)}
+        n = row["n"]
+
+        def counts_for(facet: str) -> bool:
+            return failing <= _FACET_IGNORES[facet]
+
+        if counts_for("game_format"):
+            _bump(result.game_formats, row["game_format"], n)
+        if counts_for("game_duration"):
+            _bump(result.game_durations, row["game_duration"], n)
+        if counts_for("filming_status"):
+            _bump(result.filming_statuses, row["filming_status"], n)
+        if counts_for("country"):
+            _bump(result.countries, country_id, n)
+        if counts_for("region") and region_id is not None:
+            _bump(result.regions, region_id, n)
+        if counts_for("city") and city_id is not None:
+            _bump(result.cities, city_id, n)
+        for name, (column, exclude, only) in TRI_STATE_FILTERS.items():
+            if counts_for(name):
+                options = result.tri_state[name]
+                _bump(options, "all", n)
+                if exclude(row[column]):
+                    _bump(options, "exclude", n)
+                if only(row[column]):
+                    _bump(options, "only", n)
+    return result
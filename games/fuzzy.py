@@ -0,0 +1,151 @@
+"""
+Trigram fuzzy matching, used when an exact search finds nothing (typos).
+
+On PostgreSQL this is pg_trgm: the % operator (index-assisted by the GIN
+trigram indexes from migration 0012) ranked by similarity(). Elsewhere a
+pure-Python port of the same rules stands in: the typeahead keeps a long-lived
+TrigramIndex over game names, and fuzzy_filter builds one over at most
+FALLBACK_MAX_CANDIDATES rows that share a trigram or word start with the query,
+closest in length to it first, which is fine for the SQLite dev/test databases.
+"""
+
+import re
+from collections import defaultdict
+from typing import Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+from django.contrib.postgres.lookups import TrigramSimilar
+from django.contrib.postgres.search import TrigramSimilarity
+from django.db import connection
+from django.db.models import Case, F, FloatField, Q, QuerySet, Value, When
+from django.db.models.functions import Abs, Length
+
+# pg_trgm's default pg_trgm.similarity_threshold
+SIMILARITY_THRESHOLD = 0.3
+
+# Most rows the Python fallback will rank into a queryset
+FALLBACK_MAX_RESULTS = 100
+
+# Most rows the Python fallback loads per call to build its TrigramIndex
+FALLBACK_MAX_CANDIDATES = 2000
+
+_WORD_RE = re.compile(r"[^\W_]+", re.UNICODE)
+
+
+def trigrams(text: str) -> Set[str]:
+    """
+    Trigrams as pg_trgm computes them: lowercase alphanumeric words, each
+    padded with two leading spaces and one trailing space.
+    """
+    result = set()
+    for word in _WORD_RE.findall((text or "").lower()):
+        padded = f"  {word} "
+        result.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return result
+
+
+def similarity(a: Set[str], b: Set[str]) -> float:
+    """pg_trgm similarity(): shared trigrams over distinct trigrams."""
+    if not a or not b:
+        return 0.0
+    shared = len(a & b)
+    return shared / (len(a) + len(b) - shared)
+
+
+class TrigramIndex:
+    """Posting lists from trigram to keys, for ranking candidates by similarity."""
+
+    def __init__(self, items: Iterable[Tuple[Hashable, str]] = ()):
+        self._postings: Dict[str, Set[Hashable]] = defaultdict(set)
+        self._grams: Dict[Hashable, Set[str]] = {}
+        for key, text in items:
+            self.add(key, text)
+
+    def add(self, key: Hashable, text: str) -> None:
+        self.discard(key)
+        grams = trigrams(text)
+        self._grams[key] = grams
+        for gram in grams:
+            self._postings[gram].add(key)
+
+    def discard(self, key: Hashable) -> None:
+        for gram in self._grams.pop(key, ()):
+            keys = self._postings.get(gram)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._postings[gram]
+
+    def search(
+        self,
+        query: str,
+        limit: Optional[int] = None,
+        threshold: float = SIMILARITY_THRESHOLD,
+    ) -> List[Tuple[Hashable, float]]:
+        """Keys scoring at least threshold, best first."""
+        query_grams = trigrams(query)
+        candidates = set()
+        for gram in query_grams:
+            candidates.update(self._postings.get(gram, ()))
+        scored = [
+            (key, similarity(query_grams, self._grams[key])) for key in candidates
+        ]
+        scored = [(key, score) for key, score in scored if score >= threshold]
+        scored.sort(key=lambda pair: -pair[1])
+        return scored[:limit] if limit is not None else scored
+
+
+def _candidate_filter(field: str, query: str) -> Q:
+    """
+    Rows that can share a trigram with query: containing one of its inner
+    trigrams, or a word starting with one of its words' first two letters
+    (the padded "  a"/" ab" trigrams). Rows matching neither share at most
+    word-ending trigrams with it, too few to reach the default threshold for
+    real names.
+    """
+    condition = Q()
+    for word in _WORD_RE.findall(query.lower()):
+        condition |= Q(**{f"{field}__istartswith": word[:2]})
+        condition |= Q(**{f"{field}__icontains": f" {word[:2]}"})
+        for i in range(len(word) - 2):
+            condition |= Q(**{f"{field}__icontains": word[i : i + 3]})
+    return condition
+
+
+def fuzzy_filter(
+    queryset: QuerySet,
+    field: str,
+    query: str,
+    threshold: float = SIMILARITY_THRESHOLD,
+) -> QuerySet:
+    """
+    Restrict queryset to rows whose field is trigram-similar to query, ordered
+    by similarity (best first) and annotated with it as ``similarity``.
+    """
+    if connection.vendor == "postgresql":
+        # The % operator uses pg_trgm.similarity_threshold (0.3 by default)
+        return (
+            queryset.filter(TrigramSimilar(F(field), Value(query)))
+            .annotate(similarity=TrigramSimilarity(field, query))
+            .order_by("-similarity", field)
+        )
+
+    # Similar strings are similar in length, so those go first when capping
+    candidates = (
+        queryset.filter(_candidate_filter(field, query))
+        .order_by(Abs(Length(field) - len(query)), field, "pk")
+        .values_list("pk", field)
+    )
+    index = TrigramIndex(candidates[:FALLBACK_MAX_CANDIDATES])
+    ranked = index.search(query, limit=FALLBACK_MAX_RESULTS, threshold=threshold)
+    if not ranked:
+        return queryset.none()
+    return (
+        queryset.filter(pk__in=[pk for pk, _ in ranked])
+        .annotate(
+            similarity=Case(
+                *[When(pk=pk, then=Value(score)) for pk, score in ranked],
+                output_field=FloatField(),
+            )
+        )
+        .order_by("-similarity", field)
+    )
@@ -0,0 +1,196 @@
+"""
+Worker side of the ImageJob queue (see games.models.ImageJob).
+
+Saving a Game logo or GameImages image stores the upload untouched and queues
+a job, so the admin request doesn't wait on Pillow and S3. The
+process_image_jobs command claims jobs one at a time and optimizes the stored
+file, generates its srcset variants and placeholder, swaps them in with a single UPDATE and
+deletes the files they replace. Failed jobs are retried with a growing delay
+and given up on after MAX_ATTEMPTS, leaving the original upload in place.
+"""
+
+import logging
+import os
+from datetime import timedelta
+from typing import Optional, Tuple
+
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .cards import store_card
+from .catalog import bump_catalog_generation
+from .detail_cache import evict_game_detail
+from .models import Game, GameImages, ImageJob
+from .utils import (
+    content_fingerprint,
+    delete_image_variants,
+    image_preview,
+    optimize_image,
+    save_image_variants,
+)
+from .validators import validate_optimized_file_size
+
+logger = logging.getLogger(__name__)
+
+MAX_ATTEMPTS = 3
+RETRY_DELAY = timedelta(minutes=1)
+# A job still "running" after this long belongs to a worker that died
+STALE_AFTER = timedelta(minutes=10)
+
+# Kind -> (model, file field). The field's bookkeeping columns share its name
+# as a prefix: <field>_variants, _processing, _fingerprint, _width, _height
+# and _placeholder.
+TARGETS = {
+    ImageJob.Kind.LOGO: (Game, "logo"),
+    ImageJob.Kind.IMAGE: (GameImages, "image"),
+}
+
+
+def claim_job() -> Optional[ImageJob]:
+    """Mark the oldest runnable job as running and return it (None if idle)."""
+    now = timezone.now()
+    with transaction.atomic():
+        job = (
+            ImageJob.objects.select_for_update(skip_locked=True)
+            .filter(
+                Q(status=ImageJob.Status.PENDING, run_after__lte=now)
+                | Q(status=ImageJob.Status.RUNNING, started_at__lt=now - STALE_AFTER)
+            )
+            .order_by("run_after", "created")
+            .first()
+        )
+        if job is None:
+            return None
+        job.status = ImageJob.Status.RUNNING
+        job.started_at = now
+        job.attempts += 1
+        job.save(update_fields=["status", "started_at", "attempts", "modified"])
+    return job
+
+
+def _invalidate(kind: str, obj) -> None:
+    # The swap is a queryset update, so the model signals don't fire. These
+    # reach the web processes through the shared DatabaseCache (see CACHES).
+    bump_catalog_generation()
+    if kind == ImageJob.Kind.LOGO:
+        game = Game.objects.select_related("country", "region", "city").get(pk=obj.pk)
+        evict_game_detail([game.slug])
+        store_card(game)
+    else:
+        evict_game_detail(
+            Game.all_objects.filter(pk=obj.game_id).values_list("slug", flat=True)
+        )
+
+
+def reprocess(
+    kind: str, obj, storage=None, force: bool = False, commit: bool = True
+) -> Optional[Tuple[int, int]]:
+    """
+    Optimize the file stored on obj (a Game for LOGO, a GameImages for IMAGE)
+    under the current IMAGE_* settings and swap it in. storage overrides the
+    field's storage (e.g. a local copy of the bucket). Unless force is set, a
+    file that is already the output of an earlier run is left alone. With
+    commit=False nothing is written, deleted or invalidated; the sizes are
+    only reported.
+
+    Returns (bytes before, bytes after), or None if nothing was written.
+    Raises on failure.
+    """
+    model, field = TARGETS[kind]
+    variants_field = f"{field}_variants"
+    flag_field = f"{field}_processing"
+    fingerprint_field = f"{field}_fingerprint"
+    field_file = getattr(obj, field)
+    if not field_file:
+        if commit:
+            model.all_objects.filter(pk=obj.pk).update(**{flag_field: False})
+        return None
+    if storage is not None:
+        field_file.storage = storage
+
+    storage = field_file.storage
+    source_name = field_file.name
+    old_variants = getattr(obj, variants_field)
+    with field_file.open("rb"):
+        size_before = field_file.size
+        # Already the optimized output of an earlier job (e.g. a duplicate job)
+        if not force and content_fingerprint(field_file) == getattr(
+            obj, fingerprint_field
+        ):
+            if commit:
+                model.all_objects.filter(pk=obj.pk).update(**{flag_field: False})
+            return None
+        optimized = optimize_image(field_file)
+    validate_optimized_file_size(optimized)
+    if not commit:
+        return size_before, optimized.size
+    fingerprint = content_fingerprint(optimized)
+    field_file.save(os.path.basename(source_name), optimized, save=False)
+    variants = save_image_variants(field_file, optimized)
+    preview = image_preview(optimized)
+
+    # Only swap if nobody uploaded a newer file while we worked
+    swapped = model.all_objects.filter(pk=obj.pk, **{field: source_name}).update(
+        **{
+            field: field_file.name,
+            variants_field: variants,
+            flag_field: False,
+            fingerprint_field: fingerprint,
+            f"{field}_width": preview["width"],
+            f"{field}_height": preview["height"],
+            f"{field}_placeholder": preview["placeholder"],
+        }
+    )
+    if not swapped:
+        storage.delete(field_file.name)
+        delete_image_variants(storage, variants)
+        return None
+    storage.delete(source_name)
+    delete_image_variants(storage, old_variants)
+    _invalidate(kind, obj)
+    return size_before, optimized.size
+
+
+def process_job(job: ImageJob) -> None:
+    """Optimize and swap in the file job points at; raises on failure."""
+    model = TARGETS[job.kind][0]
+    obj = model.all_objects.filter(pk=job.object_id).first()
+    if obj is not None:
+        reprocess(job.kind, obj)
+
+
+def run_job(job: ImageJob) -> bool:
+    """Process job and record the outcome; returns whether it succeeded."""
+    try:
+        process_job(job)
+    except Exception as e:
+        logger.exception("Image job %s failed", job.pk)
+        job.error = str(e)
+        if job.attempts >= MAX_ATTEMPTS:
+            job.status = ImageJob.Status.FAILED
+            model, field = TARGETS[job.kind]
+            model.all_objects.filter(pk=job.object_id).update(
+                **{f"{field}_processing": False}
+            )
+        else:
+            job.status = ImageJob.Status.PENDING
+            job.run_after = timezone.now() + RETRY_DELAY * job.attempts
+        job.save(update_fields=["status", "error", "run_after", "modified"])
+        return False
+    job.status = ImageJob.Status.DONE
+    job.error = ""
+    job.save(update_fields=["status", "error", "modified"])
+    return True
+
+
+def process_pending(limit: Optional[int] = None) -> int:
+    """Run runnable jobs until none are left (or limit); returns how many ran."""
+    count = 0
+    while limit is None or count < limit:
+        job = claim_job()
+        if job is None:
+            break
+        run_job(job)
+        count += 1
+    return count
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from games.models import RegionCentroid
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild the RegionCentroid table from cities_light City coordinates. "
+        "Run after `manage.py cities_light` imports or updates cities."
+    )
+
+    def handle(self, *args, **options):
+        count = RegionCentroid.rebuild()
+        self.stdout.write(self.style.SUCCESS(f"Built centroids for {count} regions."))
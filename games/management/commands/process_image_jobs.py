@@ -0,0 +1,36 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from games.image_jobs import process_pending
+
+
+class Command(BaseCommand):
+    help = (
+        "Work through queued ImageJobs: optimize uploaded logos and gallery "
+        "images, generate their size variants and swap them in. Runs until "
+        "stopped unless --once is given."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Process the jobs that are runnable now, then exit.",
+        )
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=5.0,
+            help="Seconds to wait between polls when the queue is empty.",
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            count = process_pending()
+            if count:
+                self.stdout.write(f"Processed {count} image jobs.")
+            if options["once"]:
+                break
+            if not count:
+                time.sleep(options["sleep"])
@@ -0,0 +1,171 @@
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.files.storage import FileSystemStorage
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from games.image_jobs import TARGETS, reprocess
+
+
+def _format_size(size_bytes: float) -> str:
+    for unit in ["B", "KB", "MB", "GB"]:
+        if size_bytes < 1024.0:
+            return f"{size_bytes:.1f}{unit}"
+        size_bytes /= 1024.0
+    return f"{size_bytes:.1f}TB"
+
+
+class Command(BaseCommand):
+    help = (
+        "Re-optimize every stored Game logo and GameImages image under the "
+        "current IMAGE_MAX_SIZE / IMAGE_QUALITY / IMAGE_FORMAT settings, on a "
+        "bounded thread pool. Progress is checkpointed so an interrupted run "
+        "resumes where it stopped. Sources are the stored (already optimized) "
+        "files; originals aren't kept, so raising IMAGE_MAX_SIZE can't add detail."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=4,
+            help="Images processed concurrently (default 4; 1 runs inline).",
+        )
+        parser.add_argument(
+            "--checkpoint",
+            default="reprocess_media.checkpoint.json",
+            help="File recording finished images, for resuming.",
+        )
+        parser.add_argument(
+            "--restart",
+            action="store_true",
+            help="Ignore an existing checkpoint and start over.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report what would be processed and its stored size; change nothing.",
+        )
+        parser.add_argument(
+            "--local-root",
+            help=(
+                "Read media from this directory instead of MediaStorage and only "
+                "report the sizes re-optimizing would produce. Nothing is written "
+                "to disk or the database: the DB rows describe the real bucket, "
+                "so pointing them at local files would break production."
+            ),
+        )
+
+    def handle(self, *args, **options):
+        if options["workers"] < 1:
+            raise CommandError("--workers must be at least 1.")
+        storage = None
+        if options["local_root"]:
+            if not os.path.isdir(options["local_root"]):
+                raise CommandError(f"No such directory: {options['local_root']}")
+            storage = FileSystemStorage(options["local_root"])
+
+        checkpoint_path = options["checkpoint"]
+        signature = [
+            list(settings.IMAGE_MAX_SIZE),
+            settings.IMAGE_QUALITY,
+            settings.IMAGE_FORMAT,
+        ]
+        if storage is not None:
+            # A report-only run must never mark images done for a real one
+            signature.append("local-report")
+        done = set()
+        if not options["restart"] and os.path.exists(checkpoint_path):
+            with open(checkpoint_path) as f:
+                checkpoint = json.load(f)
+            # A checkpoint from a run under other settings doesn't count
+            if checkpoint.get("settings") == signature:
+                done = set(checkpoint["done"])
+
+        pending = []
+        for kind, (model, field) in TARGETS.items():
+            rows = model.objects.exclude(**{field: ""}).exclude(
+                **{f"{field}__isnull": True}
+            )
+            for obj in rows.order_by("pk").iterator():
+                key = f"{kind}:{obj.pk}"
+                if key not in done:
+                    pending.append((key, kind, obj))
+        self.stdout.write(
+            f"{len(pending)} images to process, {len(done)} already done "
+            f"(checkpoint: {checkpoint_path})."
+        )
+
+        if options["dry_run"]:
+            total = 0
+            for _, kind, obj in pending:
+                field_file = getattr(obj, TARGETS[kind][1])
+                if storage is not None:
+                    field_file.storage = storage
+                total += field_file.size
+            self.stdout.write(f"Dry run: {_format_size(total)} would be re-optimized.")
+            return
+
+        def run(item):
+            key, kind, obj = item
+            try:
+                sizes = reprocess(
+                    kind, obj, storage=storage, force=True, commit=storage is None
+                )
+                return key, sizes, None
+            except Exception as e:
+                return key, None, e
+            finally:
+                if options["workers"] > 1:
+                    connection.close()
+
+        def save_checkpoint():
+            tmp_path = f"{checkpoint_path}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump({"settings": signature, "done": sorted(done)}, f)
+            os.replace(tmp_path, checkpoint_path)
+
+        started = time.monotonic()
+        before_total = after_total = processed = failed = 0
+        batch_size = options["workers"] * 4
+        with ThreadPoolExecutor(max_workers=options["workers"]) as pool:
+            for start in range(0, len(pending), batch_size):
+                batch = pending[start : start + batch_size]
+                if options["workers"] == 1:
+                    results = map(run, batch)
+                else:
+                    results = pool.map(run, batch)
+                for key, sizes, error in results:
+                    if error is not None:
+                        failed += 1
+                        self.stderr.write(f"  ✗ {key}: {error}")
+                        continue
+                    done.add(key)
+                    if sizes is not None:
+                        processed += 1
+                        before_total += sizes[0]
+                        after_total += sizes[1]
+                save_checkpoint()
+                self.stdout.write(
+                    f"  {min(start + batch_size, len(pending))}/{len(pending)} "
+                    f"({time.monotonic() - started:.0f}s)"
+                )
+
+        elapsed = time.monotonic() - started
+        verb = "Re-optimized" if storage is None else "Local copy: would re-optimize"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{verb} {processed} images in {elapsed:.1f}s: "
+                f"{_format_size(before_total)} → {_format_size(after_total)}; "
+                f"{failed} failed."
+            )
+        )
+        if failed:
+            self.stdout.write("Run again to retry the failed images.")
+        elif os.path.exists(checkpoint_path):
+            # Finished: the next run should start from scratch
+            os.remove(checkpoint_path)
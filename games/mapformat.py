@@ -0,0 +1,90 @@
+"""
+Compact columnar encoding of map_data (``?format=compact``).
+
+Each level becomes an object of parallel arrays instead of an array of
+objects, so keys aren't repeated per bucket. Location ids are plain integers.
+Parents are referenced by index into the parent level's arrays (-1 if absent).
+Coordinates are rounded to COORD_PRECISION decimals, about 100m, which is
+finer than a bubble at city zoom:
+
+    {"v": 1,
+     "countries":    {"id", "name", "code2", "count", "lat", "lng"},
+     "regions":      {"id", "name", "country", "count", "lat", "lng"},
+     "cities":       {"id", "name", "region", "count", "lat", "lng"},
+     "country_only": {"country", "count"},   # at the country's position
+     "region_only":  {"region", "count"}}    # at the region's position
+
+The "(no state/region)" / "(no city)" labels are left to the client.
+"""
+
+import gzip
+from typing import Any, Dict, List, Tuple
+
+import orjson
+
+COMPACT_FORMAT_VERSION = 1
+COORD_PRECISION = 3
+
+
+def _columns(rows: List[Dict[str, Any]], spec: Dict[str, Any]) -> Dict[str, list]:
+    return {name: [get(row) for row in rows] for name, get in spec.items()}
+
+
+def compact_map_levels(levels: Dict[str, list]) -> Dict[str, Any]:
+    country_index = {c["id"]: i for i, c in enumerate(levels["countries"])}
+    region_index = {r["id"]: i for i, r in enumerate(levels["regions"])}
+
+    def coord(key):
+        return lambda row: round(row[key], COORD_PRECISION)
+
+    located = {"count": lambda r: r["count"], "lat": coord("lat"), "lng": coord("lng")}
+    return {
+        "v": COMPACT_FORMAT_VERSION,
+        "countries": _columns(
+            levels["countries"],
+            {
+                "id": lambda r: int(r["id"]),
+                "name": lambda r: r["name"],
+                "code2": lambda r: r["code2"],
+                **located,
+            },
+        ),
+        "regions": _columns(
+            levels["regions"],
+            {
+                "id": lambda r: int(r["id"]),
+                "name": lambda r: r["name"],
+                "country": lambda r: country_index.get(r["country_id"], -1),
+                **located,
+            },
+        ),
+        "cities": _columns(
+            levels["cities"],
+            {
+                "id": lambda r: int(r["id"]),
+                "name": lambda r: r["name"],
+                "region": lambda r: region_index.get(r["region_id"], -1),
+                **located,
+            },
+        ),
+        "country_only": _columns(
+            levels["country_only"],
+            {
+                "country": lambda r: country_index.get(r["country_id"], -1),
+                "count": lambda r: r["count"],
+            },
+        ),
+        "region_only": _columns(
+            levels["region_only"],
+            {
+                "region": lambda r: region_index.get(r["region_id"], -1),
+                "count": lambda r: r["count"],
+            },
+        ),
+    }
+
+
+def encode_compact(levels: Dict[str, list]) -> Tuple[bytes, bytes]:
+    """(JSON body, gzip-compressed body) for the compact format."""
+    body = orjson.dumps(compact_map_levels(levels))
+    return body, gzip.compress(body, compresslevel=9, mtime=0)
@@ -0,0 +1,99 @@
+"""
+Server-side clustering of map bubbles into web-mercator (z/x/y) tiles.
+
+game_map.js asks for the tiles covering its viewport instead of downloading
+every country/region/city bucket. Each tile holds only the bubbles for the
+level shown at that zoom (same breakpoints as the JS), merged on a pixel grid
+so bubbles that would overlap on screen arrive as one cluster.
+"""
+
+import math
+from typing import Any, Dict, List, Tuple
+
+TILE_SIZE = 256
+
+# Bubbles closer than this many pixels (same grid cell) are merged
+CLUSTER_CELL_PX = 64
+
+MAX_ZOOM = 20
+
+# Mirrors getLevel() in game_map.js
+ZOOM_COUNTRY = 4
+ZOOM_REGION = 6
+
+
+def is_valid_tile(z: int, x: int, y: int) -> bool:
+    return 0 <= z <= MAX_ZOOM and 0 <= x < 2**z and 0 <= y < 2**z
+
+
+def _pixel(lat: float, lng: float, z: int) -> Tuple[float, float]:
+    """World pixel coordinates of lat/lng at zoom z (spherical mercator)."""
+    scale = TILE_SIZE * 2**z
+    lat = max(min(lat, 85.0511), -85.0511)
+    sin_lat = math.sin(math.radians(lat))
+    px = (lng + 180.0) / 360.0 * scale
+    py = (0.5 - math.log((1 + sin_lat) / (1 - sin_lat)) / (4 * math.pi)) * scale
+    return px, py
+
+
+def _item(bucket: Dict[str, Any], id_key: str, item_type: str) -> Dict[str, Any]:
+    return {
+        "id": bucket[id_key],
+        "name": bucket["name"],
+        "count": bucket["count"],
+        "lat": bucket["lat"],
+        "lng": bucket["lng"],
+        "type": item_type,
+    }
+
+
+def tile_items(levels: Dict[str, list], z: int) -> List[Dict[str, Any]]:
+    """The bubbles (as game_map.js items) shown at zoom z, before clustering."""
+    if z < ZOOM_COUNTRY:
+        return [_item(c, "id", "country") for c in levels["countries"]]
+    items = [_item(o, "country_id", "country_only") for o in levels["country_only"]]
+    if z < ZOOM_REGION:
+        items.extend(_item(r, "id", "region") for r in levels["regions"])
+    else:
+        items.extend(_item(c, "id", "city") for c in levels["cities"])
+        items.extend(
+            _item(o, "region_id", "region_only") for o in levels["region_only"]
+        )
+    return items
+
+
+def cluster_tile(
+    items: List[Dict[str, Any]], z: int, x: int, y: int
+) -> List[Dict[str, Any]]:
+    """
+    Items falling inside tile (z, x, y), merged per CLUSTER_CELL_PX grid cell.
+    A cell holding one item keeps it as-is; otherwise it becomes a "cluster"
+    item at the count-weighted centre, which the map zooms into on click.
+    """
+    left, top = x * TILE_SIZE, y * TILE_SIZE
+    cells: Dict[Tuple[int, int], List[Dict[str, Any]]] = {}
+    for item in items:
+        px, py = _pixel(item["lat"], item["lng"], z)
+        if not (left <= px < left + TILE_SIZE and top <= py < top + TILE_SIZE):
+            continue
+        cell = (int((px - left) // CLUSTER_CELL_PX), int((py - top) // CLUSTER_CELL_PX))
+        cells.setdefault(cell, []).append(item)
+
+    clustered = []
+    for members in cells.values():
+        if len(members) == 1:
+            clustered.append(members[0])
+            continue
+        total = sum(m["count"] for m in members)
+        clustered.append(
+            {
+                "id": None,
+                "name": f"{len(members)} locations",
+                "count": total,
+                "lat": sum(m["lat"] * m["count"] for m in members) / total,
+                "lng": sum(m["lng"] * m["count"] for m in members) / total,
+                "type": "cluster",
+            }
+        )
+    clustered.sort(key=lambda item: -item["count"])
+    return clustered
@@ -0,0 +1,63 @@
+# Full-text search index for games (see games/search.py)
+
+from django.db import OperationalError, migrations
+
+POSTGRES_VECTOR = (
+    "setweight(to_tsvector('simple', coalesce(name, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(college_name, '')), 'B') || "
+    "setweight(to_tsvector('simple', coalesce(host, '')), 'C') || "
+    "setweight(to_tsvector('simple', coalesce(description, '')), 'D')"
+)
+
+
+def create_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "postgresql":
+        schema_editor.execute(
+            "ALTER TABLE games_game ADD COLUMN IF NOT EXISTS search_vector tsvector"
+        )
+        schema_editor.execute(
+            f"UPDATE games_game SET search_vector = {POSTGRES_VECTOR}"
+        )
+        schema_editor.execute(
+            "CREATE INDEX IF NOT EXISTS games_game_search_vector_gin "
+            "ON games_game USING gin (search_vector)"
+        )
+    elif vendor == "sqlite":
+        # FTS5 is compiled into the stock Python sqlite3 module; if it's missing
+        # the search backend falls back to icontains.
+        try:
+            schema_editor.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS games_game_fts USING fts5("
+                "game_id UNINDEXED, name, college_name, host, description, "
+                "prefix='2 3', tokenize='unicode61 remove_diacritics 2')"
+            )
+        except OperationalError:
+            return
+        schema_editor.execute(
+            "INSERT INTO games_game_fts (game_id, name, college_name, host, description) "
+            "SELECT id, coalesce(name, ''), coalesce(college_name, ''), "
+            "coalesce(host, ''), coalesce(description, '') FROM games_game"
+        )
+
+
+def drop_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "postgresql":
+        schema_editor.execute("DROP INDEX IF EXISTS games_game_search_vector_gin")
+        schema_editor.execute(
+            "ALTER TABLE games_game DROP COLUMN IF EXISTS search_vector"
+        )
+    elif vendor == "sqlite":
+        schema_editor.execute("DROP TABLE IF EXISTS games_game_fts")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("games", "0010_alter_game_options_alter_gamedate_options_and_more"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,40 @@
+# pg_trgm GIN indexes backing fuzzy name matching (see games/fuzzy.py)
+
+from django.db import migrations
+
+TRIGRAM_INDEXES = [
+    ("games_game_name_trgm", "games_game"),
+    ("cities_light_country_name_trgm", "cities_light_country"),
+    ("cities_light_region_name_trgm", "cities_light_region"),
+    ("cities_light_city_name_trgm", "cities_light_city"),
+]
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for index_name, table in TRIGRAM_INDEXES:
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS {index_name} "
+            f"ON {table} USING gin (name gin_trgm_ops)"
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for index_name, _ in TRIGRAM_INDEXES:
+        schema_editor.execute(f"DROP INDEX IF EXISTS {index_name}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("cities_light", "0011_alter_city_country_alter_city_region_and_more"),
+        ("games", "0011_game_search_index"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
@@ -0,0 +1,57 @@
+# Generated by Django 5.1.15 on 2026-10-17 18:54
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Avg
+
+
+def populate_region_centroids(apps, schema_editor):
+    # Existing databases already have cities_light loaded, so fill the table now
+    City = apps.get_model("cities_light", "City")
+    RegionCentroid = apps.get_model("games", "RegionCentroid")
+    rows = (
+        City.objects.filter(
+            region_id__isnull=False, latitude__isnull=False, longitude__isnull=False
+        )
+        .values("region_id")
+        .annotate(lat=Avg("latitude"), lng=Avg("longitude"))
+        .order_by()
+    )
+    RegionCentroid.objects.bulk_create(
+        [
+            RegionCentroid(
+                region_id=row["region_id"], latitude=row["lat"], longitude=row["lng"]
+            )
+            for row in rows
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("cities_light", "0011_alter_city_country_alter_city_region_and_more"),
+        ("games", "0012_trigram_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RegionCentroid",
+            fields=[
+                (
+                    "region",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="centroid",
+                        serialize=False,
+                        to="cities_light.region",
+                    ),
+                ),
+                ("latitude", models.FloatField()),
+                ("longitude", models.FloatField()),
+            ],
+        ),
+        migrations.RunPython(populate_region_centroids, migrations.RunPython.noop),
+    ]
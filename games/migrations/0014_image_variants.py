@@ -0,0 +1,23 @@
+# Generated by Django 5.1.15 on 2026-10-17 19:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("games", "0013_region_centroid"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="game",
+            name="logo_variants",
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+        migrations.AddField(
+            model_name="gameimages",
+            name="image_variants",
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.1.15 on 2026-10-17 19:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("games", "0015_image_jobs"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="game",
+            name="logo_fingerprint",
+            field=models.CharField(blank=True, editable=False, max_length=64),
+        ),
+        migrations.AddField(
+            model_name="gameimages",
+            name="image_fingerprint",
+            field=models.CharField(blank=True, editable=False, max_length=64),
+        ),
+    ]
@@ -1,19 +1,21 @@
+from typing import Any, Dict, Optional
+
 from django.core.validators import MaxValueValidator, MinValueValidator
-from django.db import models
+from django.db import models, transaction
 from django.forms import ValidationError
+from django.utils import timezone
 from django.utils.text import slugify
 from django.utils.translation import gettext_lazy as _
 from cities_light.models import Country, Region, City
+from model_utils import FieldTracker
+from model_utils.models import TimeStampedModel
 from io import BytesIO
 from django.core.files.base import ContentFile
 from PIL import Image
 
 from lrgnetwork.storage_backends import MediaStorage
-from .validators import (
-    validate_image,
-    validate_optimized_file_size,
-)
-from .utils import optimize_image
+from .validators import validate_image
+from .utils import delete_image_variants, variant_srcset
 
 from core.models import CoreModel
 
@@ -27,6 +29,16 @@ class Game(CoreModel):
         blank=True,
         null=True,
     )
+    # Smaller copies of logo for srcset (see utils.save_image_variants)
+    logo_variants = models.JSONField(default=dict, blank=True, editable=False)
+    # True while an ImageJob for the logo is pending
+    logo_processing = models.BooleanField(default=False, editable=False)
+    # sha256 of the stored optimized logo; blank until the worker has run
+    logo_fingerprint = models.CharField(max_length=64, blank=True, editable=False)
+    # Intrinsic size and inline placeholder of the stored logo (utils.image_preview)
+    logo_width = models.PositiveIntegerField(null=True, blank=True, editable=False)
+    logo_height = models.PositiveIntegerField(null=True, blank=True, editable=False)
+    logo_placeholder = models.TextField(blank=True, editable=False)
     slug = models.SlugField(blank=True, db_index=True)
 
     class GameFormat(models.TextChoices):
@@ -116,6 +128,9 @@ class Game(CoreModel):
     casting_link = models.URLField(blank=True, null=True)
     description = models.TextField(blank=True, null=True)
 
+    # Lets signal handlers evict the cached detail page under a renamed game's old slug
+    tracker = FieldTracker(fields=["slug"])
+
     class Meta:
         verbose_name = "Game"
         verbose_name_plural = "Games"
@@ -131,7 +146,7 @@ class Game(CoreModel):
     def __str__(self):
         return f"{self.name}"
 
-    def save(self, *args, **kwargs):
+    def _assign_slug(self):
         """
         Generate a unique slug by finding the next available number suffix.
         More efficient than looping - uses a single query to find all existing slugs.
@@ -147,7 +162,6 @@ class Game(CoreModel):
                 existing = Game.objects.get(pk=self.pk)
                 if existing.name == self.name and existing.slug:
                     # Name unchanged, keep existing slug
-                    super().save(*args, **kwargs)
                     return
             except Game.DoesNotExist:
                 pass
@@ -191,20 +205,29 @@ class Game(CoreModel):
             else:
                 self.slug = f"{base_slug}-{counter}"
 
-        if self.logo:
-            try:
-                optimized = optimize_image(self.logo)
-                validate_optimized_file_size(optimized)
-                self.logo.save(self.logo.name, optimized, save=False)
-            except ValidationError:
-                # Re-raise validation errors as-is (they already have good messages)
-                raise
-            except Exception as e:
-                raise ValidationError(
-                    f"Unexpected error processing logo for {self.name}: {str(e)}"
-                ) from e
-
-        super().save(*args, **kwargs)
+    def save(self, *args, **kwargs):
+        """
+        Assign the slug, then queue a newly uploaded logo for optimization;
+        the upload is stored as-is and the process_image_jobs worker replaces it.
+        """
+        self._assign_slug()
+
+        # A file already in storage (any ordinary edit) was processed when uploaded
+        queue_logo = bool(self.logo) and not self.logo._committed
+        if queue_logo:
+            self.logo_processing = True
+        elif not self.logo and self.logo_variants:
+            delete_image_variants(self.logo.storage, self.logo_variants)
+            self.logo_variants = {}
+            self.logo_fingerprint = ""
+            self.logo_processing = False
+            self.logo_width = self.logo_height = None
+            self.logo_placeholder = ""
+
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            if queue_logo:
+                ImageJob.enqueue(ImageJob.Kind.LOGO, self.pk)
 
     def location_display(self) -> str:
         """
@@ -236,18 +259,35 @@ class Game(CoreModel):
         parts = [city_name, region_part, country_part]
         return ", ".join(part for part in parts if part)
 
+    @property
+    def logo_srcset(self) -> str:
+        if not self.logo or not self.logo_variants:
+            return ""
+        return variant_srcset(self.logo.storage, self.logo_variants)
+
+    @property
+    def logo_preview(self) -> Optional[Dict[str, Any]]:
+        """Size and placeholder for the logo, or the default logo if there is none."""
+        if not self.logo:
+            from .static_index import default_logo_preview
+
+            return default_logo_preview(self.game_format)
+        if not self.logo_placeholder:
+            return None
+        return {
+            "width": self.logo_width,
+            "height": self.logo_height,
+            "placeholder": self.logo_placeholder,
+        }
+
     def get_default_logo_url(self):
         """
         Get the URL for the default logo based on game format.
         Returns None if no default logo exists.
         """
-        from django.contrib.staticfiles import finders
-        from django.contrib.staticfiles.storage import staticfiles_storage
+        from .static_index import default_logo_url
 
-        logo_path = f"games/images/default_logos/{self.game_format.lower()}.png"
-        if finders.find(logo_path):
-            return staticfiles_storage.url(logo_path)
-        return None
+        return default_logo_url(self.game_format)
 
 
 class GameDate(CoreModel):
@@ -290,6 +330,16 @@ class GameImages(CoreModel):
     image = models.ImageField(
         upload_to="game_images/", storage=MediaStorage, validators=[validate_image]
     )
+    # Smaller copies of image for srcset (see utils.save_image_variants)
+    image_variants = models.JSONField(default=dict, blank=True, editable=False)
+    # True while an ImageJob for the image is pending
+    image_processing = models.BooleanField(default=False, editable=False)
+    # sha256 of the stored optimized image; blank until the worker has run
+    image_fingerprint = models.CharField(max_length=64, blank=True, editable=False)
+    # Intrinsic size and inline placeholder of the stored image (utils.image_preview)
+    image_width = models.PositiveIntegerField(null=True, blank=True, editable=False)
+    image_height = models.PositiveIntegerField(null=True, blank=True, editable=False)
+    image_placeholder = models.TextField(blank=True, editable=False)
     description = models.CharField(max_length=200, blank=True, null=True)
 
     def __str__(self):
@@ -297,24 +347,33 @@ class GameImages(CoreModel):
 
     def save(self, *args, **kwargs):
         """
-        Override save to optimize and validate images before saving.
-        Automatically optimizes image size, format, and quality.
+        Queue a newly uploaded image for optimization; the upload is stored
+        as-is and the process_image_jobs worker replaces it.
         """
-        if self.image:
-            try:
-                optimized = optimize_image(self.image)
-                validate_optimized_file_size(optimized)
-                self.image.save(self.image.name, optimized, save=False)
-            except ValidationError:
-                # Re-raise validation errors as-is (they already have good messages)
-                raise
-            except Exception as e:
-                game_name = self.game.name if self.game else "unknown game"
-                raise ValidationError(
-                    f"Unexpected error processing image for {game_name}: {str(e)}"
-                ) from e
-
-        super().save(*args, **kwargs)
+        queue_image = bool(self.image) and not self.image._committed
+        if queue_image:
+            self.image_processing = True
+
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            if queue_image:
+                ImageJob.enqueue(ImageJob.Kind.IMAGE, self.pk)
+
+    @property
+    def srcset(self) -> str:
+        if not self.image or not self.image_variants:
+            return ""
+        return variant_srcset(self.image.storage, self.image_variants)
+
+    @property
+    def preview(self) -> Optional[Dict[str, Any]]:
+        if not self.image or not self.image_placeholder:
+            return None
+        return {
+            "width": self.image_width,
+            "height": self.image_height,
+            "placeholder": self.image_placeholder,
+        }
 
     class Meta:
         verbose_name = "Game Image"
@@ -337,3 +396,86 @@ class Season(CoreModel):
         verbose_name = "Season"
         verbose_name_plural = "Seasons"
         ordering = ["game", "number"]
+
+
+class RegionCentroid(models.Model):
+    """
+    Mean coordinates of each region's cities, used to place region markers on
+    the map. Derived from cities_light data; rebuilt by the
+    build_region_centroids command after `manage.py cities_light`.
+    """
+
+    region = models.OneToOneField(
+        Region, on_delete=models.CASCADE, primary_key=True, related_name="centroid"
+    )
+    latitude = models.FloatField()
+    longitude = models.FloatField()
+
+    def __str__(self):
+        return f"{self.region} ({self.latitude:.4f}, {self.longitude:.4f})"
+
+    @classmethod
+    def rebuild(cls) -> int:
+        """Replace every row from the City table; returns the number of regions."""
+        rows = (
+            City.objects.filter(
+                region_id__isnull=False,
+                latitude__isnull=False,
+                longitude__isnull=False,
+            )
+            .values("region_id")
+            .annotate(lat=models.Avg("latitude"), lng=models.Avg("longitude"))
+            .order_by()
+        )
+        centroids = [
+            cls(region_id=row["region_id"], latitude=row["lat"], longitude=row["lng"])
+            for row in rows
+        ]
+        with transaction.atomic():
+            cls.objects.all().delete()
+            cls.objects.bulk_create(centroids, batch_size=1000)
+        return len(centroids)
+
+
+class ImageJob(TimeStampedModel):
+    """
+    Database-backed queue of uploaded images waiting to be optimized, resized
+    into variants and swapped in. Saving a Game logo or GameImages image adds a
+    job; the process_image_jobs command (games/image_jobs.py) works through them.
+    """
+
+    class Kind(models.TextChoices):
+        LOGO = "logo", _("Game logo")
+        IMAGE = "image", _("Game image")
+
+    class Status(models.TextChoices):
+        PENDING = "pending", _("Pending")
+        RUNNING = "running", _("Running")
+        DONE = "done", _("Done")
+        FAILED = "failed", _("Failed")
+
+    kind = models.CharField(max_length=10, choices=Kind.choices)
+    # pk of the Game (logo) or GameImages (image) row
+    object_id = models.UUIDField()
+    status = models.CharField(
+        max_length=10, choices=Status.choices, default=Status.PENDING
+    )
+    attempts = models.PositiveSmallIntegerField(default=0)
+    run_after = models.DateTimeField(default=timezone.now)
+    started_at = models.DateTimeField(null=True, blank=True)
+    error = models.TextField(blank=True)
+
+    def __str__(self):
+        return f"{self.get_kind_display()} {self.object_id} ({self.status})"
+
+    @classmethod
+    def enqueue(cls, kind: str, object_id) -> "ImageJob":
+        """Queue object_id for processing unless a pending job already covers it."""
+        job, _ = cls.objects.get_or_create(
+            kind=kind, object_id=object_id, status=cls.Status.PENDING
+        )
+        return job
+
+    class Meta:
+        ordering = ["created"]
+        indexes = [models.Index(fields=["status", "run_after"])]
@@ -0,0 +1,94 @@
+"""
+Keyset (cursor) pagination for the game directory.
+
+Pages are ordered by (name, id) and fetched with a WHERE on the last/first row
+seen instead of OFFSET, and without a COUNT(*), so page 500 costs the same as
+page 1. Cursors are opaque base64 tokens; a bad token just yields the first page.
+"""
+
+import base64
+import binascii
+import json
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, List, Optional, Tuple
+
+from django.db.models import Q, QuerySet
+
+NEXT = "n"
+PREVIOUS = "p"
+
+
+def encode_cursor(direction: str, obj: Any) -> str:
+    raw = json.dumps([direction, obj.name, str(obj.pk)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: Optional[str]) -> Optional[Tuple[str, str, str]]:
+    if not token:
+        return None
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        direction, name, pk = json.loads(base64.urlsafe_b64decode(padded))
+    except (binascii.Error, ValueError, TypeError):
+        return None
+    if direction not in (NEXT, PREVIOUS) or not all(
+        isinstance(v, str) for v in (name, pk)
+    ):
+        return None
+    try:
+        uuid.UUID(pk)
+    except ValueError:
+        return None
+    return direction, name, pk
+
+
+@dataclass
+class KeysetPage:
+    object_list: List[Any]
+    has_next: bool
+    has_previous: bool
+    # Cached, possibly slightly stale total for display ("About N games")
+    approximate_total: Optional[int] = None
+    next_cursor: Optional[str] = field(init=False, default=None)
+    previous_cursor: Optional[str] = field(init=False, default=None)
+
+    def __post_init__(self):
+        if self.has_next and self.object_list:
+            self.next_cursor = encode_cursor(NEXT, self.object_list[-1])
+        if self.has_previous and self.object_list:
+            self.previous_cursor = encode_cursor(PREVIOUS, self.object_list[0])
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+
+def keyset_paginate(
+    queryset: QuerySet, cursor: Optional[str], per_page: int
+) -> KeysetPage:
+    """Return the page of queryset (ordered by name, id) after/before cursor."""
+    decoded = decode_cursor(cursor)
+    if decoded is None:
+        rows = list(queryset.order_by("name", "id")[: per_page + 1])
+        return KeysetPage(rows[:per_page], len(rows) > per_page, False)
+
+    direction, name, pk = decoded
+    if direction == NEXT:
+        rows = list(
+            queryset.filter(Q(name__gt=name) | Q(name=name, id__gt=pk)).order_by(
+                "name", "id"
+            )[: per_page + 1]
+        )
+        return KeysetPage(rows[:per_page], len(rows) > per_page, True)
+
+    rows = list(
+        queryset.filter(Q(name__lt=name) | Q(name=name, id__lt=pk)).order_by(
+            "-name", "-id"
+        )[: per_page + 1]
+    )
+    page = rows[:per_page]
+    page.reverse()
+    return KeysetPage(page, True, len(rows) > per_page)
@@ -0,0 +1,175 @@
+"""
+Full-text search backends for the game directory.
+
+The backend is picked from the database vendor unless GAME_SEARCH_BACKEND
+names one explicitly:
+- PostgreSQL: weighted tsvector column on games_game with a GIN index
+- SQLite: FTS5 virtual table mirroring the searchable columns (dev/tests)
+- anything else: the original icontains scan
+
+Queries match every word as a prefix, so "surv bos" finds "Survivor Boston".
+The index is kept in sync from Game post_save/post_delete (see games.signals).
+"""
+
+import re
+from functools import lru_cache
+from typing import List
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import BooleanField, FloatField, Q, QuerySet, Value
+from django.db.models.expressions import RawSQL
+from django.utils.module_loading import import_string
+
+# Columns indexed for search, highest weight first
+SEARCH_FIELDS = ("name", "college_name", "host", "description")
+
+# Cap on words taken from a query so a pasted paragraph can't build a huge query
+MAX_QUERY_TOKENS = 8
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def tokenize(query: str) -> List[str]:
+    """Split a user query into lowercase word tokens."""
+    return _TOKEN_RE.findall((query or "").lower())[:MAX_QUERY_TOKENS]
+
+
+class BaseSearchBackend:
+    def search(self, queryset: QuerySet, query: str) -> QuerySet:
+        """
+        Restrict a Game queryset to matches for query and annotate each row
+        with search_rank (higher is more relevant). Ordering is left to the caller.
+        """
+        raise NotImplementedError
+
+    def update(self, game) -> None:
+        """Refresh the index entry for a saved game."""
+
+    def remove(self, game_pk) -> None:
+        """Drop the index entry for a deleted game."""
+
+
+class IContainsSearchBackend(BaseSearchBackend):
+    """Unindexed fallback: case-insensitive substring match on SEARCH_FIELDS."""
+
+    def search(self, queryset: QuerySet, query: str) -> QuerySet:
+        query = (query or "").strip()
+        if not query:
+            return queryset.none()
+        match = Q()
+        for field in SEARCH_FIELDS:
+            match |= Q(**{f"{field}__icontains": query})
+        return queryset.filter(match).annotate(
+            search_rank=Value(1.0, output_field=FloatField())
+        )
+
+
+class PostgresSearchBackend(BaseSearchBackend):
+    """
+    Weighted tsvector (name A, college_name B, host C, description D) stored in
+    games_game.search_vector and matched through its GIN index.
+
+    The column is deliberately not a model field so list queries don't drag the
+    vector along with every row.
+    """
+
+    config = "simple"
+
+    def search(self, queryset: QuerySet, query: str) -> QuerySet:
+        tokens = tokenize(query)
+        if not tokens:
+            return queryset.none()
+        tsquery = " & ".join(f"{token}:*" for token in tokens)
+        match = RawSQL(
+            '"games_game"."search_vector" @@ to_tsquery(%s::regconfig, %s)',
+            (self.config, tsquery),
+            output_field=BooleanField(),
+        )
+        rank = RawSQL(
+            'ts_rank("games_game"."search_vector", to_tsquery(%s::regconfig, %s))',
+            (self.config, tsquery),
+            output_field=FloatField(),
+        )
+        return queryset.filter(match).annotate(search_rank=rank)
+
+    def update(self, game) -> None:
+        weighted = " || ".join(
+            f"setweight(to_tsvector(%s::regconfig, coalesce({field}, '')), '{weight}')"
+            for field, weight in zip(SEARCH_FIELDS, "ABCD")
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"UPDATE games_game SET search_vector = {weighted} WHERE id = %s",
+                [self.config] * len(SEARCH_FIELDS) + [game.pk],
+            )
+
+
+class SQLiteFTSSearchBackend(BaseSearchBackend):
+    """
+    FTS5 stand-in for local development and tests. Rows live in the
+    games_game_fts virtual table keyed by the game's hex UUID (SQLite's
+    storage format for UUIDField) and are ranked with weighted bm25.
+    """
+
+    table = "games_game_fts"
+    # bm25 weights in column order: game_id (unindexed), then SEARCH_FIELDS
+    weights = (0.0, 10.0, 5.0, 2.0, 1.0)
+
+    def _match_expression(self, query: str) -> str:
+        return " ".join(f'"{token}"*' for token in tokenize(query))
+
+    def search(self, queryset: QuerySet, query: str) -> QuerySet:
+        match = self._match_expression(query)
+        if not match:
+            return queryset.none()
+        weights = ", ".join(str(w) for w in self.weights)
+        matching_ids = RawSQL(
+            f"SELECT game_id FROM {self.table} WHERE {self.table} MATCH %s", (match,)
+        )
+        # bm25 is lower-is-better; negate so search_rank sorts like the other backends
+        rank = RawSQL(
+            f"SELECT -bm25({self.table}, {weights}) FROM {self.table} "
+            f'WHERE {self.table} MATCH %s AND game_id = "games_game"."id"',
+            (match,),
+            output_field=FloatField(),
+        )
+        return queryset.filter(pk__in=matching_ids).annotate(search_rank=rank)
+
+    def update(self, game) -> None:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"DELETE FROM {self.table} WHERE game_id = %s", [game.pk.hex]
+            )
+            cursor.execute(
+                f"INSERT INTO {self.table} (game_id, {', '.join(SEARCH_FIELDS)}) "
+                f"VALUES (%s, %s, %s, %s, %s)",
+                [game.pk.hex] + [getattr(game, f) or "" for f in SEARCH_FIELDS],
+            )
+
+    def remove(self, game_pk) -> None:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"DELETE FROM {self.table} WHERE game_id = %s", [game_pk.hex]
+            )
+
+
+@lru_cache(maxsize=None)
+def _backend_for(vendor: str, backend_path: str) -> BaseSearchBackend:
+    if backend_path:
+        return import_string(backend_path)()
+    if vendor == "postgresql":
+        return PostgresSearchBackend()
+    if (
+        vendor == "sqlite"
+        and SQLiteFTSSearchBackend.table in connection.introspection.table_names()
+    ):
+        return SQLiteFTSSearchBackend()
+    return IContainsSearchBackend()
+
+
+def get_search_backend() -> BaseSearchBackend:
+    """Return the configured search backend for the default database."""
+    return _backend_for(
+        connection.vendor, getattr(settings, "GAME_SEARCH_BACKEND", None) or ""
+    )
@@ -0,0 +1,80 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .cards import evict_cards, store_card
+from .catalog import bump_catalog_generation
+from .detail_cache import evict_game_detail
+from .models import Game, GameDate, GameImages, Season
+from .search import get_search_backend
+from .typeahead import typeahead_index
+
+
+@receiver(post_save, sender=Game)
+def update_game_search_index(sender, instance, raw=False, **kwargs):
+    """Keep the full-text index in step with the saved row (skipped for fixture loads)."""
+    if raw:
+        return
+    get_search_backend().update(instance)
+
+
+@receiver(post_delete, sender=Game)
+def remove_game_search_index(sender, instance, **kwargs):
+    get_search_backend().remove(instance.pk)
+
+
+@receiver(post_save, sender=Game)
+def update_typeahead_index(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    typeahead_index.update(instance)
+
+
+@receiver(post_delete, sender=Game)
+def remove_typeahead_index(sender, instance, **kwargs):
+    typeahead_index.remove(instance.pk)
+
+
+@receiver([post_save, post_delete], sender=Game)
+@receiver([post_save, post_delete], sender=GameDate)
+@receiver([post_save, post_delete], sender=Season)
+@receiver([post_save, post_delete], sender=GameImages)
+def bump_catalog_on_change(sender, **kwargs):
+    """
+    Any catalog edit invalidates every generation-keyed cache entry. The
+    typeahead index has already applied this change (Game rows via the
+    receivers above; child rows aren't in its payloads), so it moves with us
+    instead of rebuilding.
+    """
+    generation = bump_catalog_generation()
+    if generation is not None:
+        typeahead_index.advance(generation)
+
+
+@receiver([post_save, post_delete], sender=Game)
+def evict_game_detail_cache(sender, instance, **kwargs):
+    evict_game_detail([instance.slug, instance.tracker.previous("slug")])
+
+
+@receiver(post_save, sender=Game)
+def rebuild_game_card(sender, instance, raw=False, **kwargs):
+    """Refresh the map side panel card so map_location_games never builds it."""
+    if raw:
+        return
+    store_card(instance)
+
+
+@receiver(post_delete, sender=Game)
+def evict_game_card(sender, instance, **kwargs):
+    evict_cards([instance.pk])
+
+
+@receiver([post_save, post_delete], sender=GameDate)
+@receiver([post_save, post_delete], sender=Season)
+@receiver([post_save, post_delete], sender=GameImages)
+def evict_parent_game_detail_cache(sender, instance, **kwargs):
+    slug = (
+        Game.all_objects.filter(pk=instance.game_id)
+        .values_list("slug", flat=True)
+        .first()
+    )
+    evict_game_detail([slug])
@@ -1,5 +1,5 @@
 // Game list page JavaScript
-// Handles filter toggling, form submission, and filter count badge
+// Handles filter toggling, form submission (in-place fragment swaps), and filter count badge
 
 (function() {
     'use strict';
@@ -153,9 +153,98 @@
 
             const queryString = params.toString();
             const action = form.getAttribute('action') || window.location.pathname;
-            window.location.href = `${action}?${queryString}`;
+            const pageUrl = `${action}?${queryString}`;
+
+            // List view: swap the results and facet counts in place; the map view
+            // (and any fetch failure) still does a full page load
+            if (params.get('view') === 'map' || !form.dataset.fragmentUrl || !window.fetch) {
+                window.location.href = pageUrl;
+                return;
+            }
+            loadFragment(queryString, pageUrl);
+        }
+
+        function loadFragment(queryString, pageUrl) {
+            fetch(`${form.dataset.fragmentUrl}?${queryString}`, { headers: { 'Accept': 'application/json' } })
+                .then(function(response) {
+                    if (!response.ok) throw new Error(response.statusText);
+                    return response.json();
+                })
+                .then(function(data) {
+                    const section = document.getElementById('games-list-section');
+                    if (!section) throw new Error('games-list-section missing');
+                    section.outerHTML = data.html;
+                    applyFacets(data.facets);
+                    window.history.pushState({ fragment: true }, '', pageUrl);
+                    updateFilterCountBadge();
+                    updateViewLinks();
+                })
+                .catch(function() {
+                    window.location.href = pageUrl;
+                });
+        }
+
+        // Facet counts show as Bootstrap Select subtext next to each option
+        function setOptionCounts(select, counts) {
+            Array.from(select.options).forEach(function(option) {
+                const key = option.value === '' ? 'all' : option.value;
+                if (option.value === '' && !('all' in counts)) return;
+                option.dataset.subtext = counts[key] || 0;
+            });
         }
 
+        function replaceLocationOptions(select, items) {
+            const selected = select.value;
+            Array.from(select.options).forEach(function(option) {
+                if (option.value !== '') option.remove();
+            });
+            items.forEach(function(item) {
+                const option = new Option(item.name, item.id, false, item.id === selected);
+                if (item.enabled) {
+                    option.dataset.subtext = item.count;
+                } else {
+                    option.disabled = true;
+                }
+                select.add(option);
+            });
+        }
+
+        function applyFacets(facets) {
+            if (!facets) return;
+            Object.keys(facets).forEach(function(id) {
+                const select = document.getElementById(id);
+                if (!select) return;
+                if (Array.isArray(facets[id])) {
+                    replaceLocationOptions(select, facets[id]);
+                } else {
+                    setOptionCounts(select, facets[id]);
+                }
+            });
+            const country = document.getElementById('country');
+            const region = document.getElementById('region');
+            const city = document.getElementById('city');
+            if (region) region.disabled = !(country && country.value);
+            if (city) city.disabled = !(region && region.value);
+            if (typeof $ !== 'undefined' && $.fn.selectpicker) {
+                $('.selectpicker').selectpicker('refresh');
+            }
+        }
+
+        // Pagination inside the swapped section also loads in place
+        document.addEventListener('click', function(event) {
+            const link = event.target.closest('#games-list-section .pagination a.page-link');
+            if (!link || !form.dataset.fragmentUrl || !window.fetch) return;
+            event.preventDefault();
+            const url = new URL(link.href, window.location.href);
+            loadFragment(url.searchParams.toString(), url.pathname + url.search);
+            window.scrollTo({ top: 0, behavior: 'smooth' });
+        });
+
+        // Fragment loads push history entries; going back re-renders that URL
+        window.addEventListener('popstate', function() {
+            window.location.reload();
+        });
+
         // Expose function to global scope for inline onchange handlers
         window.submitFormWithNonEmptyParams = submitFormWithNonEmptyParams;
 
@@ -1,6 +1,7 @@
 /**
  * Games map view: Leaflet map with location bubbles and side panel.
- * Expects #games-map with data-map-data-url and data-map-location-games-url.
+ * Expects #games-map with data-map-tile-url and data-map-location-games-url.
+ * Bubbles come pre-clustered per z/x/y tile from the server (games.maptiles).
  */
 (function () {
   "use strict";
@@ -8,7 +9,11 @@
   const mapEl = document.getElementById("games-map");
   if (!mapEl || typeof L === "undefined") return;
 
-  const mapDataUrl = mapEl.dataset.mapDataUrl || "";
+  // "/games/map/tiles/0/0/0/" -> "/games/map/tiles/{z}/{x}/{y}/"
+  const tileUrlTemplate = (mapEl.dataset.mapTileUrl || "").replace(
+    /0\/0\/0\/$/,
+    "{z}/{x}/{y}/"
+  );
   const mapLocationGamesUrl = mapEl.dataset.mapLocationGamesUrl || "";
 
   function currentQueryString() {
@@ -20,6 +25,7 @@
   const BUBBLE_MIN_R = 12;
   const BUBBLE_MAX_R = 28;
   const BUBBLE_SCALE = 3;
+  const TILE_SIZE = 256;
 
   const map = L.map("games-map", {
     minZoom: 2,
@@ -37,13 +43,8 @@
     }
   ).addTo(map);
 
-  let data = {
-    countries: [],
-    regions: [],
-    cities: [],
-    country_only: [],
-    region_only: [],
-  };
+  // Tile URL -> items, for this page view (tiles are also cached server-side)
+  const tileCache = {};
   const markersLayer = L.layerGroup().addTo(map);
 
   function radiusFromCount(count) {
@@ -52,6 +53,7 @@
   }
 
   function bubbleColorClass(item) {
+    if (item.type === "cluster") return "map-bubble--cluster";
     if (item.type === "country" || item.type === "country_only")
       return "map-bubble--country";
     if (item.type === "region" || item.type === "region_only")
@@ -65,119 +67,59 @@
     return "city";
   }
 
-  function inBounds(lat, lng, bounds) {
-    if (!bounds) return true;
-    return (
-      lat >= bounds.getSouth() &&
-      lat <= bounds.getNorth() &&
-      lng >= bounds.getWest() &&
-      lng <= bounds.getEast()
-    );
+  function updateCaption(level) {
+    const captionEl = document.getElementById("map-zoom-caption");
+    if (!captionEl) return;
+    if (level === "country")
+      captionEl.textContent =
+        "Showing countries. Zoom in for regions and cities.";
+    else if (level === "region")
+      captionEl.textContent = "Showing regions and states. Zoom in for cities.";
+    else captionEl.textContent = "Showing cities.";
   }
 
-  function buildItems() {
-    const zoom = map.getZoom();
-    const level = getLevel(zoom);
-    const bounds = map.getBounds();
-    const captionEl = document.getElementById("map-zoom-caption");
-    if (captionEl) {
-      if (level === "country")
-        captionEl.textContent =
-          "Showing countries. Zoom in for regions and cities.";
-      else if (level === "region")
-        captionEl.textContent =
-          "Showing regions and states. Zoom in for cities.";
-      else captionEl.textContent = "Showing cities.";
+  function visibleTileUrls(zoom) {
+    const bounds = map.getPixelBounds();
+    const max = Math.pow(2, zoom) - 1;
+    const clamp = function (v) {
+      return Math.max(0, Math.min(max, v));
+    };
+    const x0 = clamp(Math.floor(bounds.min.x / TILE_SIZE));
+    const x1 = clamp(Math.floor(bounds.max.x / TILE_SIZE));
+    const y0 = clamp(Math.floor(bounds.min.y / TILE_SIZE));
+    const y1 = clamp(Math.floor(bounds.max.y / TILE_SIZE));
+    const qs = currentQueryString();
+    const urls = [];
+    for (let x = x0; x <= x1; x++) {
+      for (let y = y0; y <= y1; y++) {
+        urls.push(
+          tileUrlTemplate
+            .replace("{z}", zoom)
+            .replace("{x}", x)
+            .replace("{y}", y) + (qs ? "?" + qs : "")
+        );
+      }
     }
-    let items = [];
-    if (level === "country") {
-      items = data.countries.map(function (c) {
-        return {
-          id: c.id,
-          name: c.name,
-          count: c.count,
-          lat: c.lat,
-          lng: c.lng,
-          type: "country",
-        };
+    return urls;
+  }
+
+  function fetchTile(url) {
+    if (tileCache[url]) return Promise.resolve(tileCache[url]);
+    return fetch(url)
+      .then(function (res) {
+        return res.json();
+      })
+      .then(function (json) {
+        tileCache[url] = json.items || [];
+        return tileCache[url];
       });
-    } else if (level === "region") {
-      items = data.regions
-        .filter(function (r) {
-          return inBounds(r.lat, r.lng, bounds);
-        })
-        .map(function (r) {
-          return {
-            id: r.id,
-            name: r.name,
-            count: r.count,
-            lat: r.lat,
-            lng: r.lng,
-            type: "region",
-          };
-        });
-      data.country_only
-        .filter(function (o) {
-          return inBounds(o.lat, o.lng, bounds);
-        })
-        .forEach(function (o) {
-          items.push({
-            id: o.country_id,
-            name: o.name,
-            count: o.count,
-            lat: o.lat,
-            lng: o.lng,
-            type: "country_only",
-          });
-        });
-    } else {
-      items = data.cities
-        .filter(function (c) {
-          return inBounds(c.lat, c.lng, bounds);
-        })
-        .map(function (c) {
-          return {
-            id: c.id,
-            name: c.name,
-            count: c.count,
-            lat: c.lat,
-            lng: c.lng,
-            type: "city",
-          };
-        });
-      data.country_only
-        .filter(function (o) {
-          return inBounds(o.lat, o.lng, bounds);
-        })
-        .forEach(function (o) {
-          items.push({
-            id: o.country_id,
-            name: o.name,
-            count: o.count,
-            lat: o.lat,
-            lng: o.lng,
-            type: "country_only",
-          });
-        });
-      data.region_only
-        .filter(function (o) {
-          return inBounds(o.lat, o.lng, bounds);
-        })
-        .forEach(function (o) {
-          items.push({
-            id: o.region_id,
-            name: o.name,
-            count: o.count,
-            lat: o.lat,
-            lng: o.lng,
-            type: "region_only",
-          });
-        });
-    }
-    return items;
   }
 
   function openLocationPanelForItem(item) {
+    if (item.type === "cluster") {
+      map.setView([item.lat, item.lng], Math.min(map.getZoom() + 2, 20));
+      return;
+    }
     const params = new URLSearchParams(window.location.search);
     if (item.type === "country_only") {
       params.set("country", item.id);
@@ -226,8 +168,21 @@
   }
 
   function updateBubbles() {
+    const zoom = map.getZoom();
+    updateCaption(getLevel(zoom));
+    Promise.all(visibleTileUrls(zoom).map(fetchTile))
+      .then(function (tiles) {
+        // A newer zoom has already started rendering
+        if (zoom !== map.getZoom()) return;
+        renderBubbles([].concat.apply([], tiles));
+      })
+      .catch(function () {
+        console.error("Failed to load map tiles");
+      });
+  }
+
+  function renderBubbles(items) {
     markersLayer.clearLayers();
-    const items = buildItems();
     items.forEach(function (item) {
       const r = radiusFromCount(item.count);
       const colorClass = bubbleColorClass(item);
@@ -278,6 +233,65 @@
     panelBackdrop.setAttribute("aria-hidden", "true");
   }
 
+  function gameCardHtml(g) {
+    const logoHtml = g.logo_url
+      ? '<img src="' + escapeAttr(g.logo_url) + '" alt="">'
+      : '<span class="map-panel-game-card-no-logo"></span>';
+    const meta = [];
+    if (g.college_name) meta.push(escapeHtml(g.college_name));
+    if (g.location_display) meta.push(escapeHtml(g.location_display));
+    const metaHtml =
+      meta.length > 0
+        ? "<p class=\"map-panel-game-card-meta\">" + meta.join(" · ") + "</p>"
+        : "";
+    return (
+      "<li><a href=\"" +
+      escapeAttr(g.url) +
+      "\"><div class=\"map-panel-game-card\"><div class=\"map-panel-game-card-logo\">" +
+      logoHtml +
+      "</div><div class=\"map-panel-game-card-body\"><h5 class=\"map-panel-game-card-title\">" +
+      escapeHtml(g.name) +
+      "</h5>" +
+      metaHtml +
+      "</div></div></a></li>"
+    );
+  }
+
+  function withCursor(url, cursor) {
+    const sep = url.indexOf("?") === -1 ? "?" : "&";
+    return url + sep + "cursor=" + encodeURIComponent(cursor);
+  }
+
+  // Appends one page of cards, plus a "Load more" button if there are more
+  function appendGamesPage(url, payload) {
+    panelList.insertAdjacentHTML(
+      "beforeend",
+      payload.games.map(gameCardHtml).join("")
+    );
+    if (!payload.next_cursor) return;
+    const moreItem = document.createElement("li");
+    const moreBtn = document.createElement("button");
+    moreBtn.type = "button";
+    moreBtn.className = "btn btn-outline-primary btn-sm w-100";
+    moreBtn.textContent = "Load more";
+    moreBtn.addEventListener("click", function () {
+      moreBtn.disabled = true;
+      fetch(withCursor(url, payload.next_cursor))
+        .then(function (res) {
+          return res.json();
+        })
+        .then(function (next) {
+          moreItem.remove();
+          appendGamesPage(url, next);
+        })
+        .catch(function () {
+          moreBtn.disabled = false;
+        });
+    });
+    moreItem.appendChild(moreBtn);
+    panelList.appendChild(moreItem);
+  }
+
   function openLocationPanel(url, fallbackTitle) {
     panelEl.classList.add("is-open");
     panelBackdrop.classList.add("is-visible");
@@ -298,40 +312,9 @@
           payload.location_label || fallbackTitle || "Games";
         if (payload.games && payload.games.length > 0) {
           panelCount.textContent =
-            payload.games.length === 1
-              ? "1 game"
-              : payload.games.length + " games";
+            payload.total === 1 ? "1 game" : payload.total + " games";
           panelList.style.display = "block";
-          panelList.innerHTML = payload.games
-            .map(function (g) {
-              const logoHtml = g.logo_url
-                ? '<img src="' +
-                  escapeAttr(g.logo_url) +
-                  '" alt="">'
-                : '<span class="map-panel-game-card-no-logo"></span>';
-              const meta = [];
-              if (g.college_name) meta.push(escapeHtml(g.college_name));
-              if (g.location_display)
-                meta.push(escapeHtml(g.location_display));
-              const metaHtml =
-                meta.length > 0
-                  ? "<p class=\"map-panel-game-card-meta\">" +
-                    meta.join(" · ") +
-                    "</p>"
-                  : "";
-              return (
-                "<li><a href=\"" +
-                escapeAttr(g.url) +
-                "\"><div class=\"map-panel-game-card\"><div class=\"map-panel-game-card-logo\">" +
-                logoHtml +
-                "</div><div class=\"map-panel-game-card-body\"><h5 class=\"map-panel-game-card-title\">" +
-                escapeHtml(g.name) +
-                "</h5>" +
-                metaHtml +
-                "</div></div></a></li>"
-              );
-            })
-            .join("");
+          appendGamesPage(url, payload);
         } else {
           panelCount.textContent = "";
           panelEmpty.style.display = "block";
@@ -348,16 +331,5 @@
   if (panelCloseBtn) panelCloseBtn.addEventListener("click", closePanel);
   if (panelBackdrop) panelBackdrop.addEventListener("click", closePanel);
 
-  const qs = currentQueryString();
-  fetch(mapDataUrl + (qs ? "?" + qs : ""))
-    .then(function (res) {
-      return res.json();
-    })
-    .then(function (json) {
-      data = json;
-      updateBubbles();
-    })
-    .catch(function () {
-      console.error("Failed to load map data");
-    });
+  updateBubbles();
 })();
@@ -0,0 +1,89 @@
+"""
+In-memory index of the static files this deployment can serve.
+
+finders.find() walks every STATICFILES_FINDERS location on disk on each call.
+Instead the set of known paths is built once per process: from the
+collectstatic manifest when the storage has one (production), otherwise by
+listing every finder once (development, tests). Default-logo URLs and
+placeholders are resolved once per GameFormat on top of it.
+"""
+
+import threading
+from typing import Any, Dict, FrozenSet, Optional
+
+from django.contrib.staticfiles import finders
+from django.contrib.staticfiles.storage import staticfiles_storage
+
+DEFAULT_LOGO_PATH = "games/images/default_logos/{}.png"
+
+_lock = threading.Lock()
+_paths: Optional[FrozenSet[str]] = None
+_default_logo_urls: Optional[Dict[str, Optional[str]]] = None
+_default_logo_previews: Dict[str, Optional[Dict[str, Any]]] = {}
+
+
+def _collect_paths() -> FrozenSet[str]:
+    manifest = getattr(staticfiles_storage, "hashed_files", None)
+    if manifest:
+        return frozenset(manifest)
+    paths = set()
+    for finder in finders.get_finders():
+        for path, storage in finder.list([]):
+            prefix = getattr(storage, "prefix", None)
+            paths.add(f"{prefix}/{path}" if prefix else path)
+    return frozenset(path.replace("\\", "/") for path in paths)
+
+
+def static_paths() -> FrozenSet[str]:
+    global _paths
+    if _paths is None:
+        with _lock:
+            if _paths is None:
+                _paths = _collect_paths()
+    return _paths
+
+
+def static_url_if_exists(path: str) -> Optional[str]:
+    """staticfiles_storage.url(path) if path is a known static file, else None."""
+    if path not in static_paths():
+        return None
+    return staticfiles_storage.url(path)
+
+
+def default_logo_url(game_format: str) -> Optional[str]:
+    global _default_logo_urls
+    if _default_logo_urls is None:
+        from .models import Game
+
+        _default_logo_urls = {
+            value: static_url_if_exists(DEFAULT_LOGO_PATH.format(value.lower()))
+            for value in Game.GameFormat.values
+        }
+    if game_format in _default_logo_urls:
+        return _default_logo_urls[game_format]
+    return static_url_if_exists(DEFAULT_LOGO_PATH.format(game_format.lower()))
+
+
+def default_logo_preview(game_format: str) -> Optional[Dict[str, Any]]:
+    """Size and inline placeholder of a default logo, worked out once per format."""
+    if game_format not in _default_logo_previews:
+        from .utils import image_preview
+
+        preview = None
+        path = DEFAULT_LOGO_PATH.format(game_format.lower())
+        # One disk lookup per format per process
+        source = finders.find(path) if path in static_paths() else None
+        if source:
+            with open(source, "rb") as f:
+                preview = image_preview(f)
+        _default_logo_previews[game_format] = preview
+    return _default_logo_previews[game_format]
+
+
+def reset() -> None:
+    """Forget the index, e.g. after collectstatic in the same process."""
+    global _paths, _default_logo_urls
+    with _lock:
+        _paths = None
+        _default_logo_urls = None
+        _default_logo_previews.clear()
@@ -0,0 +1,35 @@
+from django import template
+from django.utils.html import format_html
+
+from games.transforms import DEFAULT_FORMAT, transform_url
+
+register = template.Library()
+
+
+@register.simple_tag
+def lqip_attrs(preview):
+    """
+    Extra <img> attributes from a logo/image preview: intrinsic width/height so
+    the layout is reserved up front, and the inline placeholder as a background
+    until the real file loads. Blank if there is no preview.
+    """
+    if not preview:
+        return ""
+    return format_html(
+        ' width="{}" height="{}" style="background: url(\'{}\') center / cover no-repeat"'
+        " onload=\"this.style.background=''\"",
+        preview["width"],
+        preview["height"],
+        preview["placeholder"],
+    )
+
+
+@register.simple_tag
+def resized_url(field_file, width, format=DEFAULT_FORMAT, quality=None):
+    """
+    Signed URL of field_file resized to width on demand, for layouts that need
+    a size the stored variants don't cover. Blank if there is no file.
+    """
+    if not field_file:
+        return ""
+    return transform_url(field_file.name, int(width), format, quality)
@@ -1,6 +1,6 @@
 from django import template
-from django.contrib.staticfiles import finders
-from django.contrib.staticfiles.storage import staticfiles_storage
+
+from games.static_index import static_url_if_exists
 
 register = template.Library()
 
@@ -8,6 +8,4 @@ register = template.Library()
 @register.filter
 def safe_static(path):
     """Return static URL if exists, otherwise blank (avoids manifest errors)."""
-    if finders.find(path):
-        return staticfiles_storage.url(path)
-    return ""
+    return static_url_if_exists(path) or ""
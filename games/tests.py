@@ -1,11 +1,72 @@
-from datetime import date
+import base64
+from contextlib import contextmanager
+from datetime import date, timedelta
+import gzip
+from io import BytesIO, StringIO
+import json
+import math
+import os
+import subprocess
+import sys
+import tempfile
+from types import SimpleNamespace
+from unittest import mock
+
+from cities_light.models import City, Country, Region
+from django.conf import settings
+from django.contrib.admin.sites import site
+from django.contrib.auth import get_user_model
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.cache import cache, caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage
+from django.core.management import call_command
+from django.db import connection
 from django.forms import ValidationError
-from django.test import TestCase
+from django.test import RequestFactory, TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
-from .models import Game, GameDate, Season
+from PIL import Image
+
+from .admin import GameAdmin, GameImagesInline, ImageProcessingFailedFilter
+from .bitmap import catalog_index
+from .cards import card_cache_key
+from .catalog import (
+    CATALOG_GENERATION_KEY,
+    bump_catalog_generation,
+    get_catalog_generation,
+)
+from .facets import facet_counts
 from .form import GameAdminForm
-from django.contrib.auth import get_user_model
-from cities_light.models import Country, Region, City
+from .fuzzy import _candidate_filter, fuzzy_filter, similarity, trigrams
+from .image_jobs import MAX_ATTEMPTS, process_pending
+from .models import Game, GameDate, GameImages, ImageJob, RegionCentroid, Season
+from .search import IContainsSearchBackend
+from .static_index import default_logo_preview, static_paths
+from .templatetags.safe_static import safe_static
+from .transforms import cache_path, open_variant, transform_url, trim_cache
+from .typeahead import typeahead_index
+from .utils import optimize_image, save_image_variants
+from .views import _apply_filters
+
+
+@contextmanager
+def assert_num_data_queries(test, num):
+    """
+    assertNumQueries, not counting the DatabaseCache's own queries (its table
+    and the savepoints its writes open): a cache hit is still a query, but
+    none of the ORM work it replaces.
+    """
+    cache_table = settings.CACHES["default"]["LOCATION"]
+    with CaptureQueriesContext(connection) as context:
+        yield
+    queries = [
+        q["sql"]
+        for q in context.captured_queries
+        if cache_table not in q["sql"] and "SAVEPOINT" not in q["sql"]
+    ]
+    test.assertEqual(len(queries), num, "\n".join(queries))
 
 
 class CoreModelFieldsTest(TestCase):
@@ -274,6 +335,47 @@ class GameListViewTest(TestCase):
             len(response.context["page_obj"]), 0
         )  # Ensure second page has games
 
+    def test_cursor_pagination_walks_forward_and_back(self):
+        for i in range(20):
+            Game.objects.create(
+                name=f"Game {i + 3:02d}",
+                game_format=Game.GameFormat.AMAZING_RACE,
+                active=True,
+                country=self.country,
+            )
+        url = reverse("game_list") + "?paginate=cursor"
+
+        pages = []
+        response = self.client.get(url)
+        while True:
+            page_obj = response.context["page_obj"]
+            self.assertEqual(page_obj.approximate_total, 22)
+            pages.append([game.name for game in page_obj])
+            if not page_obj.has_next:
+                break
+            response = self.client.get(f"{url}&cursor={page_obj.next_cursor}")
+
+        self.assertEqual([len(p) for p in pages], [12, 10])
+        names = [name for page in pages for name in page]
+        self.assertEqual(names, sorted(names))
+        self.assertEqual(len(set(names)), 22)
+
+        previous = page_obj.previous_cursor
+        response = self.client.get(f"{url}&cursor={previous}")
+        self.assertEqual([g.name for g in response.context["page_obj"]], pages[0])
+        self.assertFalse(response.context["page_obj"].has_previous)
+
+    def test_cursor_pagination_ignores_bad_cursor(self):
+        bad_pk = base64.urlsafe_b64encode(b'["n","A","not-a-uuid"]').decode()
+        for cursor in ["not-a-cursor", bad_pk]:
+            response = self.client.get(
+                reverse("game_list"), {"paginate": "cursor", "cursor": cursor}
+            )
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(
+                [g.name for g in response.context["page_obj"]], ["Game 1", "Game 2"]
+            )
+
     def test_filters_work_and_persist_across_pages(self):
         # Create games with different formats and active/inactive status
         for i in range(15):
@@ -466,6 +568,46 @@ class GameMapDataViewTest(TestCase):
         self.assertIn("lat", country_entries[0])
         self.assertIn("lng", country_entries[0])
 
+    def test_map_data_rolls_up_every_level_in_one_query(self):
+        region = Region.objects.create(name="Massachusetts", country=self.country)
+        city = City.objects.create(
+            name="Boston",
+            region=region,
+            country=self.country,
+            latitude=42.36,
+            longitude=-71.06,
+        )
+        for name, game_region, game_city in [
+            ("Region Only Game", region, None),
+            ("City Game 1", region, city),
+            ("City Game 2", region, city),
+        ]:
+            Game.objects.create(
+                name=name,
+                game_format=Game.GameFormat.SURVIVOR,
+                country=self.country,
+                region=game_region,
+                city=game_city,
+            )
+        cache.set("games:map_region_coords", {region.id: [42.0, -71.0]}, None)
+
+        with assert_num_data_queries(self, 1):
+            data = self.client.get(reverse("game_map_data")).json()
+
+        self.assertEqual([c["count"] for c in data["countries"]], [4])
+        self.assertEqual(
+            [(r["name"], r["count"], r["lat"]) for r in data["regions"]],
+            [("Massachusetts", 3, 42.0)],
+        )
+        self.assertEqual(
+            [(c["name"], c["count"]) for c in data["cities"]], [("Boston", 2)]
+        )
+        self.assertEqual([c["count"] for c in data["country_only"]], [1])
+        self.assertEqual(
+            [(r["name"], r["count"]) for r in data["region_only"]],
+            [("Massachusetts (no city)", 1)],
+        )
+
     def test_map_data_excludes_removed_games(self):
         self.game.delete()
         self.assertTrue(self.game.is_removed)
@@ -476,3 +618,1043 @@ class GameMapDataViewTest(TestCase):
             c for c in data["countries"] if c["id"] == str(self.country.id)
         ]
         self.assertEqual(len(country_entries), 0)
+
+    def test_map_data_compact_format(self):
+        region = Region.objects.create(name="Massachusetts", country=self.country)
+        Game.objects.create(
+            name="Region Game",
+            game_format=Game.GameFormat.SURVIVOR,
+            country=self.country,
+            region=region,
+        )
+        url = reverse("game_map_data") + "?format=compact"
+
+        response = self.client.get(url)
+        self.assertNotIn("Content-Encoding", response)
+        self.assertIn("Accept-Encoding", response["Vary"])
+        data = json.loads(response.content)
+        self.assertEqual(data["countries"]["id"], [self.country.id])
+        self.assertEqual(data["countries"]["count"], [2])
+        self.assertEqual(data["regions"]["country"], [0])
+        self.assertEqual(data["country_only"], {"country": [0], "count": [1]})
+
+        gzipped = self.client.get(url, HTTP_ACCEPT_ENCODING="gzip, br")
+        self.assertEqual(gzipped["Content-Encoding"], "gzip")
+        self.assertEqual(json.loads(gzip.decompress(gzipped.content)), data)
+
+
+class GameSearchTest(TestCase):
+    def setUp(self):
+        self.country = Country.objects.create(name="United States", code2="US")
+        self.survivor = Game.objects.create(
+            name="Survivor Boston",
+            game_format=Game.GameFormat.SURVIVOR,
+            active=True,
+            country=self.country,
+        )
+        self.college = Game.objects.create(
+            name="Island Games",
+            game_format=Game.GameFormat.SURVIVOR,
+            active=True,
+            country=self.country,
+            college_name="Boston University",
+        )
+        self.described = Game.objects.create(
+            name="Mole Hunt",
+            game_format=Game.GameFormat.THE_MOLE,
+            active=True,
+            country=self.country,
+            description="A survivor-style mole game.",
+        )
+
+    def search_names(self, query):
+        response = self.client.get(reverse("game_search"), {"q": query})
+        self.assertEqual(response.status_code, 200)
+        return [g["name"] for g in response.json()["games"]]
+
+    def test_prefix_match_on_every_word(self):
+        self.assertEqual(self.search_names("surv bos"), ["Survivor Boston"])
+
+    def test_name_matches_rank_above_description_matches(self):
+        self.assertEqual(
+            self.search_names("survivor"), ["Survivor Boston", "Mole Hunt"]
+        )
+
+    def test_warm_index_still_merges_description_matches(self):
+        cold = self.search_names("survivor")
+        typeahead_index.build()
+        try:
+            self.assertEqual(self.search_names("survivor"), cold)
+        finally:
+            typeahead_index.reset()
+
+    def test_searches_college_name(self):
+        self.assertEqual(
+            self.search_names("boston"), ["Survivor Boston", "Island Games"]
+        )
+
+    def test_icontains_backend_searches_every_field(self):
+        self.survivor.host = "Jane Doe"
+        self.survivor.save()
+        backend = IContainsSearchBackend()
+        self.assertEqual(
+            list(backend.search(Game.objects.all(), "univers")), [self.college]
+        )
+        self.assertEqual(
+            list(backend.search(Game.objects.all(), "doe")), [self.survivor]
+        )
+
+    def test_index_follows_rename_and_removal(self):
+        self.survivor.name = "Traitors Castle"
+        self.survivor.save()
+        self.assertEqual(self.search_names("castle"), ["Traitors Castle"])
+        self.assertEqual(self.search_names("survivor"), ["Mole Hunt"])
+
+        self.survivor.delete()
+        self.assertEqual(self.search_names("castle"), [])
+
+    def test_game_list_query_uses_search_index(self):
+        response = self.client.get(reverse("game_list"), {"q": "univ"})
+        self.assertEqual(list(response.context["page_obj"]), [self.college])
+
+
+class TypeaheadIndexTest(TestCase):
+    def setUp(self):
+        self.country = Country.objects.create(name="United States", code2="US")
+        for i in range(10):
+            Game.objects.create(
+                name=f"Survivor {i}",
+                game_format=Game.GameFormat.SURVIVOR,
+                active=True,
+                country=self.country,
+            )
+        self.game = Game.objects.create(
+            name="Big Brother Chicago",
+            game_format=Game.GameFormat.BIG_BROTHER,
+            active=True,
+            country=self.country,
+            host="Jane Doe",
+        )
+        typeahead_index.build()
+
+    def tearDown(self):
+        typeahead_index.reset()
+
+    def test_full_page_answered_without_queries(self):
+        with assert_num_data_queries(self, 0):
+            response = self.client.get(reverse("game_search"), {"q": "surv"})
+        games = response.json()["games"]
+        self.assertEqual(len(games), 8)
+        self.assertEqual(games[0]["name"], "Survivor 0")
+        self.assertTrue(games[0]["logo_url"].startswith("http://testserver/"))
+
+    def test_matches_every_word_across_indexed_fields(self):
+        names = [r["name"] for r in typeahead_index.search("big jan", 8)]
+        self.assertEqual(names, ["Big Brother Chicago"])
+
+    def test_signals_keep_index_current(self):
+        self.game.name = "Traitors Chicago"
+        self.game.save()
+        self.assertEqual(typeahead_index.search("big", 8), [])
+        self.assertEqual(
+            [r["name"] for r in typeahead_index.search("trait", 8)],
+            ["Traitors Chicago"],
+        )
+        self.game.delete()
+        self.assertEqual(typeahead_index.search("trait", 8), [])
+
+    def test_own_edits_do_not_rebuild(self):
+        built_at = typeahead_index._built_at
+        GameDate.objects.create(game=self.game, start_date=date(2025, 1, 1))
+        self.game.name = "Traitors Chicago"
+        self.game.save()
+        with assert_num_data_queries(self, 0):
+            names = [r["name"] for r in typeahead_index.search("trait", 8)]
+        self.assertEqual(names, ["Traitors Chicago"])
+        self.assertEqual(typeahead_index._built_at, built_at)
+
+    def test_rebuilt_after_bulk_admin_delete(self):
+        GameAdmin(Game, site).delete_queryset(
+            None, Game.objects.filter(pk=self.game.pk)
+        )
+        response = self.client.get(reverse("game_search"), {"q": "big brother"})
+        self.assertEqual(response.json()["games"], [])
+
+
+class FuzzyMatchTest(TestCase):
+    def setUp(self):
+        self.country = Country.objects.create(name="United States", code2="US")
+        self.region = Region.objects.create(
+            name="Massachusetts", geoname_code="MA", country=self.country
+        )
+        City.objects.create(name="Boston", region=self.region, country=self.country)
+        City.objects.create(name="Cambridge", region=self.region, country=self.country)
+        self.game = Game.objects.create(
+            name="Survivor Boston",
+            game_format=Game.GameFormat.SURVIVOR,
+            active=True,
+            country=self.country,
+        )
+
+    def tearDown(self):
+        typeahead_index.reset()
+
+    def test_trigram_similarity_matches_pg_trgm(self):
+        self.assertEqual(trigrams("Cat"), {"  c", " ca", "cat", "at "})
+        self.assertAlmostEqual(
+            similarity(trigrams("word"), trigrams("two words")), 4 / 11
+        )
+
+    def test_game_search_tolerates_typos(self):
+        response = self.client.get(reverse("game_search"), {"q": "Survivr Bostn"})
+        self.assertEqual(
+            [g["name"] for g in response.json()["games"]], ["Survivor Boston"]
+        )
+
+    def test_typeahead_index_tolerates_typos(self):
+        typeahead_index.build()
+        # One indexed search-backend lookup for non-name matches; fuzzy is in memory
+        with assert_num_data_queries(self, 1):
+            response = self.client.get(reverse("game_search"), {"q": "Survivr Bostn"})
+        self.assertEqual(
+            [g["name"] for g in response.json()["games"]], ["Survivor Boston"]
+        )
+
+    def test_city_autocomplete_falls_back_to_similarity(self):
+        response = self.client.get(
+            reverse("city-autocomplete"),
+            {"q": "Bostn", "forward": f'{{"region": "{self.region.id}"}}'},
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([r["text"] for r in response.json()["results"]], ["Boston"])
+
+    def test_fallback_only_ranks_rows_sharing_a_trigram(self):
+        cities = City.objects.all()
+        self.assertEqual(
+            list(cities.filter(_candidate_filter("name", "Bostn"))),
+            list(cities.filter(name="Boston")),
+        )
+        self.assertEqual(
+            [c.name for c in fuzzy_filter(cities, "name", "Cambrige")], ["Cambridge"]
+        )
+
+    def test_fallback_keeps_closest_length_candidates(self):
+        City.objects.create(
+            name="Bost Harbor", region=self.region, country=self.country
+        )
+        cities = City.objects.all()
+        with mock.patch("games.fuzzy.FALLBACK_MAX_CANDIDATES", 1):
+            self.assertEqual(
+                [c.name for c in fuzzy_filter(cities, "name", "Bostn")], ["Boston"]
+            )
+
+
+class GameListCacheTest(TestCase):
+    def setUp(self):
+        self.country = Country.objects.create(name="United States", code2="US")
+        self.game = Game.objects.create(
+            name="Cached Survivor",
+            game_format=Game.GameFormat.SURVIVOR,
+            active=True,
+            country=self.country,
+        )
+
+    def test_repeat_request_served_from_cache(self):
+        first = self.client.get(reverse("game_list"), {"game_format": "SU"})
+        with assert_num_data_queries(self, 0):
+            second = self.client.get(reverse("game_list"), {"game_format": "SU"})
+        self.assertEqual(first.content, second.content)
+
+    def test_equivalent_querystrings_share_an_entry(self):
+        self.client.get(reverse("game_list") + "?game_format=SU&game_format=AR&q=")
+        with assert_num_data_queries(self, 0):
+            self.client.get(reverse("game_list") + "?game_format=AR&game_format=SU")
+
+    def test_repeated_single_value_params_keep_their_order(self):
+        # game_list reads q with GET.get(), i.e. the last value
+        found = self.client.get(reverse("game_list") + "?q=nomatch&q=cached")
+        missing = self.client.get(reverse("game_list") + "?q=cached&q=nomatch")
+        self.assertContains(found, "Cached Survivor")
+        self.assertNotContains(missing, "Cached Survivor")
+
+    def test_catalog_edit_invalidates_cached_pages(self):
+        self.client.get(reverse("game_list"))
+        self.game.name = "Renamed Survivor"
+        self.game.save()
+        response = self.client.get(reverse("game_list"))
+        self.assertContains(response, "Renamed Survivor")
+
+    def test_child_row_edit_bumps_generation(self):
+        before = get_catalog_generation()
+        GameDate.objects.create(game=self.game, display_text="Fall 2026")
+        self.assertGreater(get_catalog_generation(), before)
+
+    def test_generation_bump_is_seen_by_other_processes(self):
+        # A fresh backend instance from the same settings stands in for the
+        # image worker or another machine's gunicorn
+        other_process = caches.create_connection("default")
+        self.assertNotIsInstance(other_process, LocMemCache)
+        before = get_catalog_generation()
+        bump_catalog_generation()
+        self.assertEqual(other_process.get(CATALOG_GENERATION_KEY), before + 1)
+
+    def test_unknown_params_bypass_cache(self):
+        self.client.get(reverse("game_list"), {"utm_source": "x"})
+        response = self.client.get(reverse("game_list"), {"utm_source": "x"})
+        self.assertIn("page_obj", response.context)
+
+
+class FacetCountsTest(TestCase):
+    def setUp(self):
+        self.country = Country.objects.create(name="United States", code2="US")
+        self.region = Region.objects.create(name="Massachusetts", country=self.country)
+        self.other_region = Region.objects.create(name="Maine", country=self.country)
+        Game.objects.create(
+            name="Boston Survivor",
+            game_format=Game.GameFormat.SURVIVOR,
+            active=True,
+            country=self.country,
+            region=self.region,
+        )
+        Game.objects.create(
+            name="Boston Big Brother",
+            game_format=Game.GameFormat.BIG_BROTHER,
+            active=False,
+            country=self.country,
+            region=self.region,
+            casting_link="https://example.com/apply",
+        )
+        Game.objects.create(
+            name="Portland Survivor",
+            game_format=Game.GameFormat.SURVIVOR,
+            active=True,
+            country=self.country,
+            region=self.other_region,
+        )
+
+    def test_counts_are_disjunctive(self):
+        facets = facet_counts(
+            {"game_formats": [Game.GameFormat.SURVIVOR], "inactive_filter": "exclude"}
+        )
+        # Format counts ignore the format filter but honour the others
+        self.assertEqual(facets.game_formats, {Game.GameFormat.SURVIVOR: 2})
+        self.assertEqual(facets.tri_state["inactive_filter"], {"all": 2, "exclude": 2})
+        self.assertEqual(facets.tri_state["casting_filter"], {"all": 2, "exclude": 2})
+
+    def test_location_counts_follow_hierarchy(self):
+        facets = facet_counts(
+            {"country_id": str(self.country.id), "region_id": str(self.region.id)}
+        )
+        self.assertEqual(facets.countries, {self.country.id: 3})
+        self.assertEqual(facets.regions, {self.region.id: 2, self.other_region.id: 1})
+        self.assertEqual(
+            facets.regions_with_games, {self.region.id, self.other_region.id}
+        )
+
+    def test_search_query_restricts_counts_not_availability(self):
+        facets = facet_counts({"query": "portland", "country_id": str(self.country.id)})
+        self.assertEqual(facets.game_formats, {Game.GameFormat.SURVIVOR: 1})
+        self.assertEqual(
+            facets.regions_with_games, {self.region.id, self.other_region.id}
+        )
+
+    def test_game_list_shows_counts(self):
+        response = self.client.get(reverse("game_list"))
+        formats = {value: count for value, _, count in response.context["game_formats"]}
+        self.assertEqual(formats[Game.GameFormat.SURVIVOR], 2)
+        self.assertEqual(formats[Game.GameFormat.BIG_BROTHER], 1)
+        self.assertContains(response, 'data-subtext="2"')
+
+
+class CatalogBitmapIndexTest(TestCase):
+    def setUp(self):
+        self.country = Country.objects.create(name="United States", code2="US")
+        self.region = Region.objects.create(name="Massachusetts", country=self.country)
+        for i in range(5):
+            Game.objects.create(
+                name=f"Survivor {i}",
+                game_format=Game.GameFormat.SURVIVOR,
+                active=i % 2 == 0,
+                country=self.country,
+                region=self.region if i < 3 else None,
+                casting_link="https://example.com/apply" if i == 4 else None,
+            )
+        Game.objects.create(
+            name="Big Brother",
+            game_format=Game.GameFormat.BIG_BROTHER,
+            country=self.country,
+            college_game=True,
+        )
+
+    def tearDown(self):
+        catalog_index.reset()
+
+    def test_matches_database_filters(self):
+        for filters in [
+            {},
+            {"game_formats": [Game.GameFormat.SURVIVOR]},
+            {"country_id": str(self.country.id), "no_region": True},
+            {"region_id": str(self.region.id), "inactive_filter": "exclude"},
+            {"inactive_filter": "only"},
+            {"college_filter": "exclude", "casting_filter": "only"},
+            {"query": "brother"},
+        ]:
+            expected = list(
+                _apply_filters(Game.objects.order_by("name", "id"), filters)
+            )
+            self.assertEqual(
+                list(catalog_index.filter(Game.objects.all(), filters)),
+                expected,
+                filters,
+            )
+
+    def test_slice_fetches_only_the_page(self):
+        games = catalog_index.filter(
+            Game.objects.all(), {"game_formats": [Game.GameFormat.SURVIVOR]}
+        )
+        self.assertEqual(games.count(), 5)
+        with assert_num_data_queries(self, 1):
+            page = games[1:3]
+        self.assertEqual([g.name for g in page], ["Survivor 1", "Survivor 2"])
+
+    def test_rebuilds_when_catalog_generation_moves(self):
+        before = catalog_index.snapshot()
+        self.assertIs(catalog_index.snapshot(), before)
+        Game.objects.create(
+            name="Amazing Race",
+            game_format=Game.GameFormat.AMAZING_RACE,
+            country=self.country,
+        )
+        self.assertEqual(catalog_index.filter(Game.objects.all(), {}).count(), 7)
+
+
+class GameListFragmentTest(TestCase):
+    def setUp(self):
+        self.country = Country.objects.create(name="United States", code2="US")
+        Game.objects.create(
+            name="Fragment Survivor",
+            game_format=Game.GameFormat.SURVIVOR,
+            active=True,
+            country=self.country,
+        )
+        Game.objects.create(
+            name="Fragment Big Brother",
+            game_format=Game.GameFormat.BIG_BROTHER,
+            active=True,
+            country=self.country,
+        )
+
+    def test_returns_cards_and_facets_only(self):
+        response = self.client.get(reverse("game_list_fragment"), {"game_format": "SU"})
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertIn("Fragment Survivor", data["html"])
+        self.assertNotIn("Fragment Big Brother", data["html"])
+        self.assertNotIn("<html", data["html"])
+        self.assertEqual(data["facets"]["game_format"]["BB"], 1)
+        self.assertEqual(
+            data["facets"]["country"],
+            [
+                {
+                    "id": str(self.country.id),
+                    "name": "United States",
+                    "count": 1,
+                    "enabled": True,
+                }
+            ],
+        )
+
+
+class ConditionalGetTest(TestCase):
+    def setUp(self):
+        self.country = Country.objects.create(name="United States", code2="US")
+        self.game = Game.objects.create(
+            name="Conditional Survivor",
+            game_format=Game.GameFormat.SURVIVOR,
+            active=True,
+            country=self.country,
+        )
+
+    def test_matching_etag_gets_304_without_rendering(self):
+        for url in [
+            reverse("game_list"),
+            reverse("game_detail", args=[self.game.slug]),
+            reverse("game_map_data"),
+            reverse("game_search") + "?q=surv",
+            "/sitemap.xml",
+        ]:
+            first = self.client.get(url)
+            self.assertEqual(first.status_code, 200, url)
+            self.assertIn("no-cache", first["Cache-Control"])
+            with assert_num_data_queries(self, 0):
+                second = self.client.get(url, HTTP_IF_NONE_MATCH=first["ETag"])
+            self.assertEqual(second.status_code, 304, url)
+
+    def test_if_modified_since_honoured(self):
+        first = self.client.get(reverse("game_list"))
+        second = self.client.get(
+            reverse("game_list"), HTTP_IF_MODIFIED_SINCE=first["Last-Modified"]
+        )
+        self.assertEqual(second.status_code, 304)
+
+    def test_gzip_and_identity_bodies_have_distinct_etags(self):
+        url = reverse("game_map_data") + "?format=compact"
+        gzipped = self.client.get(url, HTTP_ACCEPT_ENCODING="gzip")
+        identity = self.client.get(url)
+        self.assertEqual(gzipped["Content-Encoding"], "gzip")
+        self.assertNotEqual(gzipped["ETag"], identity["ETag"])
+        revalidated = self.client.get(url, HTTP_IF_NONE_MATCH=gzipped["ETag"])
+        self.assertEqual(revalidated.status_code, 200)
+
+    def test_detail_validators_change_daily(self):
+        response = self.client.get(reverse("game_detail", args=[self.game.slug]))
+        self.assertIn(date.today().isoformat(), response["ETag"])
+        self.assertNotIn(
+            date.today().isoformat(), self.client.get(reverse("game_list"))["ETag"]
+        )
+
+    def test_catalog_edit_changes_validators(self):
+        first = self.client.get(reverse("game_detail", args=[self.game.slug]))
+        self.game.description = "Now with a description"
+        self.game.save()
+        second = self.client.get(
+            reverse("game_detail", args=[self.game.slug]),
+            HTTP_IF_NONE_MATCH=first["ETag"],
+        )
+        self.assertEqual(second.status_code, 200)
+        self.assertNotEqual(second["ETag"], first["ETag"])
+
+
+class GameDetailCacheTest(TestCase):
+    def setUp(self):
+        self.country = Country.objects.create(name="United States", code2="US")
+        self.game = Game.objects.create(
+            name="Detail Survivor",
+            game_format=Game.GameFormat.SURVIVOR,
+            active=True,
+            country=self.country,
+        )
+        self.url = reverse("game_detail", args=[self.game.slug])
+
+    def test_repeat_request_served_from_cache(self):
+        first = self.client.get(self.url)
+        with assert_num_data_queries(self, 0):
+            second = self.client.get(self.url)
+        self.assertEqual(first.content, second.content)
+
+    def test_game_save_evicts_entry(self):
+        self.client.get(self.url)
+        self.game.description = "Fresh description"
+        self.game.save()
+        self.assertContains(self.client.get(self.url), "Fresh description")
+
+    def test_child_row_save_evicts_entry(self):
+        self.client.get(self.url)
+        Season.objects.create(game=self.game, number=1, name="Island of Caches")
+        self.assertContains(self.client.get(self.url), "Island of Caches")
+
+    def test_slug_change_evicts_old_slug(self):
+        self.client.get(self.url)
+        self.game.name = "Renamed Survivor"
+        self.game.save()
+        self.assertEqual(self.client.get(self.url).status_code, 404)
+
+
+class GameDetailQueryBudgetTest(TestCase):
+    # Game (with location joins) + one query each for dates, seasons and images
+    QUERY_BUDGET = 4
+
+    def setUp(self):
+        self.country = Country.objects.create(name="United States", code2="US")
+        self.game = Game.objects.create(
+            name="Budget Survivor",
+            game_format=Game.GameFormat.SURVIVOR,
+            active=True,
+            country=self.country,
+        )
+        Season.objects.bulk_create(
+            Season(game=self.game, number=n, name=f"Season {n}") for n in range(1, 9)
+        )
+        GameImages.objects.bulk_create(
+            GameImages(game=self.game, image=f"game_images/photo{n}.jpg")
+            for n in range(6)
+        )
+        GameDate.objects.bulk_create(
+            [
+                GameDate(game=self.game, start_date=date.today() + timedelta(days=30)),
+                GameDate(game=self.game, display_text="Someday", is_removed=True),
+            ]
+        )
+        self.url = reverse("game_detail", args=[self.game.slug])
+
+    def test_renders_within_query_budget(self):
+        cache.clear()
+        with assert_num_data_queries(self, self.QUERY_BUDGET):
+            response = self.client.get(self.url)
+        self.assertContains(response, "Season 8")
+        self.assertContains(response, "photo5.jpg")
+        self.assertContains(response, '"@type": "Event"')
+        self.assertNotContains(response, "Someday")
+
+
+class RegionCentroidTest(TestCase):
+    def setUp(self):
+        self.country = Country.objects.create(name="United States", code2="US")
+        self.region = Region.objects.create(name="Massachusetts", country=self.country)
+        for name, lat, lng in [("Boston", 42.0, -71.0), ("Worcester", 42.4, -71.8)]:
+            City.objects.create(
+                name=name,
+                region=self.region,
+                country=self.country,
+                latitude=lat,
+                longitude=lng,
+            )
+
+    def test_command_builds_centroids(self):
+        call_command("build_region_centroids", stdout=StringIO())
+        centroid = RegionCentroid.objects.get(region=self.region)
+        self.assertAlmostEqual(centroid.latitude, 42.2)
+        self.assertAlmostEqual(centroid.longitude, -71.4)
+
+    def test_map_data_reads_centroid_table(self):
+        RegionCentroid.rebuild()
+        cache.delete("games:map_region_coords")
+        Game.objects.create(
+            name="Centroid Game",
+            game_format=Game.GameFormat.SURVIVOR,
+            country=self.country,
+            region=self.region,
+        )
+        # Grouped game query + centroid table; no City aggregate
+        with assert_num_data_queries(self, 2):
+            data = self.client.get(reverse("game_map_data")).json()
+        self.assertAlmostEqual(data["regions"][0]["lat"], 42.2)
+
+
+class MapTileTest(TestCase):
+    def setUp(self):
+        self.country = Country.objects.create(name="United States", code2="US")
+        self.region = Region.objects.create(name="Massachusetts", country=self.country)
+        for name, lat, lng in [("Boston", 42.36, -71.06), ("Cambridge", 42.37, -71.11)]:
+            city = City.objects.create(
+                name=name,
+                region=self.region,
+                country=self.country,
+                latitude=lat,
+                longitude=lng,
+            )
+            Game.objects.create(
+                name=f"{name} Survivor",
+                game_format=Game.GameFormat.SURVIVOR,
+                country=self.country,
+                region=self.region,
+                city=city,
+            )
+
+    def tile_url(self, z, lat, lng):
+        n = 2**z
+        x = int((lng + 180) / 360 * n)
+        lat_r = math.radians(lat)
+        y = int((1 - math.asinh(math.tan(lat_r)) / math.pi) / 2 * n)
+        return reverse("game_map_tile", args=[z, x, y])
+
+    def test_nearby_cities_cluster_at_low_zoom(self):
+        items = self.client.get(self.tile_url(7, 42.36, -71.06)).json()["items"]
+        self.assertEqual(len(items), 1)
+        self.assertEqual(items[0]["type"], "cluster")
+        self.assertEqual(items[0]["count"], 2)
+
+    def test_cities_separate_at_high_zoom(self):
+        items = self.client.get(self.tile_url(13, 42.36, -71.06)).json()["items"]
+        self.assertEqual([i["name"] for i in items], ["Boston"])
+        self.assertEqual(items[0]["type"], "city")
+
+    def test_tiles_away_from_games_are_empty(self):
+        response = self.client.get(self.tile_url(7, -33.9, 151.2))
+        self.assertEqual(response.json()["items"], [])
+
+    def test_out_of_range_tile_is_404(self):
+        response = self.client.get(reverse("game_map_tile", args=[2, 4, 0]))
+        self.assertEqual(response.status_code, 404)
+
+
+class MapLocationGamesTest(TestCase):
+    def setUp(self):
+        self.country = Country.objects.create(name="United States", code2="US")
+        self.games = [
+            Game.objects.create(
+                name=f"Panel Game {i}",
+                game_format=Game.GameFormat.SURVIVOR,
+                country=self.country,
+            )
+            for i in range(3)
+        ]
+        self.url = reverse("game_map_location_games")
+
+    def test_pages_with_limit_and_cursor(self):
+        first = self.client.get(self.url, {"country": self.country.id, "limit": 2})
+        data = first.json()
+        self.assertEqual(data["total"], 3)
+        self.assertEqual(
+            [g["name"] for g in data["games"]], ["Panel Game 0", "Panel Game 1"]
+        )
+        self.assertNotIn("cursor", data["game_list_url"])
+
+        second = self.client.get(
+            self.url,
+            {"country": self.country.id, "limit": 2, "cursor": data["next_cursor"]},
+        ).json()
+        self.assertEqual([g["name"] for g in second["games"]], ["Panel Game 2"])
+        self.assertIsNone(second["next_cursor"])
+
+    def test_cards_are_rebuilt_on_save(self):
+        game = self.games[0]
+        game.name = "Renamed Panel Game"
+        game.save()
+        self.assertEqual(
+            cache.get(card_cache_key(game.pk))["name"], "Renamed Panel Game"
+        )
+        data = self.client.get(self.url, {"country": self.country.id}).json()
+        self.assertIn("Renamed Panel Game", [g["name"] for g in data["games"]])
+
+
+class StaticIndexTest(TestCase):
+    def test_default_logo_urls_come_from_the_index(self):
+        self.assertIn("games/images/default_logos/su.png", static_paths())
+        game = Game(name="Logo Game", game_format=Game.GameFormat.SURVIVOR)
+        self.assertEqual(
+            game.get_default_logo_url(),
+            staticfiles_storage.url("games/images/default_logos/su.png"),
+        )
+
+    def test_safe_static_blank_for_unknown_path(self):
+        self.assertEqual(safe_static("games/images/does-not-exist.png"), "")
+        self.assertTrue(safe_static("games/images/default_logos/su.png"))
+
+    def test_default_logo_preview_is_computed_once_per_format(self):
+        preview = default_logo_preview(Game.GameFormat.SURVIVOR)
+        self.assertGreater(preview["width"], 0)
+        self.assertTrue(preview["placeholder"].startswith("data:image/webp;base64,"))
+        self.assertIs(default_logo_preview(Game.GameFormat.SURVIVOR), preview)
+
+
+class ImageVariantsTest(TestCase):
+    def test_variants_are_resized_and_recorded(self):
+        buffer = BytesIO()
+        Image.new("RGB", (1000, 500)).save(buffer, format="WEBP")
+        with tempfile.TemporaryDirectory() as tmp:
+            field_file = SimpleNamespace(
+                name="game_images/photo.webp", storage=FileSystemStorage(tmp)
+            )
+            variants = save_image_variants(field_file, ContentFile(buffer.getvalue()))
+            self.assertEqual(
+                {label: v["width"] for label, v in variants.items()},
+                {"full": 1000, "thumb": 160, "card": 480},
+            )
+            self.assertTrue(field_file.storage.exists(variants["thumb"]["name"]))
+
+    def test_srcset_lists_variants_smallest_first(self):
+        image = GameImages(
+            image="game_images/photo.webp",
+            image_variants={
+                "full": {"name": "game_images/photo.webp", "width": 1200},
+                "thumb": {"name": "game_images/photo_thumb.webp", "width": 160},
+            },
+        )
+        srcset = image.srcset
+        self.assertRegex(srcset, r"photo_thumb\.webp 160w, .*photo\.webp 1200w$")
+        self.assertEqual(GameImages(image="game_images/photo.webp").srcset, "")
+
+
+class ImageJobTest(TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        storage = FileSystemStorage(self.tmp.name)
+        self.fields = [
+            Game._meta.get_field("logo"),
+            GameImages._meta.get_field("image"),
+        ]
+        self.storages = [field.storage for field in self.fields]
+        for field in self.fields:
+            field.storage = storage
+        self.country = Country.objects.create(name="United States", code2="US")
+
+    def tearDown(self):
+        for field, storage in zip(self.fields, self.storages):
+            field.storage = storage
+        self.tmp.cleanup()
+
+    def png(self, size=(2000, 1000)):
+        buffer = BytesIO()
+        Image.new("RGB", size).save(buffer, format="PNG")
+        return ContentFile(buffer.getvalue(), name="upload.png")
+
+    def test_logo_is_queued_then_optimized_by_worker(self):
+        game = Game.objects.create(
+            name="Queued Logo Game",
+            game_format=Game.GameFormat.SURVIVOR,
+            country=self.country,
+            logo=self.png(),
+        )
+        raw_name = game.logo.name
+        self.assertTrue(game.logo_processing)
+        self.assertEqual(ImageJob.objects.get().status, ImageJob.Status.PENDING)
+
+        self.assertEqual(process_pending(), 1)
+        game.refresh_from_db()
+        self.assertFalse(game.logo_processing)
+        self.assertEqual(ImageJob.objects.get().status, ImageJob.Status.DONE)
+        self.assertEqual(game.logo_variants["full"]["width"], 1200)
+        self.assertEqual(set(game.logo_variants), {"full", "thumb", "card"})
+        self.assertEqual((game.logo_width, game.logo_height), (1200, 600))
+        self.assertTrue(game.logo_placeholder.startswith("data:image/webp;base64,"))
+        self.assertFalse(game.logo.storage.exists(raw_name))
+
+    def test_unchanged_logo_is_not_reprocessed(self):
+        game = Game.objects.create(
+            name="Fingerprint Game",
+            game_format=Game.GameFormat.SURVIVOR,
+            country=self.country,
+            logo=self.png(),
+        )
+        process_pending()
+        game.refresh_from_db()
+        optimized_name = game.logo.name
+        self.assertEqual(len(game.logo_fingerprint), 64)
+
+        game.description = "Edited without touching the logo"
+        game.save()
+        self.assertFalse(game.logo_processing)
+        self.assertEqual(ImageJob.objects.count(), 1)
+
+        # A stray job for an already optimized file leaves it alone
+        ImageJob.enqueue(ImageJob.Kind.LOGO, game.pk)
+        process_pending()
+        game.refresh_from_db()
+        self.assertEqual(game.logo.name, optimized_name)
+
+    def test_failing_job_is_retried_then_marked_failed(self):
+        game = Game.objects.create(
+            name="Broken Image Game",
+            game_format=Game.GameFormat.SURVIVOR,
+            country=self.country,
+        )
+        image = GameImages.objects.create(
+            game=game, image=ContentFile(b"not an image", name="broken.png")
+        )
+        with self.assertLogs("games.image_jobs", level="ERROR"):
+            self.assertEqual(process_pending(), 1)
+        job = ImageJob.objects.get(object_id=image.pk)
+        self.assertEqual(job.status, ImageJob.Status.PENDING)
+        self.assertEqual(process_pending(), 0)  # waiting out the retry delay
+
+        ImageJob.objects.filter(pk=job.pk).update(
+            attempts=MAX_ATTEMPTS - 1, run_after=job.created
+        )
+        with self.assertLogs("games.image_jobs", level="ERROR"):
+            process_pending()
+        job.refresh_from_db()
+        image.refresh_from_db()
+        self.assertEqual(job.status, ImageJob.Status.FAILED)
+        self.assertFalse(image.image_processing)
+
+    def test_failed_jobs_show_on_game_admin(self):
+        game = Game.objects.create(
+            name="Broken Image Game",
+            game_format=Game.GameFormat.SURVIVOR,
+            country=self.country,
+        )
+        image = GameImages.objects.create(game=game, image=self.png())
+        job = ImageJob.objects.get(object_id=image.pk)
+        ImageJob.objects.filter(pk=job.pk).update(
+            status=ImageJob.Status.FAILED, error="cannot identify image file"
+        )
+        request = RequestFactory().get("/", {"image_failed": "yes"})
+        failed = ImageProcessingFailedFilter(
+            request, dict(request.GET.lists()), Game, GameAdmin(Game, site)
+        )
+        self.assertEqual(list(failed.queryset(request, Game.objects.all())), [game])
+        inline = GameImagesInline(Game, site)
+        self.assertEqual(inline.image_error(image), "cannot identify image file")
+        self.assertIsNone(GameAdmin(Game, site).logo_error(game))
+
+        # A fresh upload supersedes the failure
+        ImageJob.enqueue(ImageJob.Kind.IMAGE, image.pk)
+        self.assertEqual(list(failed.queryset(request, Game.objects.all())), [])
+        self.assertIsNone(inline.image_error(image))
+
+    def test_reprocess_media_resumes_from_checkpoint(self):
+        games = [
+            Game.objects.create(
+                name=f"Backfill Game {i}",
+                game_format=Game.GameFormat.SURVIVOR,
+                country=self.country,
+                logo=self.png(),
+            )
+            for i in range(2)
+        ]
+        process_pending()
+        checkpoint = os.path.join(self.tmp.name, "checkpoint.json")
+        options = {"workers": 1, "checkpoint": checkpoint}
+
+        out = StringIO()
+        call_command("reprocess_media", dry_run=True, stdout=out, **options)
+        self.assertIn("2 images to process", out.getvalue())
+
+        with open(checkpoint, "w") as f:
+            json.dump(
+                {
+                    "settings": [[1200, 1200], 85, "WEBP"],
+                    "done": [f"logo:{games[0].pk}"],
+                },
+                f,
+            )
+        names = {g.pk: Game.objects.get(pk=g.pk).logo.name for g in games}
+        out = StringIO()
+        call_command("reprocess_media", stdout=out, **options)
+        self.assertIn("Re-optimized 1 images", out.getvalue())
+        self.assertEqual(Game.objects.get(pk=games[0].pk).logo.name, names[games[0].pk])
+        self.assertNotEqual(
+            Game.objects.get(pk=games[1].pk).logo.name, names[games[1].pk]
+        )
+        self.assertFalse(os.path.exists(checkpoint))
+
+    def test_reprocess_media_local_root_only_reports(self):
+        game = Game.objects.create(
+            name="Local Copy Game",
+            game_format=Game.GameFormat.SURVIVOR,
+            country=self.country,
+            logo=self.png(),
+        )
+        process_pending()
+        game.refresh_from_db()
+        files_before = sorted(os.listdir(os.path.join(self.tmp.name, "game_logos")))
+        out = StringIO()
+        call_command(
+            "reprocess_media",
+            workers=1,
+            checkpoint=os.path.join(self.tmp.name, "checkpoint.json"),
+            local_root=self.tmp.name,
+            stdout=out,
+        )
+        self.assertIn("would re-optimize 1 images", out.getvalue())
+        self.assertEqual(Game.objects.get(pk=game.pk).logo.name, game.logo.name)
+        self.assertEqual(
+            sorted(os.listdir(os.path.join(self.tmp.name, "game_logos"))),
+            files_before,
+        )
+
+
+class ImageIngestionMemoryTest(TestCase):
+    # Decoding 4000x3000 at full size needs 48MB for the pixels alone
+    PEAK_BUDGET_MB = 40
+
+    def test_large_jpeg_is_optimized_within_memory_budget(self):
+        script = (
+            "import resource, sys, django\n"
+            "django.setup()\n"
+            "from django.core.files.base import ContentFile\n"
+            "from games.utils import optimize_image\n"
+            "data = open(PATH, 'rb').read()\n"
+            "before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss\n"
+            "optimize_image(ContentFile(data, name='photo.jpg'))\n"
+            "after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss\n"
+            "# ru_maxrss is in bytes on macOS, kilobytes on Linux\n"
+            "per_mb = 1024 * 1024 if sys.platform == 'darwin' else 1024\n"
+            "print((after - before) // per_mb)\n"
+        )
+        with tempfile.NamedTemporaryFile(suffix=".jpg") as photo:
+            Image.new("RGB", (4000, 3000), (200, 100, 50)).save(photo, format="JPEG")
+            photo.flush()
+            result = subprocess.run(
+                [sys.executable, "-c", f"PATH = {photo.name!r}\n" + script],
+                cwd=settings.BASE_DIR,
+                env={**os.environ, "DJANGO_SETTINGS_MODULE": "lrgnetwork.settings"},
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+        self.assertLess(int(result.stdout.strip()), self.PEAK_BUDGET_MB)
+
+    def test_oversized_image_is_refused_before_decoding(self):
+        buffer = BytesIO()
+        Image.new("L", (3000, 2000)).save(buffer, format="JPEG")
+        upload = ContentFile(buffer.getvalue(), name="huge.jpg")
+        with self.settings(IMAGE_MAX_PIXELS=5_000_000):
+            with self.assertRaisesMessage(ValidationError, "too large"):
+                optimize_image(upload)
+
+
+class ImageTransformTest(TestCase):
+    def setUp(self):
+        class CountingStorage(FileSystemStorage):
+            opens = 0
+
+            def _open(self, name, mode="rb"):
+                CountingStorage.opens += 1
+                return super()._open(name, mode)
+
+        self.tmp = tempfile.TemporaryDirectory()
+        self.field = GameImages._meta.get_field("image")
+        self.original_storage = self.field.storage
+        self.storage = self.field.storage = CountingStorage(f"{self.tmp.name}/media")
+        buffer = BytesIO()
+        Image.new("RGB", (1200, 800), "red").save(buffer, format="WEBP")
+        self.src = self.storage.save(
+            "game_images/photo.webp", ContentFile(buffer.getvalue())
+        )
+        self.override = self.settings(
+            IMAGE_TRANSFORM_CACHE_DIR=f"{self.tmp.name}/cache"
+        )
+        self.override.enable()
+
+    def tearDown(self):
+        self.override.disable()
+        self.field.storage = self.original_storage
+        self.tmp.cleanup()
+
+    def test_resized_once_then_served_from_disk(self):
+        url = transform_url(self.src, 300)
+        for _ in range(2):
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response["Content-Type"], "image/webp")
+            self.assertIn("immutable", response["Cache-Control"])
+            with Image.open(BytesIO(b"".join(response.streaming_content))) as img:
+                self.assertEqual(img.size, (300, 200))
+            response.close()
+        self.assertEqual(self.storage.opens, 1)
+
+    def test_tampered_or_unknown_requests_are_refused(self):
+        url = transform_url(self.src, 300)
+        self.assertEqual(
+            self.client.get(url.replace("w=300", "w=301")).status_code, 400
+        )
+        missing = transform_url("game_images/missing.webp", 300)
+        self.assertEqual(self.client.get(missing).status_code, 404)
+        outside = transform_url("../secrets.webp", 300)
+        self.assertEqual(self.client.get(outside).status_code, 400)
+
+    def test_cache_evicts_least_recently_used(self):
+        for width in (100, 200):
+            open_variant(self.storage, self.src, width, "webp", 80).close()
+        old, new = (cache_path(self.src, w, "webp", 80) for w in (100, 200))
+        os.utime(old, (1, 1))
+        trim_cache(max_bytes=os.path.getsize(new))
+        self.assertFalse(os.path.exists(old))
+        self.assertFalse(os.path.exists(f"{old}.lock"))
+        self.assertTrue(os.path.exists(new))
+
+    def test_evicted_variant_still_streams_to_open_request(self):
+        variant = open_variant(self.storage, self.src, 100, "webp", 80)
+        trim_cache(max_bytes=0)
+        with variant:
+            self.assertTrue(variant.read())
+
+    def test_lock_files_of_failed_resizes_are_cleaned_up(self):
+        with self.assertRaises(FileNotFoundError):
+            open_variant(self.storage, "game_images/missing.webp", 100, "webp", 80)
+        lock_path = cache_path("game_images/missing.webp", 100, "webp", 80) + ".lock"
+        self.assertTrue(os.path.exists(lock_path))
+        trim_cache()
+        self.assertFalse(os.path.exists(lock_path))
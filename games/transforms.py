@@ -0,0 +1,267 @@
+"""
+Signed on-demand resizing of stored media, cached on local disk.
+
+transform_url() builds a URL for a stored file at a given width, format and
+quality, signed with SECRET_KEY so clients can't ask for arbitrary sizes.
+The image_transform view resizes from the stored file on first request and
+keeps the result under IMAGE_TRANSFORM_CACHE_DIR; later requests are served
+from disk. A per-variant file lock makes concurrent requests (threads or
+worker processes) for the same variant wait for one resize instead of each
+reading the original from MediaStorage. The cache is trimmed to
+IMAGE_TRANSFORM_CACHE_MAX_BYTES by evicting the least recently served files
+(and their lock files), every so many misses rather than on each one.
+
+Uploads are optimized down to IMAGE_MAX_SIZE when stored and originals
+aren't kept, so that is the largest width a transform can produce.
+"""
+
+import fcntl
+import hashlib
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from io import BytesIO
+from typing import BinaryIO, Iterator, Optional, Tuple
+
+from django.conf import settings
+from django.urls import reverse
+from django.utils.crypto import constant_time_compare, salted_hmac
+from django.utils.http import urlencode
+from PIL import Image, ImageOps
+
+from .validators import validate_pixel_count
+
+# format param -> (Pillow format, content type, cache file extension)
+TRANSFORM_FORMATS = {
+    "webp": ("WEBP", "image/webp", ".webp"),
+    "avif": ("AVIF", "image/avif", ".avif"),
+    "jpeg": ("JPEG", "image/jpeg", ".jpg"),
+}
+DEFAULT_FORMAT = "webp"
+
+# Only files under these prefixes (the media fields' upload_to) can be transformed
+SOURCE_PREFIXES = ("game_logos/", "game_images/")
+
+_SALT = "games.transforms"
+
+# Each process trims the cache after this many misses, or once it has written
+# this fraction of IMAGE_TRANSFORM_CACHE_MAX_BYTES since its last trim
+TRIM_EVERY_MISSES = 200
+TRIM_EVERY_FRACTION = 0.05
+
+
+class TransformError(ValueError):
+    """Parameters that don't describe a transform we will produce."""
+
+
+def _message(src: str, width: int, format: str, quality: int) -> str:
+    return f"{src}\n{width}\n{format}\n{quality}"
+
+
+def transform_signature(src: str, width: int, format: str, quality: int) -> str:
+    return salted_hmac(
+        _SALT, _message(src, width, format, quality), algorithm="sha256"
+    ).hexdigest()[:32]
+
+
+def transform_url(
+    src: str, width: int, format: str = DEFAULT_FORMAT, quality: int = None
+) -> str:
+    """Signed URL of the image_transform view for stored file src."""
+    quality = quality or settings.IMAGE_QUALITY
+    params = {"src": src, "w": width, "fmt": format, "q": quality}
+    params["s"] = transform_signature(src, width, format, quality)
+    return f"{reverse('game_image_transform')}?{urlencode(params)}"
+
+
+def parse_transform(params) -> Tuple[str, int, str, int]:
+    """
+    (src, width, format, quality) from a request's GET params. Raises
+    TransformError if they are malformed, out of range or not signed by us.
+    """
+    src = params.get("src", "")
+    format = params.get("fmt", DEFAULT_FORMAT)
+    try:
+        width = int(params.get("w", ""))
+        quality = int(params.get("q", settings.IMAGE_QUALITY))
+    except ValueError:
+        raise TransformError("Width and quality must be integers.")
+    expected = transform_signature(src, width, format, quality)
+    if not constant_time_compare(params.get("s", ""), expected):
+        raise TransformError("Bad signature.")
+    if not src.startswith(SOURCE_PREFIXES) or ".." in src.split("/"):
+        raise TransformError("Not a media image.")
+    if format not in TRANSFORM_FORMATS:
+        raise TransformError(f"Unsupported format: {format}")
+    if not 1 <= width <= max(settings.IMAGE_MAX_SIZE):
+        raise TransformError("Width out of range.")
+    if not 1 <= quality <= 100:
+        raise TransformError("Quality out of range.")
+    return src, width, format, quality
+
+
+def cache_path(src: str, width: int, format: str, quality: int) -> str:
+    digest = hashlib.sha256(_message(src, width, format, quality).encode()).hexdigest()
+    return os.path.join(
+        settings.IMAGE_TRANSFORM_CACHE_DIR,
+        digest[:2],
+        digest + TRANSFORM_FORMATS[format][2],
+    )
+
+
+def resize(source, width: int, format: str, quality: int) -> bytes:
+    """source scaled down to width (never up), encoded as format."""
+    img = Image.open(source)
+    validate_pixel_count(img)
+    img.draft(None, (width, width))
+    ImageOps.exif_transpose(img, in_place=True)
+    if img.width > width:
+        height = max(round(img.height * width / img.width), 1)
+        img = img.resize((width, height), Image.Resampling.LANCZOS)
+    pil_format = TRANSFORM_FORMATS[format][0]
+    if pil_format == "JPEG" and img.mode != "RGB":
+        img = img.convert("RGB")
+    buffer = BytesIO()
+    img.save(buffer, format=pil_format, quality=quality)
+    return buffer.getvalue()
+
+
+def _write_atomic(path: str, content: bytes) -> None:
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+@contextmanager
+def _variant_lock(path: str, blocking: bool = True) -> Iterator[bool]:
+    """
+    Hold the per-variant lock (an flock on "<path>.lock"); yields False if
+    blocking is off and someone else holds it. trim_cache deletes lock files,
+    so after locking, check the file we locked is still the one on disk.
+    """
+    lock_path = f"{path}.lock"
+    while True:
+        with open(lock_path, "a") as lock:
+            try:
+                fcntl.flock(lock, fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB))
+            except BlockingIOError:
+                yield False
+                return
+            try:
+                current = os.stat(lock_path).st_ino == os.fstat(lock.fileno()).st_ino
+            except FileNotFoundError:
+                current = False
+            if current:
+                yield True
+                return
+        # Unlinked while we waited: lock the new file instead
+
+
+def trim_cache(max_bytes: Optional[int] = None) -> int:
+    """
+    Delete the least recently served cached variants, with their lock files,
+    until the cache fits in max_bytes (default IMAGE_TRANSFORM_CACHE_MAX_BYTES),
+    and lock files left by resizes that failed. Variants being produced or
+    locked right now are skipped. Returns bytes freed.
+    """
+    if max_bytes is None:
+        max_bytes = settings.IMAGE_TRANSFORM_CACHE_MAX_BYTES
+    entries = []
+    orphan_locks = []
+    total = 0
+    for root, _, names in os.walk(settings.IMAGE_TRANSFORM_CACHE_DIR):
+        names = set(names)
+        for name in names:
+            path = os.path.join(root, name)
+            if name.endswith(".lock"):
+                if name[: -len(".lock")] not in names:
+                    orphan_locks.append(path[: -len(".lock")])
+                continue
+            if name.endswith(".tmp"):
+                continue
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+
+    def evict(path: str) -> bool:
+        with _variant_lock(path, blocking=False) as locked:
+            if not locked:
+                return False
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            os.remove(f"{path}.lock")
+        return True
+
+    for path in orphan_locks:
+        evict(path)
+    freed = 0
+    # mtime is bumped on every hit (see open_variant), so oldest = least recently used
+    for _, size, path in sorted(entries):
+        if total - freed <= max_bytes:
+            break
+        if evict(path):
+            freed += size
+    return freed
+
+
+# Misses and bytes written since this process last trimmed the cache
+_since_trim = {"misses": 0, "bytes": 0}
+_since_trim_lock = threading.Lock()
+
+
+def _note_miss(written: int) -> None:
+    """Trim once enough misses or bytes have accumulated, not on every miss."""
+    with _since_trim_lock:
+        _since_trim["misses"] += 1
+        _since_trim["bytes"] += written
+        due = (
+            _since_trim["misses"] >= TRIM_EVERY_MISSES
+            or _since_trim["bytes"]
+            >= settings.IMAGE_TRANSFORM_CACHE_MAX_BYTES * TRIM_EVERY_FRACTION
+        )
+        if due:
+            _since_trim["misses"] = _since_trim["bytes"] = 0
+    if due:
+        trim_cache()
+
+
+def open_variant(storage, src: str, width: int, format: str, quality: int) -> BinaryIO:
+    """
+    The cached variant, opened for reading, resizing src from storage first if
+    it isn't cached yet. Raises FileNotFoundError if src isn't stored. The
+    file is opened before anything can evict it, so callers can stream it
+    even if a trim removes the path meanwhile.
+    """
+    path = cache_path(src, width, format, quality)
+    try:
+        variant = open(path, "rb")
+    except FileNotFoundError:
+        pass
+    else:
+        os.utime(variant.fileno())  # Mark as recently used
+        return variant
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    written = 0
+    try:
+        with _variant_lock(path):
+            # Another request may have produced it while we waited for the lock
+            if not os.path.exists(path):
+                with storage.open(src, "rb") as source:
+                    content = resize(source, width, format, quality)
+                _write_atomic(path, content)
+                written = len(content)
+            return open(path, "rb")
+    finally:
+        _note_miss(written)
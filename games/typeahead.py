@@ -0,0 +1,230 @@
+"""
+In-process prefix index for the navbar typeahead (games.views.game_search).
+
+Each worker keeps every live game's name/college/host tokens in a sorted list
+and answers prefix lookups with bisect, so most keystrokes never reach the
+database. Entries hold the ready-to-serialize JSON payload for the game.
+
+The index is built when the WSGI worker starts (lrgnetwork/wsgi.py) and then
+updated per game from post_save/post_delete signals. Like the bitmap index it
+is tagged with the catalog generation it was built under; signal-driven bumps
+in this process advance the tag along with the update. Any other move of the
+generation (bulk admin deletes, queryset updates, edits made on another
+machine or by the image worker) rebuilds it on the next lookup, as does
+being older than the catalog cache timeout. Until it is built (shell, tests, a failed
+warm-up) game_search simply queries the search backend.
+"""
+
+import logging
+import threading
+import time
+from bisect import bisect_left, insort
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from django.db import DatabaseError
+from django.urls import reverse
+
+from .catalog import CATALOG_CACHE_TIMEOUT, get_catalog_generation
+from .fuzzy import TrigramIndex
+from .search import tokenize
+
+logger = logging.getLogger(__name__)
+
+# Fields whose words are prefix-searchable from the typeahead
+INDEXED_FIELDS = ("name", "college_name", "host")
+
+
+def typeahead_payload(game) -> Dict[str, Any]:
+    """
+    Build the game_search JSON entry for a game. logo_url may be a relative
+    static URL; the view makes it absolute per request.
+    """
+    logo_url = game.logo.url if game.logo else game.get_default_logo_url()
+    return {
+        "name": game.name,
+        "url": reverse("game_detail", args=[game.slug]),
+        "logo_url": logo_url,
+        "location": game.location_display(),
+        "format": game.get_game_format_display(),
+    }
+
+
+class TypeaheadIndex:
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._build_lock = threading.Lock()
+        self._ready = False
+        self._generation: Optional[int] = None
+        self._built_at = 0.0
+        # pk -> (sort key, payload, set of name tokens)
+        self._entries: Dict[Any, Tuple[str, Dict[str, Any], frozenset]] = {}
+        # Sorted (token, pk) pairs; a prefix maps to one contiguous slice
+        self._tokens: List[Tuple[str, str]] = []
+        self._tokens_by_pk: Dict[str, List[str]] = {}
+        # Name trigrams for typo-tolerant fallback lookups
+        self._trigrams = TrigramIndex()
+
+    @property
+    def ready(self) -> bool:
+        return self._ready
+
+    def build(self) -> None:
+        """(Re)build the whole index from the database."""
+        from .models import Game
+
+        # Read before the query, so an edit racing the build triggers another
+        generation = get_catalog_generation()
+        games = Game.objects.filter(is_removed=False).select_related(
+            "country", "region", "city"
+        )
+        entries = {}
+        tokens_by_pk = {}
+        tokens = []
+        for game in games:
+            key = str(game.pk)
+            entries[key], tokens_by_pk[key] = self._entry_for(game)
+            tokens.extend((token, key) for token in tokens_by_pk[key])
+        tokens.sort()
+        name_trigrams = TrigramIndex(
+            (key, entry[1]["name"]) for key, entry in entries.items()
+        )
+        with self._lock:
+            self._entries = entries
+            self._tokens = tokens
+            self._tokens_by_pk = tokens_by_pk
+            self._trigrams = name_trigrams
+            self._generation = generation
+            self._built_at = time.monotonic()
+            self._ready = True
+
+    def _is_current(self, generation: int) -> bool:
+        return (
+            self._generation == generation
+            and time.monotonic() - self._built_at < CATALOG_CACHE_TIMEOUT
+        )
+
+    def _refresh(self) -> None:
+        """Rebuild a built index whose catalog generation has moved."""
+        if not self._ready:
+            return
+        generation = get_catalog_generation()
+        if self._is_current(generation):
+            return
+        with self._build_lock:
+            if self._ready and not self._is_current(generation):
+                self.build()
+
+    def advance(self, generation: int) -> None:
+        """
+        Record that this process's own edit moved the catalog to generation,
+        after applying it. Only a bump straight from the generation we are
+        tagged with counts; if anything else bumped in between, the index
+        stays stale and rebuilds.
+        """
+        with self._lock:
+            if self._ready and self._generation == generation - 1:
+                self._generation = generation
+
+    def warm(self) -> None:
+        """Build the index if possible; a missing/unmigrated DB just defers it."""
+        try:
+            self.build()
+        except DatabaseError:
+            logger.warning("Typeahead index not built at startup", exc_info=True)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._entries = {}
+            self._tokens = []
+            self._tokens_by_pk = {}
+            self._trigrams = TrigramIndex()
+            self._generation = None
+            self._ready = False
+
+    def _entry_for(self, game):
+        token_set = set()
+        for field in INDEXED_FIELDS:
+            token_set.update(tokenize(getattr(game, field) or ""))
+        entry = (
+            game.name.lower(),
+            typeahead_payload(game),
+            frozenset(tokenize(game.name)),
+        )
+        return entry, sorted(token_set)
+
+    def update(self, game) -> None:
+        """Insert or replace one game's entry (removes it if soft-deleted)."""
+        if not self._ready:
+            return
+        key = str(game.pk)
+        if game.is_removed:
+            self.remove(game.pk)
+            return
+        entry, game_tokens = self._entry_for(game)
+        with self._lock:
+            self._discard_tokens(key)
+            self._entries[key] = entry
+            self._tokens_by_pk[key] = game_tokens
+            for token in game_tokens:
+                insort(self._tokens, (token, key))
+            self._trigrams.add(key, game.name)
+
+    def remove(self, pk) -> None:
+        key = str(pk)
+        with self._lock:
+            self._discard_tokens(key)
+            self._entries.pop(key, None)
+            self._trigrams.discard(key)
+
+    def _discard_tokens(self, key: str) -> None:
+        for token in self._tokens_by_pk.pop(key, ()):
+            i = bisect_left(self._tokens, (token, key))
+            if i < len(self._tokens) and self._tokens[i] == (token, key):
+                del self._tokens[i]
+
+    def _prefix_matches(self, prefix: str) -> set:
+        tokens = self._tokens
+        matches = set()
+        i = bisect_left(tokens, (prefix,))
+        while i < len(tokens) and tokens[i][0].startswith(prefix):
+            matches.add(tokens[i][1])
+            i += 1
+        return matches
+
+    def search(self, query: str, limit: int) -> Optional[List[Dict[str, Any]]]:
+        """
+        Return up to limit payloads whose indexed words start with every query
+        word, name matches first then alphabetical. None if the index isn't built.
+        """
+        self._refresh()
+        if not self._ready:
+            return None
+        query_tokens = tokenize(query)
+        if not query_tokens:
+            return []
+        with self._lock:
+            matched: Optional[set] = None
+            for token in query_tokens:
+                found = self._prefix_matches(token)
+                matched = found if matched is None else matched & found
+                if not matched:
+                    return []
+            entries = [self._entries[key] for key in matched]
+
+        def in_name(name_tokens: Iterable[str]) -> bool:
+            return all(any(t.startswith(q) for t in name_tokens) for q in query_tokens)
+
+        entries.sort(key=lambda e: (not in_name(e[2]), e[0]))
+        return [payload for _, payload, _ in entries[:limit]]
+
+    def fuzzy(self, query: str, limit: int) -> Optional[List[Dict[str, Any]]]:
+        """Payloads whose names are trigram-similar to query (typos), best first."""
+        self._refresh()
+        if not self._ready:
+            return None
+        with self._lock:
+            ranked = self._trigrams.search(query, limit=limit)
+            return [self._entries[key][1] for key, _ in ranked]
+
+
+typeahead_index = TypeaheadIndex()
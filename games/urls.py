@@ -1,10 +1,13 @@
 from .views import (
     game_list,
+    game_list_fragment,
     game_detail,
     game_search,
     map_view,
     map_data,
+    map_tile,
     map_location_games,
+    image_transform,
 )
 from django.urls import path
 from . import autocomplete
@@ -26,9 +29,12 @@ urlpatterns = [
         name="city-autocomplete",
     ),
     path("search/", game_search, name="game_search"),
+    path("list/fragment/", game_list_fragment, name="game_list_fragment"),
     path("map/data/", map_data, name="game_map_data"),
+    path("map/tiles/<int:z>/<int:x>/<int:y>/", map_tile, name="game_map_tile"),
     path("map/games/", map_location_games, name="game_map_location_games"),
     path("map/", map_view, name="game_map"),
+    path("images/transform/", image_transform, name="game_image_transform"),
     path("", game_list, name="game_list"),
     path("<slug:slug>/", game_detail, name="game_detail"),
 ]
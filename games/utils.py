@@ -1,11 +1,42 @@
-from typing import Tuple
+import base64
+import hashlib
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager
+from typing import Any, Dict, Tuple
 from io import BytesIO
 from django.core.files.base import ContentFile
 from django.core.exceptions import ValidationError
 from django.core.files.uploadedfile import UploadedFile
+from django.db.models.fields.files import FieldFile
 from django.conf import settings
 from PIL import Image, ImageOps
 
+from .validators import validate_pixel_count
+
+
+@contextmanager
+def _on_disk(image_file):
+    """
+    A binary file object on local disk with image_file's content, so the
+    encoded bytes are never held in memory alongside the decoded image.
+    """
+    path = getattr(image_file, "temporary_file_path", None)
+    if path is not None:
+        with open(path(), "rb") as f:
+            yield f
+        return
+    with tempfile.TemporaryFile() as f:
+        image_file.seek(0)
+        if hasattr(image_file, "chunks"):
+            for chunk in image_file.chunks():
+                f.write(chunk)
+        else:
+            shutil.copyfileobj(image_file, f)
+        f.seek(0)
+        yield f
+
 
 def optimize_image(
     image_field: UploadedFile,
@@ -17,6 +48,11 @@ def optimize_image(
     Optimizes an image by resizing and converting it to the specified format.
     Returns a ContentFile suitable for saving to an ImageField.
 
+    The image is decoded once, from a file on disk, after its pixel count is
+    checked against IMAGE_MAX_PIXELS. JPEGs are decoded straight at the
+    smallest 1/2, 1/4 or 1/8 scale that still covers max_size, so a phone
+    photo never exists in memory at full resolution.
+
     Args:
         image_field: The image file to optimize
         max_size: Tuple of (width, height) for maximum dimensions
@@ -35,16 +71,101 @@ def optimize_image(
     quality = quality or settings.IMAGE_QUALITY
 
     try:
-        img = Image.open(image_field)
-        img = ImageOps.exif_transpose(img)  # Correct orientation
-        img = ImageOps.contain(
-            img, max_size, Image.Resampling.LANCZOS
-        )  # Resize, preserve aspect ratio
+        with _on_disk(image_field) as source:
+            img = Image.open(source)
+            validate_pixel_count(img)
+            # Square target: exif_transpose may swap width and height
+            side = max(max_size)
+            img.draft(None, (side, side))  # No-op for formats other than JPEG
+            ImageOps.exif_transpose(img, in_place=True)  # Correct orientation
+            img = ImageOps.contain(
+                img, max_size, Image.Resampling.LANCZOS
+            )  # Resize, preserve aspect ratio
         buffer = BytesIO()
         img.save(buffer, format=format, quality=quality)
         buffer.seek(0)
         return ContentFile(buffer.read())
+    except ValidationError:
+        raise
     except Exception as e:
         raise ValidationError(
             f"Failed to optimize image: {str(e)}. Please ensure the file is a valid image."
         ) from e
+
+
+def content_fingerprint(file) -> str:
+    """sha256 hex digest of a file's content, leaving it rewound."""
+    digest = hashlib.sha256()
+    file.seek(0)
+    for chunk in file.chunks():
+        digest.update(chunk)
+    file.seek(0)
+    return digest.hexdigest()
+
+
+def save_image_variants(field_file: FieldFile, source: ContentFile) -> Dict[str, Any]:
+    """
+    Store a resized copy of source for each settings.IMAGE_VARIANT_SIZES entry
+    next to field_file, skipping sizes no smaller than the image itself.
+
+    Returns the variants to record on the model, including the full image:
+    {"thumb": {"name": storage name, "width": px}, ..., "full": {...}}
+    """
+    format = settings.IMAGE_FORMAT
+    source.seek(0)
+    img = Image.open(source)
+    img.load()
+    variants = {"full": {"name": field_file.name, "width": img.width}}
+    stem = os.path.splitext(field_file.name)[0]
+    for label, size in settings.IMAGE_VARIANT_SIZES.items():
+        resized = ImageOps.contain(img, size, Image.Resampling.LANCZOS)
+        if resized.width >= img.width:
+            continue
+        buffer = BytesIO()
+        resized.save(buffer, format=format, quality=settings.IMAGE_QUALITY)
+        name = field_file.storage.save(
+            f"{stem}_{label}.{format.lower()}", ContentFile(buffer.getvalue())
+        )
+        variants[label] = {"name": name, "width": resized.width}
+    return variants
+
+
+# Longest side of the inline placeholder; blurred up to size by the browser
+PLACEHOLDER_SIZE = 16
+
+
+def image_preview(source) -> Dict[str, Any]:
+    """
+    Intrinsic size of an image plus a tiny inline WEBP (a data URI of a couple
+    hundred bytes) to show while the real file loads.
+    """
+    source.seek(0)
+    img = Image.open(source)
+    width, height = img.size
+    img.draft(None, (PLACEHOLDER_SIZE, PLACEHOLDER_SIZE))
+    tiny = ImageOps.contain(img, (PLACEHOLDER_SIZE, PLACEHOLDER_SIZE))
+    if tiny.mode not in ("RGB", "RGBA"):
+        tiny = tiny.convert("RGBA" if "A" in tiny.getbands() else "RGB")
+    buffer = BytesIO()
+    tiny.save(buffer, format="WEBP", quality=40)
+    encoded = base64.b64encode(buffer.getvalue()).decode()
+    return {
+        "width": width,
+        "height": height,
+        "placeholder": f"data:image/webp;base64,{encoded}",
+    }
+
+
+def delete_image_variants(storage, variants: Dict[str, Any]) -> None:
+    """Remove stored variant files (not the full image, which the field owns)."""
+    for label, variant in variants.items():
+        if label != "full":
+            storage.delete(variant["name"])
+
+
+def variant_srcset(storage, variants: Dict[str, Any]) -> str:
+    """srcset attribute value for recorded variants, smallest first."""
+    return ", ".join(
+        f"{storage.url(v['name'])} {v['width']}w"
+        for v in sorted(variants.values(), key=lambda v: v["width"])
+    )
@@ -6,11 +6,28 @@ from django.conf import settings
 from PIL import Image
 
 
+def validate_pixel_count(img: Image.Image, max_pixels: int = None) -> None:
+    """
+    Reject images too large to decode safely. Only needs the header, so call it
+    right after Image.open, before anything touches the pixels.
+    """
+    max_pixels = max_pixels or settings.IMAGE_MAX_PIXELS
+    if img.width * img.height > max_pixels:
+        raise ValidationError(
+            f"Image is too large ({img.width}x{img.height}); "
+            f"the limit is {max_pixels // 1_000_000} megapixels."
+        )
+
+
 def validate_image(file: UploadedFile) -> None:
-    # Only check that the file is a valid image and has a supported extension
+    # Only check that the file is a valid image and has a supported extension;
+    # verify() parses the file without decoding it, the worker decodes it once
     try:
         img = Image.open(file)
+        validate_pixel_count(img)
         img.verify()  # Verify that it's a valid image
+    except ValidationError:
+        raise
     except Exception:
         raise ValidationError("Uploaded file is not a valid image.")
 
@@ -1,17 +1,49 @@
 import json
 import os
-from typing import Dict, Any, Optional
-from django.db.models import QuerySet, Count, Avg
-from django.http import HttpRequest, HttpResponse, JsonResponse
+from typing import Dict, Any, Optional, Tuple
+from django.db.models import QuerySet, Count
+from django.http import (
+    FileResponse,
+    Http404,
+    HttpRequest,
+    HttpResponse,
+    HttpResponseBadRequest,
+    JsonResponse,
+)
 from django.shortcuts import get_object_or_404, redirect, render
+from django.template.loader import render_to_string
+from django.utils.cache import patch_cache_control, patch_vary_headers
 from django.views.decorators.http import require_GET
 from django.urls import reverse
 from cities_light.models import Country, Region, City
 from django.core.cache import cache
 from django.core.paginator import Paginator
-from django.db.models import Q
-
-from games.models import Game, GameImages
+from django.db.models import Prefetch, Q
+
+from games.models import Game, GameDate, GameImages, RegionCentroid, Season
+from games.bitmap import catalog_index
+from games.cards import game_cards
+from games.catalog import (
+    CATALOG_CACHE_TIMEOUT,
+    cache_catalog_page,
+    cached_catalog_count,
+    cached_for_filters,
+    catalog_conditional,
+)
+from games.detail_cache import cache_game_detail
+from games.facets import FacetCounts, facet_counts
+from games.fuzzy import fuzzy_filter
+from games.mapformat import encode_compact
+from games.maptiles import cluster_tile, is_valid_tile, tile_items
+from games.pagination import keyset_paginate
+from games.search import get_search_backend
+from games.transforms import (
+    TRANSFORM_FORMATS,
+    TransformError,
+    open_variant,
+    parse_transform,
+)
+from games.typeahead import typeahead_index, typeahead_payload
 
 # Combined "Episodes" option in the filter: label "Episodes", filters for both EP and FI in DB
 FILMING_STATUS_EPISODES_VALUE = "EP_FI"
@@ -65,12 +97,9 @@ def _apply_filters(queryset: QuerySet[Game], filters: Dict[str, Any]) -> QuerySe
     """
     games = queryset
 
-    # Text search
+    # Text search (indexed; see games.search)
     if filters.get("query"):
-        games = games.filter(
-            Q(name__icontains=filters["query"])
-            | Q(description__icontains=filters["query"])
-        )
+        games = get_search_backend().search(games, filters["query"])
 
     # Multi-value filters (format, duration, viewing status)
     game_formats = filters.get("game_formats") or []
@@ -138,7 +167,7 @@ def _apply_filters(queryset: QuerySet[Game], filters: Dict[str, Any]) -> QuerySe
 
 
 def _build_location_context(
-    country_id: Optional[str], region_id: Optional[str]
+    country_id: Optional[str], region_id: Optional[str], facets: FacetCounts
 ) -> Dict[str, Any]:
     """
     Build context for location dropdowns (countries, regions, cities).
@@ -146,30 +175,32 @@ def _build_location_context(
     Args:
         country_id: Selected country ID (optional)
         region_id: Selected region ID (optional)
+        facets: Facet counts for the current filters; which locations have
+            games comes from here rather than separate Game queries
 
     Returns:
-        Dict with countries, regions, regions_with_games, cities
+        Dict with countries, regions, regions_with_games, cities; each location
+        carries a game_count under the current filters
     """
-    countries = Country.objects.filter(
-        id__in=Game.objects.values_list("country_id", flat=True).distinct()
-    )
+    countries = list(Country.objects.filter(id__in=facets.countries_with_games))
+    for country in countries:
+        country.game_count = facets.countries.get(country.id, 0)
 
     if country_id:
-        regions_with_games = set(
-            Game.objects.filter(country_id=country_id)
-            .values_list("region_id", flat=True)
-            .distinct()
-        )
-        regions = Region.objects.filter(country_id=country_id)
+        regions_with_games = facets.regions_with_games
+        regions = list(Region.objects.filter(country_id=country_id))
+        for region in regions:
+            region.game_count = facets.regions.get(region.id, 0)
     else:
         regions = []
         regions_with_games = set()
 
     if region_id:
-        cities = City.objects.filter(
-            id__in=Game.objects.values_list("city_id", flat=True).distinct(),
-            region_id=region_id,
+        cities = list(
+            City.objects.filter(id__in=facets.cities_with_games, region_id=region_id)
         )
+        for city in cities:
+            city.game_count = facets.cities.get(city.id, 0)
     else:
         cities = []
 
@@ -181,13 +212,41 @@ def _build_location_context(
     }
 
 
-GAME_LIST_PAGE_SIZE = 12  # Divisible by 2 and 3 for grid layout
+def _with_counts(choices, counts: Dict[str, int]) -> list:
+    """(value, label) choices -> (value, label, count) for the filter dropdowns."""
+    return [(value, label, counts.get(value, 0)) for value, label in choices]
 
 
-def game_list(request: HttpRequest) -> HttpResponse:
-    """
-    Display a paginated list of games with filtering options.
-    """
+GAME_LIST_PAGE_SIZE = 12  # Divisible by 2 and 3 for grid layout
+
+# Querystring params game_list understands; other params bypass the page cache
+GAME_LIST_PARAMS = (
+    "q",
+    "game_format",
+    "game_duration",
+    "filming_status",
+    "country",
+    "no_region",
+    "region",
+    "no_city",
+    "city",
+    "inactive_filter",
+    "college_filter",
+    "friends_and_family_filter",
+    "charity_filter",
+    "casting_filter",
+    "page",
+    "paginate",
+    "cursor",
+    "view",
+    "filter_open",
+)
+# The GAME_LIST_PARAMS read with getlist; order among their values doesn't matter
+GAME_LIST_MULTI_PARAMS = ("game_format", "game_duration", "filming_status")
+
+
+def _game_list_context(request: HttpRequest) -> Dict[str, Any]:
+    """Build the game_list template context (shared with the fragment endpoint)."""
     # Extract filter parameters from request (format/duration/status are multi-select)
     raw_filming = request.GET.getlist("filming_status")
     filters = {
@@ -210,23 +269,39 @@ def game_list(request: HttpRequest) -> HttpResponse:
     # Get base queryset with optimizations
     games = Game.objects.select_related("country", "region", "city").order_by("name")
 
-    # Apply filters
-    games = _apply_filters(games, filters)
-
-    # Pagination
-    paginator = Paginator(games, GAME_LIST_PAGE_SIZE)
-    page_number = request.GET.get("page")
-    page_obj = paginator.get_page(page_number)
+    # Pagination: numbered pages by default; ?paginate=cursor switches to keyset
+    # pages (no COUNT/OFFSET) with a cached total, for deep crawls
+    cursor_mode = request.GET.get("paginate") == "cursor"
+    if cursor_mode:
+        games = _apply_filters(games, filters)
+        page_obj = keyset_paginate(
+            games, request.GET.get("cursor"), GAME_LIST_PAGE_SIZE
+        )
+        page_obj.approximate_total = cached_catalog_count("list_count", filters, games)
+    else:
+        # Filters resolved in memory; only the shown page is fetched
+        paginator = Paginator(catalog_index.filter(games, filters), GAME_LIST_PAGE_SIZE)
+        page_number = request.GET.get("page")
+        page_obj = paginator.get_page(page_number)
 
-    # Build querystring for pagination, excluding 'page'
+    # Build querystring for pagination, excluding 'page' and 'cursor'
     get_params = request.GET.copy()
-    if "page" in get_params:
-        get_params.pop("page")
+    for key in ("page", "cursor"):
+        if key in get_params:
+            get_params.pop(key)
     pagination_querystring = get_params.urlencode()
 
+    # Option counts for every dropdown, plus which locations have games
+    facets = facet_counts(filters)
+    filming_counts = dict(facets.filming_statuses)
+    filming_counts[FILMING_STATUS_EPISODES_VALUE] = sum(
+        facets.filming_statuses.get(status, 0)
+        for status in FILMING_STATUS_EPISODES_EXPANDS_TO
+    )
+
     # Build location context for dropdowns
     location_context = _build_location_context(
-        filters["country_id"], filters["region_id"]
+        filters["country_id"], filters["region_id"], facets
     )
 
     # View mode: list or map (Redfin/Zillow-style toggle)
@@ -245,9 +320,14 @@ def game_list(request: HttpRequest) -> HttpResponse:
     context = {
         "page_obj": page_obj,
         "query": filters["query"],
-        "game_formats": Game.GameFormat.choices,
-        "game_durations": Game.GameDuration.choices,
-        "filming_statuses": FILMING_STATUS_DROPDOWN_CHOICES,
+        "game_formats": _with_counts(Game.GameFormat.choices, facets.game_formats),
+        "game_durations": _with_counts(
+            Game.GameDuration.choices, facets.game_durations
+        ),
+        "filming_statuses": _with_counts(
+            FILMING_STATUS_DROPDOWN_CHOICES, filming_counts
+        ),
+        "tri_state_counts": facets.tri_state,
         "selected_country": filters["country_id"],
         "selected_region": filters["region_id"],
         "selected_city": filters["city_id"],
@@ -260,15 +340,65 @@ def game_list(request: HttpRequest) -> HttpResponse:
         "charity_filter": filters["charity_filter"],
         "casting_filter": filters["casting_filter"],
         "pagination_querystring": pagination_querystring,
+        "cursor_mode": cursor_mode,
         "view_mode": view_mode,
         "list_view_url": list_view_url,
         "map_view_url": map_view_url,
         **location_context,  # Unpack location context (countries, regions, etc.)
     }
 
-    return render(request, "games/games.html", context)
+    return context
+
+
+@catalog_conditional
+@cache_catalog_page("list", GAME_LIST_PARAMS, GAME_LIST_MULTI_PARAMS)
+def game_list(request: HttpRequest) -> HttpResponse:
+    """
+    Display a paginated list of games with filtering options.
+    """
+    return render(request, "games/games.html", _game_list_context(request))
+
+
+def _facet_state(context: Dict[str, Any]) -> Dict[str, Any]:
+    """Dropdown counts and location options from a game_list context, as JSON."""
+
+    def locations(items, enabled=None):
+        return [
+            {
+                "id": str(item.id),
+                "name": item.name,
+                "count": item.game_count,
+                "enabled": enabled is None or item.id in enabled,
+            }
+            for item in items
+        ]
+
+    return {
+        "game_format": {v: n for v, _, n in context["game_formats"]},
+        "game_duration": {v: n for v, _, n in context["game_durations"]},
+        "filming_status": {v: n for v, _, n in context["filming_statuses"]},
+        **context["tri_state_counts"],
+        "country": locations(context["countries"]),
+        "region": locations(context["regions"], context["regions_with_games"]),
+        "city": locations(context["cities"]),
+    }
 
 
+@require_GET
+@catalog_conditional
+@cache_catalog_page("list_fragment", GAME_LIST_PARAMS, GAME_LIST_MULTI_PARAMS)
+def game_list_fragment(request: HttpRequest) -> JsonResponse:
+    """
+    Return just the game cards and pagination (partials/game_list.html) plus
+    updated facet counts, for game_list.js to swap in place on filter changes.
+    """
+    context = _game_list_context(request)
+    html = render_to_string("games/partials/game_list.html", context, request=request)
+    return JsonResponse({"html": html, "facets": _facet_state(context)})
+
+
+@catalog_conditional(daily=True)
+@cache_game_detail
 def game_detail(request: HttpRequest, slug: str) -> HttpResponse:
     """
     Display details for a single game by slug.
@@ -287,13 +417,31 @@ def game_detail(request: HttpRequest, slug: str) -> HttpResponse:
 
     game = get_object_or_404(
         Game.objects.select_related("country", "region", "city").prefetch_related(
-            "seasons", "images", "next_season_date"
+            Prefetch(
+                "next_season_date",
+                queryset=GameDate.objects.filter(is_removed=False),
+                to_attr="live_dates",
+            ),
+            Prefetch(
+                "seasons",
+                queryset=Season.objects.filter(is_removed=False),
+                to_attr="live_seasons",
+            ),
+            Prefetch(
+                "images",
+                queryset=GameImages.objects.filter(is_removed=False),
+                to_attr="live_images",
+            ),
         ),
         slug=slug,
     )
+    # The template only reads these lists, so rendering never hits the database
     context = {
         "game": game,
-        "event_jsonld": build_event_jsonld(game, request),
+        "next_date": game.live_dates[0] if game.live_dates else None,
+        "seasons": game.live_seasons,
+        "images": game.live_images,
+        "event_jsonld": build_event_jsonld(game, request, dates=game.live_dates),
     }
     return render(request, "games/game_detail.html", context)
 
@@ -320,194 +468,255 @@ def _get_map_filters(request: HttpRequest) -> Dict[str, Any]:
     }
 
 
-def map_data(request: HttpRequest) -> JsonResponse:
+# One row per distinct game location; names and coordinates ride along via joins
+MAP_LOCATION_COLUMNS = (
+    "country_id",
+    "country__name",
+    "country__code2",
+    "region_id",
+    "region__name",
+    "region__country_id",
+    "region__country__code2",
+    "city_id",
+    "city__name",
+    "city__region_id",
+    "city__latitude",
+    "city__longitude",
+)
+
+
+def _get_region_coords() -> Dict[int, list]:
+    """Region id -> [lat, lng] from the precomputed RegionCentroid table."""
+    region_coords = cache.get("games:map_region_coords")
+    if region_coords is None:
+        region_coords = {
+            region_id: [lat, lng]
+            for region_id, lat, lng in RegionCentroid.objects.values_list(
+                "region_id", "latitude", "longitude"
+            )
+        }
+        # Timeout so workers pick up a rebuild from build_region_centroids
+        cache.set("games:map_region_coords", region_coords, CATALOG_CACHE_TIMEOUT)
+    return region_coords
+
+
+def _by_count(buckets: Dict[Any, Dict[str, Any]]) -> list:
+    return sorted(buckets.values(), key=lambda b: -b["count"])
+
+
+def _build_map_levels(filters: Dict[str, Any]) -> Dict[str, list]:
     """
-    Return JSON with game counts and coordinates for countries, regions, and cities.
-    Accepts same GET params as game_list so the map reflects current filters.
+    Game counts and coordinates for countries, regions, cities, country-only and
+    region-only buckets. A single grouped query over (country, region, city) is
+    rolled up in Python into all five levels.
     """
     base = Game.objects.filter(is_removed=False)
-    base = _apply_filters(base, _get_map_filters(request))
+    base = _apply_filters(base, filters)
+    rows = base.values(*MAP_LOCATION_COLUMNS).annotate(count=Count("id")).order_by()
     centroids = _get_country_centroids()
+    region_coords = _get_region_coords()
 
-    # Countries with at least one game
-    country_counts = (
-        base.values("country_id").annotate(count=Count("id")).order_by("-count")
-    )
-    country_ids = [r["country_id"] for r in country_counts]
-    countries_qs = Country.objects.filter(id__in=country_ids).in_bulk()
-
-    countries = []
-    for row in country_counts:
-        c = countries_qs.get(row["country_id"])
-        if not c:
-            continue
-        code2 = c.code2 or ""
+    def region_lat_lng(row) -> list:
+        if row["region_id"] in region_coords:
+            return region_coords[row["region_id"]]
+        return centroids.get(row["region__country__code2"] or "", [0.0, 0.0])
+
+    countries, regions, cities, country_only, region_only = {}, {}, {}, {}, {}
+
+    def add(buckets, key, count, make):
+        if key not in buckets:
+            buckets[key] = make()
+        buckets[key]["count"] += count
+
+    for row in rows:
+        count = row["count"]
+        code2 = row["country__code2"] or ""
         lat, lng = centroids.get(code2, [0.0, 0.0])
-        countries.append(
-            {
-                "id": str(c.id),
-                "name": c.name,
+        add(
+            countries,
+            row["country_id"],
+            count,
+            lambda: {
+                "id": str(row["country_id"]),
+                "name": row["country__name"],
                 "code2": code2,
-                "count": row["count"],
+                "count": 0,
                 "lat": float(lat),
                 "lng": float(lng),
-            }
+            },
         )
 
-    # Regions with at least one game
-    region_counts = (
-        base.filter(region_id__isnull=False)
-        .values("region_id")
-        .annotate(count=Count("id"))
-        .order_by("-count")
-    )
-    region_ids = [r["region_id"] for r in region_counts]
-    regions_qs = Region.objects.filter(id__in=region_ids).select_related("country")
-    regions_by_id = {r.id: r for r in regions_qs}
-
-    all_region_coords = cache.get("games:map_region_coords")
-    if all_region_coords is None:
-        region_coords_qs = City.objects.values("region_id").annotate(
-            lat=Avg("latitude"), lng=Avg("longitude")
-        )
-        all_region_coords = {
-            row["region_id"]: [float(row["lat"]), float(row["lng"])]
-            for row in region_coords_qs
-            if row["lat"] is not None and row["lng"] is not None
-        }
-        cache.set("games:map_region_coords", all_region_coords, timeout=None)
-    region_coords = {
-        rid: all_region_coords[rid] for rid in region_ids if rid in all_region_coords
+        if row["region_id"] is None:
+            # Games with no region/state (country-only), so they stay visible when zoomed in
+            add(
+                country_only,
+                row["country_id"],
+                count,
+                lambda: {
+                    "country_id": str(row["country_id"]),
+                    "name": f"{row['country__name']} (no state/region)",
+                    "count": 0,
+                    "lat": float(lat),
+                    "lng": float(lng),
+                },
+            )
+        else:
+            region_lat, region_lng = region_lat_lng(row)
+            add(
+                regions,
+                row["region_id"],
+                count,
+                lambda: {
+                    "id": str(row["region_id"]),
+                    "name": row["region__name"],
+                    "country_id": str(row["region__country_id"]),
+                    "count": 0,
+                    "lat": float(region_lat),
+                    "lng": float(region_lng),
+                },
+            )
+            if row["city_id"] is None:
+                # Games with region but no city, so they stay visible at city zoom level
+                add(
+                    region_only,
+                    row["region_id"],
+                    count,
+                    lambda: {
+                        "region_id": str(row["region_id"]),
+                        "name": f"{row['region__name']} (no city)",
+                        "count": 0,
+                        "lat": float(region_lat),
+                        "lng": float(region_lng),
+                    },
+                )
+
+        # Cities with at least one game (must have coordinates)
+        if (
+            row["city_id"] is not None
+            and row["city__latitude"] is not None
+            and row["city__longitude"] is not None
+        ):
+            add(
+                cities,
+                row["city_id"],
+                count,
+                lambda: {
+                    "id": str(row["city_id"]),
+                    "name": row["city__name"],
+                    "region_id": (
+                        str(row["city__region_id"]) if row["city__region_id"] else None
+                    ),
+                    "count": 0,
+                    "lat": float(row["city__latitude"]),
+                    "lng": float(row["city__longitude"]),
+                },
+            )
+
+    return {
+        "countries": _by_count(countries),
+        "regions": _by_count(regions),
+        "cities": _by_count(cities),
+        "country_only": _by_count(country_only),
+        "region_only": _by_count(region_only),
     }
 
-    regions = []
-    for row in region_counts:
-        r = regions_by_id.get(row["region_id"])
-        if not r:
-            continue
-        code2 = r.country.code2 if r.country_id else ""
-        if row["region_id"] in region_coords:
-            lat, lng = region_coords[row["region_id"]]
-        else:
-            lat, lng = centroids.get(code2, [0.0, 0.0])
-        regions.append(
-            {
-                "id": str(r.id),
-                "name": r.name,
-                "country_id": str(r.country_id),
-                "count": row["count"],
-                "lat": float(lat),
-                "lng": float(lng),
-            }
-        )
 
-    # Cities with at least one game (must have coordinates)
-    city_counts = (
-        base.filter(city_id__isnull=False)
-        .values("city_id")
-        .annotate(count=Count("id"))
-        .order_by("-count")
+def _map_levels(filters: Dict[str, Any]) -> Dict[str, list]:
+    """_build_map_levels, cached per filter set (shared by map_data and map tiles)."""
+    return cached_for_filters("map_levels", filters, lambda: _build_map_levels(filters))
+
+
+def _accepts_gzip(request: HttpRequest) -> bool:
+    return "gzip" in request.headers.get("Accept-Encoding", "")
+
+
+def _map_data_encoding(request: HttpRequest) -> str:
+    """ETag variant: the compact format is sent gzipped when the client accepts it."""
+    compact = request.GET.get("format") == "compact"
+    return "gzip" if compact and _accepts_gzip(request) else ""
+
+
+@catalog_conditional(variant=_map_data_encoding)
+def map_data(request: HttpRequest) -> JsonResponse:
+    """
+    Return JSON with game counts and coordinates for countries, regions, and cities.
+    Accepts same GET params as game_list so the map reflects current filters.
+
+    With format=compact, returns the columnar encoding from games.mapformat,
+    cached per filter set already serialized and gzipped.
+    """
+    filters = _get_map_filters(request)
+    if request.GET.get("format") != "compact":
+        return JsonResponse(_map_levels(filters))
+
+    body, gzipped = cached_for_filters(
+        "map_compact", filters, lambda: encode_compact(_map_levels(filters))
     )
-    city_ids = [r["city_id"] for r in city_counts]
-    cities_qs = (
-        City.objects.filter(id__in=city_ids)
-        .exclude(latitude__isnull=True)
-        .exclude(longitude__isnull=True)
+    accepts_gzip = _accepts_gzip(request)
+    response = HttpResponse(
+        gzipped if accepts_gzip else body, content_type="application/json"
     )
-    cities_by_id = {c.id: c for c in cities_qs}
-
-    cities = []
-    for row in city_counts:
-        c = cities_by_id.get(row["city_id"])
-        if not c:
-            continue
-        cities.append(
-            {
-                "id": str(c.id),
-                "name": c.name,
-                "region_id": str(c.region_id) if c.region_id else None,
-                "count": row["count"],
-                "lat": float(c.latitude),
-                "lng": float(c.longitude),
-            }
-        )
+    if accepts_gzip:
+        response["Content-Encoding"] = "gzip"
+    patch_vary_headers(response, ["Accept-Encoding"])
+    return response
 
-    # Games with no region/state (country-only), so they stay visible when zoomed in
-    country_only_counts = (
-        base.filter(region_id__isnull=True)
-        .values("country_id")
-        .annotate(count=Count("id"))
-        .order_by("-count")
-    )
-    country_only = []
-    for row in country_only_counts:
-        c = countries_qs.get(row["country_id"])
-        if not c:
-            continue
-        code2 = c.code2 or ""
-        lat, lng = centroids.get(code2, [0.0, 0.0])
-        country_only.append(
-            {
-                "country_id": str(c.id),
-                "name": f"{c.name} (no state/region)",
-                "count": row["count"],
-                "lat": float(lat),
-                "lng": float(lng),
-            }
-        )
 
-    # Games with region but no city, so they stay visible at city zoom level
-    region_only_counts = (
-        base.filter(region_id__isnull=False, city_id__isnull=True)
-        .values("region_id")
-        .annotate(count=Count("id"))
-        .order_by("-count")
-    )
-    region_only = []
-    for row in region_only_counts:
-        r = regions_by_id.get(row["region_id"])
-        if not r:
-            continue
-        code2 = r.country.code2 if r.country_id else ""
-        if row["region_id"] in region_coords:
-            lat, lng = region_coords[row["region_id"]]
-        else:
-            lat, lng = centroids.get(code2, [0.0, 0.0])
-        region_only.append(
-            {
-                "region_id": str(r.id),
-                "name": f"{r.name} (no city)",
-                "count": row["count"],
-                "lat": float(lat),
-                "lng": float(lng),
-            }
-        )
+@catalog_conditional
+@cache_catalog_page("map_tile", GAME_LIST_PARAMS, GAME_LIST_MULTI_PARAMS)
+def map_tile(request: HttpRequest, z: int, x: int, y: int) -> JsonResponse:
+    """
+    Return the map bubbles inside one z/x/y web-mercator tile, pre-clustered on
+    a pixel grid, at the level (country/region/city) game_map.js shows at zoom z.
+    Accepts the same GET params as game_list.
+    """
+    if not is_valid_tile(z, x, y):
+        raise Http404("No such tile")
+    levels = _map_levels(_get_map_filters(request))
+    return JsonResponse({"items": cluster_tile(tile_items(levels, z), z, x, y)})
+
+
+MAP_PANEL_PAGE_SIZE = 50
 
-    return JsonResponse(
-        {
-            "countries": countries,
-            "regions": regions,
-            "cities": cities,
-            "country_only": country_only,
-            "region_only": region_only,
-        }
-    )
 
+def _map_panel_range(request: HttpRequest) -> Tuple[int, int]:
+    """(offset, limit) from the cursor/limit params; bad values fall back to defaults."""
 
+    def parse(name: str, default: int) -> int:
+        try:
+            return max(int(request.GET.get(name, default)), 0)
+        except ValueError:
+            return default
+
+    limit = parse("limit", MAP_PANEL_PAGE_SIZE) or MAP_PANEL_PAGE_SIZE
+    return parse("cursor", 0), min(limit, MAP_PANEL_PAGE_SIZE)
+
+
+@catalog_conditional
 def map_location_games(request: HttpRequest) -> JsonResponse:
     """
     Return JSON list of games for a given location (for map side panel).
-    GET params: country, region, city, no_region=1, no_city=1 plus all game_list filters.
-    Returns: { games: [...], location_label: str, game_list_url: str }
+    GET params: country, region, city, no_region=1, no_city=1 plus all game_list filters,
+    and limit (at most MAP_PANEL_PAGE_SIZE) / cursor from a previous next_cursor.
+    Returns: { games: [...], total: int, next_cursor: str|null, location_label: str,
+    game_list_url: str }
     """
     filters = _get_map_filters(request)
     if not any([filters["country_id"], filters["region_id"], filters["city_id"]]):
-        return JsonResponse({"games": [], "location_label": "", "game_list_url": ""})
+        return JsonResponse(
+            {
+                "games": [],
+                "total": 0,
+                "next_cursor": None,
+                "location_label": "",
+                "game_list_url": "",
+            }
+        )
 
-    base = Game.objects.filter(is_removed=False).select_related(
-        "country", "region", "city"
-    )
-    games = _apply_filters(base, filters).order_by("name")
+    games = catalog_index.filter(Game.objects.all(), filters)
+    offset, limit = _map_panel_range(request)
+    total = games.count()
+    pks = games.snapshot.pks_for(games.bits, offset, offset + limit)
 
     # Build location label for panel title
     location_label = ""
@@ -540,37 +749,24 @@ def map_location_games(request: HttpRequest) -> JsonResponse:
     # Build game list URL for "View all" link (list view so they see the list of games)
     get_params = request.GET.copy()
     get_params["view"] = "list"
+    get_params.pop("cursor", None)
+    get_params.pop("limit", None)
     game_list_url = reverse("game_list") + (
         "?" + get_params.urlencode() if get_params else ""
     )
 
-    def build_absolute_uri(path: Optional[str]) -> Optional[str]:
-        if not path:
-            return None
-        if path.startswith("http"):
-            return path
-        return request.build_absolute_uri(path)
-
     games_data = []
-    for g in games:
-        logo_url = None
-        if g.logo:
-            logo_url = build_absolute_uri(g.logo.url)
-        elif g.get_default_logo_url():
-            logo_url = build_absolute_uri(g.get_default_logo_url())
-        games_data.append(
-            {
-                "name": g.name,
-                "slug": g.slug,
-                "url": reverse("game_detail", args=[g.slug]),
-                "logo_url": logo_url,
-                "location_display": g.location_display(),
-                "college_name": g.college_name or None,
-            }
-        )
+    for card in game_cards(pks):
+        logo_url = card["logo_url"]
+        if logo_url and not logo_url.startswith("http"):
+            logo_url = request.build_absolute_uri(logo_url)
+        games_data.append({**card, "logo_url": logo_url})
+    next_offset = offset + limit
     return JsonResponse(
         {
             "games": games_data,
+            "total": total,
+            "next_cursor": str(next_offset) if next_offset < total else None,
             "location_label": location_label,
             "game_list_url": game_list_url,
         }
@@ -581,49 +777,53 @@ SEARCH_MAX_RESULTS = 8
 
 
 @require_GET
+@catalog_conditional
 def game_search(request: HttpRequest) -> JsonResponse:
     """
     Global navbar typeahead endpoint. Returns minimal JSON for up to
-    SEARCH_MAX_RESULTS games matching the query string (name or description,
-    case-insensitive). Intentionally unfiltered — searches all games regardless
-    of any page-level filters.
+    SEARCH_MAX_RESULTS games matching the query string (name, college, host or
+    description via the search index), best matches first. Intentionally
+    unfiltered — searches all games regardless of any page-level filters.
     GET params: q (required, min 3 chars)
     """
     query = request.GET.get("q", "").strip()
     if len(query) < 3:
         return JsonResponse({"games": []})
 
-    games = (
-        Game.objects.filter(is_removed=False)
-        .filter(Q(name__icontains=query) | Q(description__icontains=query))
-        .select_related("country", "region", "city")
-        .order_by("name")[:SEARCH_MAX_RESULTS]
-    )
-
-    def logo_url_for(g: Game) -> Optional[str]:
-        if g.logo:
-            url = g.logo.url
-        else:
-            url = g.get_default_logo_url()
-        if not url:
-            return None
-        if url.startswith("http"):
+    # Answer from the in-process prefix index; top up from the search backend
+    # (description matches, ranking) whenever it has fewer than a full page, so
+    # results don't depend on whether this worker's index is built.
+    results = typeahead_index.search(query, SEARCH_MAX_RESULTS) or []
+    if len(results) < SEARCH_MAX_RESULTS:
+        seen = {r["url"] for r in results}
+        games = (
+            get_search_backend()
+            .search(Game.objects.filter(is_removed=False), query)
+            .select_related("country", "region", "city")
+            .order_by("-search_rank", "name")[:SEARCH_MAX_RESULTS]
+        )
+        for g in games:
+            payload = typeahead_payload(g)
+            if payload["url"] not in seen and len(results) < SEARCH_MAX_RESULTS:
+                seen.add(payload["url"])
+                results.append(payload)
+
+    # Nothing matched word prefixes: probably a typo, so rank by name similarity
+    if not results:
+        results = typeahead_index.fuzzy(query, SEARCH_MAX_RESULTS)
+        if results is None:
+            games = fuzzy_filter(
+                Game.objects.filter(is_removed=False), "name", query
+            ).select_related("country", "region", "city")[:SEARCH_MAX_RESULTS]
+            results = [typeahead_payload(g) for g in games]
+
+    def absolute(url: Optional[str]) -> Optional[str]:
+        if not url or url.startswith("http"):
             return url
         return request.build_absolute_uri(url)
 
     return JsonResponse(
-        {
-            "games": [
-                {
-                    "name": g.name,
-                    "url": reverse("game_detail", args=[g.slug]),
-                    "logo_url": logo_url_for(g),
-                    "location": g.location_display(),
-                    "format": g.get_game_format_display(),
-                }
-                for g in games
-            ]
-        }
+        {"games": [{**r, "logo_url": absolute(r["logo_url"])} for r in results]}
     )
 
 
@@ -657,3 +857,29 @@ def gallery(request: HttpRequest) -> HttpResponse:
         "games/gallery.html",
         {"images": page_obj.object_list, "page_obj": page_obj},
     )
+
+
+# Transform URLs name a stored file (never overwritten) plus fixed parameters
+IMAGE_TRANSFORM_MAX_AGE = 60 * 60 * 24 * 365
+
+
+@require_GET
+def image_transform(request: HttpRequest) -> HttpResponse:
+    """
+    Serve a stored logo/image resized on demand (see games.transforms).
+    GET params: src, w, fmt, q and s, the signature from transform_url().
+    """
+    try:
+        src, width, format, quality = parse_transform(request.GET)
+    except TransformError as e:
+        return HttpResponseBadRequest(str(e))
+    storage = GameImages._meta.get_field("image").storage
+    try:
+        variant = open_variant(storage, src, width, format, quality)
+    except FileNotFoundError:
+        raise Http404("No such image")
+    response = FileResponse(variant, content_type=TRANSFORM_FORMATS[format][1])
+    patch_cache_control(
+        response, public=True, max_age=IMAGE_TRANSFORM_MAX_AGE, immutable=True
+    )
+    return response
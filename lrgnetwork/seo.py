@@ -23,17 +23,26 @@ def build_website_jsonld(request):
     return json.dumps(data)
 
 
-def build_event_jsonld(game, request):
+def build_event_jsonld(game, request, dates=None):
     """Build Event JSON-LD for a game detail page.
 
     Only returns JSON if the game has a concrete upcoming start date.
-    Returns None if no valid event data is available.
+    Returns None if no valid event data is available. Pass the game's
+    already-fetched GameDates as dates to avoid querying them again.
     """
-    upcoming = (
-        game.next_season_date.filter(start_date__gte=date.today())
-        .order_by("start_date")
-        .first()
-    )
+    if dates is None:
+        upcoming = (
+            game.next_season_date.filter(start_date__gte=date.today())
+            .order_by("start_date")
+            .first()
+        )
+    else:
+        today = date.today()
+        upcoming = min(
+            (d for d in dates if d.start_date and d.start_date >= today),
+            key=lambda d: d.start_date,
+            default=None,
+        )
     if not upcoming or not upcoming.start_date:
         return None
 
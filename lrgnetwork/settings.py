@@ -13,6 +13,7 @@ https://docs.djangoproject.com/en/5.1/ref/settings/
 from pathlib import Path
 import os
 import sys
+import tempfile
 
 import dj_database_url
 
@@ -163,6 +164,17 @@ if "test" in sys.argv or os.environ.get("PYTEST_CURRENT_TEST"):
         "NAME": ":memory:",
     }
 
+# Cache shared by every process and machine (gunicorn on each Fly machine and
+# the process_image_jobs worker), so catalog generation bumps, detail/card
+# evictions and typeahead refreshes made by one are seen by all. The table is
+# created by games migration 0018_cache_table.
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+        "LOCATION": "django_cache",
+        "OPTIONS": {"MAX_ENTRIES": 20000},
+    }
+}
 
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
@@ -249,8 +261,23 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 # Image processing constants
 IMAGE_MAX_SIZE = (1200, 1200)  # Maximum dimensions for optimized images (width, height)
 IMAGE_MAX_FILE_SIZE = 2 * 1024 * 1024  # Maximum file size: 2MB
+IMAGE_MAX_PIXELS = 50_000_000  # Larger uploads are refused before decoding
 IMAGE_QUALITY = 85  # JPEG/WEBP quality (1-100)
 IMAGE_FORMAT = "WEBP"  # Default image format for optimization
+# Smaller copies generated next to each optimized image, for srcset (name: max size)
+IMAGE_VARIANT_SIZES = {"thumb": (160, 160), "card": (480, 480)}
+# Local disk cache for on-demand resized images (games/transforms.py), trimmed
+# least-recently-used first once it outgrows IMAGE_TRANSFORM_CACHE_MAX_BYTES
+IMAGE_TRANSFORM_CACHE_DIR = os.getenv(
+    "IMAGE_TRANSFORM_CACHE_DIR", os.path.join(tempfile.gettempdir(), "lrg-transforms")
+)
+IMAGE_TRANSFORM_CACHE_MAX_BYTES = int(
+    os.getenv("IMAGE_TRANSFORM_CACHE_MAX_BYTES", 512 * 1024 * 1024)
+)
+
+# Full-text search backend for games (dotted path). Empty = pick by database
+# vendor: Postgres tsvector/GIN, SQLite FTS5, else icontains (see games/search.py)
+GAME_SEARCH_BACKEND = os.getenv("GAME_SEARCH_BACKEND", "")
 
 COMPRESS_ENABLED = True
 COMPRESS_CSS_FILTERS = [
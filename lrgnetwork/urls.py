@@ -24,6 +24,7 @@ from django.shortcuts import render
 from django.urls import include, path
 from django.views.generic import TemplateView
 
+from games.catalog import catalog_conditional
 from games.views import gallery
 from lrgnetwork.seo import build_website_jsonld
 from lrgnetwork.sitemaps import GameSitemap, StaticViewSitemap
@@ -65,7 +66,7 @@ urlpatterns = [
     path("robots.txt", robots_txt, name="robots_txt"),
     path(
         "sitemap.xml",
-        sitemap,
+        catalog_conditional(sitemap),
         {"sitemaps": sitemaps},
         name="django.contrib.sitemaps.views.sitemap",
     ),
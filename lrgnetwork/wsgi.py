@@ -19,3 +19,10 @@ load_dotenv()
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "lrgnetwork.settings")
 
 application = get_wsgi_application()
+
+# Build per-worker in-memory indexes before the first request arrives
+from games.static_index import static_paths  # noqa: E402
+from games.typeahead import typeahead_index  # noqa: E402
+
+static_paths()
+typeahead_index.warm()
@@ -1,19 +1,38 @@
 #!/usr/bin/env python3
 """
-Optimize images in static/resources/images/ that are larger than 500KB.
+Optimize images in static/resources/images/ with Pillow.
 
 This script:
 - Converts PNG files to JPEG (better compression for photos)
 - Resizes images to max 1200px on the longest side
-- Applies 85% JPEG quality for optimal balance of size and quality
-- Only processes files larger than 500KB
+- Re-encodes JPEGs that are over 1200px or larger than 500KB at 85% quality
+- Writes WEBP and AVIF copies next to each JPEG (same name, new extension)
+- Processes files in parallel on a process pool
+- Records a content hash per file in .optimize-manifest.json, so files that
+  haven't changed since the last run are skipped
+
+Runs anywhere Pillow does (Linux, Docker, CI, macOS).
 """
 
+import argparse
+import hashlib
+import json
 import os
 import sys
-import subprocess
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 
+from PIL import Image, ImageOps, features
+
+MAX_DIMENSION = 1200
+QUALITY = 85
+# AVIF's quality scale runs higher; 60 looks like JPEG 85 at a fraction of the size
+AVIF_QUALITY = 60
+# JPEGs at or under this size are left as-is (variants are still generated)
+REENCODE_THRESHOLD = 512000  # 500KB in bytes
+MANIFEST_NAME = ".optimize-manifest.json"
+SOURCE_EXTENSIONS = {".jpg", ".jpeg", ".png"}
+
 
 def get_file_size(filepath):
     """Get file size in bytes."""
@@ -29,134 +48,170 @@ def format_size(size_bytes):
     return f"{size_bytes:.1f}TB"
 
 
-def optimize_image(input_path, output_path=None, max_dimension=1200, quality=85):
-    """
-    Optimize an image using macOS sips command.
+def file_hash(filepath):
+    """sha256 of a file's content."""
+    digest = hashlib.sha256()
+    with open(filepath, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
 
-    Args:
-        input_path: Path to input image
-        output_path: Path to output image (if None, overwrites input)
-        max_dimension: Maximum width or height in pixels
-        quality: JPEG quality (1-100)
-    """
-    input_path = Path(input_path)
 
-    # Determine output path
-    if output_path is None:
-        output_path = input_path
-    else:
-        output_path = Path(output_path)
+def variant_formats():
+    """Extra format -> (extension, quality); AVIF only if Pillow can encode it."""
+    formats = {"WEBP": (".webp", QUALITY)}
+    if features.check("avif"):
+        formats["AVIF"] = (".avif", AVIF_QUALITY)
+    return formats
 
-    try:
-        # If PNG, convert to JPEG first
-        if input_path.suffix.lower() == ".png":
-            jpeg_path = input_path.with_suffix(".jpg")
-
-            # Convert PNG to JPEG
-            subprocess.run(
-                [
-                    "sips",
-                    "-s",
-                    "format",
-                    "jpeg",
-                    "-s",
-                    "formatOptions",
-                    str(quality),
-                    str(input_path),
-                    "--out",
-                    str(jpeg_path),
-                ],
-                check=True,
-                capture_output=True,
-            )
-
-            # Resize the JPEG
-            subprocess.run(
-                ["sips", "-Z", str(max_dimension), str(jpeg_path)],
-                check=True,
-                capture_output=True,
-            )
 
-            # Remove original PNG
-            input_path.unlink()
-            print(f"  ✓ Converted {input_path.name} → {jpeg_path.name}")
-            return str(jpeg_path)
-
-        # For JPEG files, optimize in place
-        else:
-            # Set quality
-            subprocess.run(
-                ["sips", "-s", "formatOptions", str(quality), str(input_path)],
-                check=True,
-                capture_output=True,
-            )
+def optimize_image(input_path, max_dimension=MAX_DIMENSION, quality=QUALITY):
+    """
+    Optimize one image and write its variants. Runs in a worker process.
 
-            # Resize
-            subprocess.run(
-                ["sips", "-Z", str(max_dimension), str(input_path)],
-                check=True,
-                capture_output=True,
-            )
+    Returns a dict describing the result: the (possibly renamed) JPEG path,
+    sizes before/after, the variant paths and the content hash of the final
+    JPEG for the manifest.
+    """
+    input_path = Path(input_path)
+    size_before = get_file_size(input_path)
+    output_path = input_path
+    if input_path.suffix.lower() == ".png":
+        output_path = input_path.with_suffix(".jpg")
+
+    with Image.open(input_path) as img:
+        img = ImageOps.exif_transpose(img)
+        if img.mode != "RGB":
+            img = img.convert("RGB")
+        oversized = max(img.size) > max_dimension
+        img = ImageOps.contain(
+            img, (max_dimension, max_dimension), Image.Resampling.LANCZOS
+        )
+
+        if output_path != input_path or oversized or size_before > REENCODE_THRESHOLD:
+            img.save(output_path, format="JPEG", quality=quality, optimize=True)
+            if output_path != input_path:
+                input_path.unlink()
+
+        variants = []
+        for format, (extension, variant_quality) in variant_formats().items():
+            variant_path = output_path.with_suffix(extension)
+            img.save(variant_path, format=format, quality=variant_quality)
+            variants.append(variant_path.name)
+
+    return {
+        "source": input_path.name,
+        "output": output_path.name,
+        "size_before": size_before,
+        "size_after": get_file_size(output_path),
+        "variants": variants,
+        "hash": file_hash(output_path),
+    }
+
+
+def load_manifest(path):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
 
-            print(f"  ✓ Optimized {input_path.name}")
-            return str(input_path)
 
-    except subprocess.CalledProcessError as e:
-        print(f"  ✗ Error optimizing {input_path.name}: {e}", file=sys.stderr)
-        return None
+def is_up_to_date(image_path, manifest):
+    """Unchanged since the last run, with every variant still on disk."""
+    entry = manifest.get(image_path.name)
+    if not entry or entry.get("hash") != file_hash(image_path):
+        return False
+    return all((image_path.parent / name).exists() for name in entry["variants"])
 
 
 def main():
     """Main function to optimize images in static/resources/images/."""
-    # Define image directory
     script_dir = Path(__file__).parent.parent
-    image_dir = script_dir / "static" / "resources" / "images"
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--dir",
+        type=Path,
+        default=script_dir / "static" / "resources" / "images",
+        help="Image directory (default: static/resources/images)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes (default: one per CPU)",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Ignore the manifest and reprocess every file",
+    )
+    args = parser.parse_args()
+    image_dir = args.dir
 
     if not image_dir.exists():
         print(f"Error: Image directory not found: {image_dir}", file=sys.stderr)
         sys.exit(1)
 
-    # Find all image files
-    image_files = []
-    for ext in [".jpg", ".jpeg", ".png"]:
-        image_files.extend(image_dir.glob(f"*{ext}"))
-        image_files.extend(image_dir.glob(f"*{ext.upper()}"))
-
+    image_files = sorted(
+        path
+        for path in image_dir.iterdir()
+        if path.is_file() and path.suffix.lower() in SOURCE_EXTENSIONS
+    )
     if not image_files:
         print(f"No image files found in {image_dir}")
         return
 
+    manifest_path = image_dir / MANIFEST_NAME
+    manifest = {} if args.force else load_manifest(manifest_path)
+    pending = [path for path in image_files if not is_up_to_date(path, manifest)]
+    skipped_count = len(image_files) - len(pending)
+
     print(f"Checking {len(image_files)} image(s) in {image_dir}...")
+    print(f"{skipped_count} unchanged, {len(pending)} to process")
     print()
 
     optimized_count = 0
-    skipped_count = 0
     error_count = 0
-
-    # Process each image
-    for image_path in sorted(image_files):
-        size = get_file_size(image_path)
-        size_formatted = format_size(size)
-
-        # Only optimize files larger than 500KB
-        if size > 512000:  # 500KB in bytes
-            print(f"Optimizing {image_path.name} ({size_formatted})...")
-            result = optimize_image(image_path)
-            if result:
-                optimized_count += 1
-                new_size = get_file_size(Path(result))
-                new_size_formatted = format_size(new_size)
-                print(f"  Size: {size_formatted} → {new_size_formatted}")
-            else:
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        futures = {pool.submit(optimize_image, path): path for path in pending}
+        for future in as_completed(futures):
+            path = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                print(f"  ✗ Error optimizing {path.name}: {e}", file=sys.stderr)
                 error_count += 1
-        else:
-            print(f"Skipping {image_path.name} (already optimized: {size_formatted})")
-            skipped_count += 1
+                continue
+            optimized_count += 1
+            manifest.pop(result["source"], None)
+            manifest[result["output"]] = {
+                "hash": result["hash"],
+                "variants": result["variants"],
+            }
+            print(
+                f"  ✓ {result['source']} → {result['output']} "
+                f"({format_size(result['size_before'])} → "
+                f"{format_size(result['size_after'])}; "
+                f"+{', '.join(result['variants'])})"
+            )
+
+    # Forget files that no longer exist
+    manifest = {
+        name: entry
+        for name, entry in sorted(manifest.items())
+        if (image_dir / name).exists()
+    }
+    with open(manifest_path, "w") as f:
+        json.dump(manifest, f, indent=2)
+        f.write("\n")
 
     print()
     print(
         f"Complete! Optimized: {optimized_count}, Skipped: {skipped_count}, Errors: {error_count}"
     )
+    if error_count:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
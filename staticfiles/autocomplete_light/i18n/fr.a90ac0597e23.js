@@ -0,0 +1,2 @@
+/*! Select2 4.1.0-rc.0 | https://github.com/select2/select2/blob/master/LICENSE.md */
+var dalLoadLanguage=function(e){var n;(n=e&&e.fn&&e.fn.select2&&e.fn.select2.amd?e.fn.select2.amd:n).define("select2/i18n/fr",[],function(){return{errorLoading:function(){return"Les résultats ne peuvent pas être chargés."},inputTooLong:function(e){e=e.input.length-e.maximum;return"Supprimez "+e+" caractère"+(1<e?"s":"")},inputTooShort:function(e){e=e.minimum-e.input.length;return"Saisissez au moins "+e+" caractère"+(1<e?"s":"")},loadingMore:function(){return"Chargement de résultats supplémentaires…"},maximumSelected:function(e){return"Vous pouvez seulement sélectionner "+e.maximum+" élément"+(1<e.maximum?"s":"")},noResults:function(){return"Aucun résultat trouvé"},searching:function(){return"Recherche en cours…"},removeAllItems:function(){return"Supprimer tous les éléments"},removeItem:function(){return"Supprimer l'élément"}}}),n.define,n.require},event=new CustomEvent("dal-language-loaded",{lang:"fr"});document.dispatchEvent(event);
\ No newline at end of file
@@ -0,0 +1,2 @@
+/*! Select2 4.1.0-rc.0 | https://github.com/select2/select2/blob/master/LICENSE.md */
+var dalLoadLanguage=function(e){var n;(n=e&&e.fn&&e.fn.select2&&e.fn.select2.amd?e.fn.select2.amd:n).define("select2/i18n/lv",[],function(){function n(e,n,t,u){return 11===e?n:e%10==1?t:u}return{inputTooLong:function(e){e=e.input.length-e.maximum;return"Lūdzu ievadiet par  "+e+(" simbol"+n(e,"iem","u","iem"))+" mazāk"},inputTooShort:function(e){e=e.minimum-e.input.length;return"Lūdzu ievadiet vēl "+e+(" simbol"+n(e,"us","u","us"))},loadingMore:function(){return"Datu ielāde…"},maximumSelected:function(e){return"Jūs varat izvēlēties ne vairāk kā "+e.maximum+(" element"+n(e.maximum,"us","u","us"))},noResults:function(){return"Sakritību nav"},searching:function(){return"Meklēšana…"},removeAllItems:function(){return"Noņemt visus vienumus"}}}),n.define,n.require},event=new CustomEvent("dal-language-loaded",{lang:"lv"});document.dispatchEvent(event);
\ No newline at end of file
@@ -0,0 +1,2 @@
+/*! Select2 4.1.0-rc.0 | https://github.com/select2/select2/blob/master/LICENSE.md */
+var dalLoadLanguage=function(n){var e;(e=n&&n.fn&&n.fn.select2&&n.fn.select2.amd?n.fn.select2.amd:e).define("select2/i18n/pl",[],function(){function e(n,e){return 1===n?e[0]:1<n&&n<=4?e[1]:5<=n?e[2]:void 0}var t=["znak","znaki","znaków"],i=["element","elementy","elementów"];return{errorLoading:function(){return"Nie można załadować wyników."},inputTooLong:function(n){n=n.input.length-n.maximum;return"Usuń "+n+" "+e(n,t)},inputTooShort:function(n){n=n.minimum-n.input.length;return"Podaj przynajmniej "+n+" "+e(n,t)},loadingMore:function(){return"Trwa ładowanie…"},maximumSelected:function(n){return"Możesz zaznaczyć tylko "+n.maximum+" "+e(n.maximum,i)},noResults:function(){return"Brak wyników"},searching:function(){return"Trwa wyszukiwanie…"},removeAllItems:function(){return"Usuń wszystkie przedmioty"}}}),e.define,e.require},event=new CustomEvent("dal-language-loaded",{lang:"pl"});document.dispatchEvent(event);
\ No newline at end of file
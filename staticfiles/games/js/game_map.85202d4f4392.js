@@ -0,0 +1,335 @@
+/**
+ * Games map view: Leaflet map with location bubbles and side panel.
+ * Expects #games-map with data-map-tile-url and data-map-location-games-url.
+ * Bubbles come pre-clustered per z/x/y tile from the server (games.maptiles).
+ */
+(function () {
+  "use strict";
+
+  const mapEl = document.getElementById("games-map");
+  if (!mapEl || typeof L === "undefined") return;
+
+  // "/games/map/tiles/0/0/0/" -> "/games/map/tiles/{z}/{x}/{y}/"
+  const tileUrlTemplate = (mapEl.dataset.mapTileUrl || "").replace(
+    /0\/0\/0\/$/,
+    "{z}/{x}/{y}/"
+  );
+  const mapLocationGamesUrl = mapEl.dataset.mapLocationGamesUrl || "";
+
+  function currentQueryString() {
+    return window.location.search ? window.location.search.substring(1) : "";
+  }
+
+  const ZOOM_COUNTRY = 4;
+  const ZOOM_REGION = 6;
+  const BUBBLE_MIN_R = 12;
+  const BUBBLE_MAX_R = 28;
+  const BUBBLE_SCALE = 3;
+  const TILE_SIZE = 256;
+
+  const map = L.map("games-map", {
+    minZoom: 2,
+    maxBounds: L.latLngBounds(L.latLng(-85, -180), L.latLng(85, 180)),
+    maxBoundsViscosity: 1.0,
+  }).setView([20, 0], 2);
+  L.tileLayer(
+    "https://{s}.basemaps.cartocdn.com/light_all/{z}/{x}/{y}.png",
+    {
+      attribution:
+        '&copy; <a href="https://www.openstreetmap.org/copyright">OpenStreetMap</a> &copy; <a href="https://carto.com/attributions">CARTO</a>',
+      subdomains: "abcd",
+      maxZoom: 20,
+      noWrap: true,
+    }
+  ).addTo(map);
+
+  // Tile URL -> items, for this page view (tiles are also cached server-side)
+  const tileCache = {};
+  const markersLayer = L.layerGroup().addTo(map);
+
+  function radiusFromCount(count) {
+    const r = Math.min(BUBBLE_MAX_R, BUBBLE_MIN_R + count * BUBBLE_SCALE);
+    return Math.max(BUBBLE_MIN_R, r);
+  }
+
+  function bubbleColorClass(item) {
+    if (item.type === "cluster") return "map-bubble--cluster";
+    if (item.type === "country" || item.type === "country_only")
+      return "map-bubble--country";
+    if (item.type === "region" || item.type === "region_only")
+      return "map-bubble--region";
+    return "map-bubble--city";
+  }
+
+  function getLevel(zoom) {
+    if (zoom < ZOOM_COUNTRY) return "country";
+    if (zoom < ZOOM_REGION) return "region";
+    return "city";
+  }
+
+  function updateCaption(level) {
+    const captionEl = document.getElementById("map-zoom-caption");
+    if (!captionEl) return;
+    if (level === "country")
+      captionEl.textContent =
+        "Showing countries. Zoom in for regions and cities.";
+    else if (level === "region")
+      captionEl.textContent = "Showing regions and states. Zoom in for cities.";
+    else captionEl.textContent = "Showing cities.";
+  }
+
+  function visibleTileUrls(zoom) {
+    const bounds = map.getPixelBounds();
+    const max = Math.pow(2, zoom) - 1;
+    const clamp = function (v) {
+      return Math.max(0, Math.min(max, v));
+    };
+    const x0 = clamp(Math.floor(bounds.min.x / TILE_SIZE));
+    const x1 = clamp(Math.floor(bounds.max.x / TILE_SIZE));
+    const y0 = clamp(Math.floor(bounds.min.y / TILE_SIZE));
+    const y1 = clamp(Math.floor(bounds.max.y / TILE_SIZE));
+    const qs = currentQueryString();
+    const urls = [];
+    for (let x = x0; x <= x1; x++) {
+      for (let y = y0; y <= y1; y++) {
+        urls.push(
+          tileUrlTemplate
+            .replace("{z}", zoom)
+            .replace("{x}", x)
+            .replace("{y}", y) + (qs ? "?" + qs : "")
+        );
+      }
+    }
+    return urls;
+  }
+
+  function fetchTile(url) {
+    if (tileCache[url]) return Promise.resolve(tileCache[url]);
+    return fetch(url)
+      .then(function (res) {
+        return res.json();
+      })
+      .then(function (json) {
+        tileCache[url] = json.items || [];
+        return tileCache[url];
+      });
+  }
+
+  function openLocationPanelForItem(item) {
+    if (item.type === "cluster") {
+      map.setView([item.lat, item.lng], Math.min(map.getZoom() + 2, 20));
+      return;
+    }
+    const params = new URLSearchParams(window.location.search);
+    if (item.type === "country_only") {
+      params.set("country", item.id);
+      params.set("no_region", "1");
+    } else if (item.type === "region_only") {
+      params.set("region", item.id);
+      params.set("no_city", "1");
+    } else {
+      const param =
+        item.type === "country"
+          ? "country"
+          : item.type === "region"
+            ? "region"
+            : "city";
+      params.set(param, item.id);
+    }
+    params.set("view", "map");
+    openLocationPanel(
+      mapLocationGamesUrl + "?" + params.toString(),
+      item.name
+    );
+  }
+
+  function escapeHtml(text) {
+    const div = document.createElement("div");
+    div.textContent = text;
+    return div.innerHTML;
+  }
+
+  function escapeAttr(text) {
+    const div = document.createElement("div");
+    div.textContent = text;
+    return div.innerHTML.replace(/"/g, "&quot;");
+  }
+
+  function tooltipContent(item) {
+    const countText =
+      item.count === 1 ? "1 game" : item.count + " games";
+    return (
+      "<strong>" +
+      escapeHtml(item.name || "Location") +
+      "</strong><br><span class=\"text-muted\">" +
+      countText +
+      "</span><br><em>Click to view</em>"
+    );
+  }
+
+  function updateBubbles() {
+    const zoom = map.getZoom();
+    updateCaption(getLevel(zoom));
+    Promise.all(visibleTileUrls(zoom).map(fetchTile))
+      .then(function (tiles) {
+        // A newer zoom has already started rendering
+        if (zoom !== map.getZoom()) return;
+        renderBubbles([].concat.apply([], tiles));
+      })
+      .catch(function () {
+        console.error("Failed to load map tiles");
+      });
+  }
+
+  function renderBubbles(items) {
+    markersLayer.clearLayers();
+    items.forEach(function (item) {
+      const r = radiusFromCount(item.count);
+      const colorClass = bubbleColorClass(item);
+      const icon = L.divIcon({
+        className: "map-bubble-div",
+        html:
+          "<span class=\"map-bubble " +
+          colorClass +
+          "\" style=\"width:" +
+          r * 2 +
+          "px;height:" +
+          r * 2 +
+          "px;line-height:" +
+          r * 2 +
+          "px;\">" +
+          item.count +
+          "</span>",
+        iconSize: [r * 2, r * 2],
+        iconAnchor: [r, r],
+      });
+      const marker = L.marker([item.lat, item.lng], { icon: icon });
+      marker.bindTooltip(tooltipContent(item), {
+        permanent: false,
+        direction: "top",
+        className: "map-bubble-tooltip",
+      });
+      marker.on("click", function () {
+        openLocationPanelForItem(item);
+      });
+      markersLayer.addLayer(marker);
+    });
+  }
+
+  map.on("zoomend moveend", updateBubbles);
+
+  const panelEl = document.getElementById("map-side-panel");
+  const panelBackdrop = document.getElementById("map-panel-backdrop");
+  const panelTitle = document.getElementById("map-panel-title");
+  const panelCount = document.getElementById("map-panel-count");
+  const panelList = document.getElementById("map-panel-list");
+  const panelLoading = document.getElementById("map-panel-loading");
+  const panelEmpty = document.getElementById("map-panel-empty");
+  const panelCloseBtn = document.getElementById("map-panel-close");
+
+  function closePanel() {
+    panelEl.classList.remove("is-open");
+    panelBackdrop.classList.remove("is-visible");
+    panelBackdrop.setAttribute("aria-hidden", "true");
+  }
+
+  function gameCardHtml(g) {
+    const logoHtml = g.logo_url
+      ? '<img src="' + escapeAttr(g.logo_url) + '" alt="">'
+      : '<span class="map-panel-game-card-no-logo"></span>';
+    const meta = [];
+    if (g.college_name) meta.push(escapeHtml(g.college_name));
+    if (g.location_display) meta.push(escapeHtml(g.location_display));
+    const metaHtml =
+      meta.length > 0
+        ? "<p class=\"map-panel-game-card-meta\">" + meta.join(" · ") + "</p>"
+        : "";
+    return (
+      "<li><a href=\"" +
+      escapeAttr(g.url) +
+      "\"><div class=\"map-panel-game-card\"><div class=\"map-panel-game-card-logo\">" +
+      logoHtml +
+      "</div><div class=\"map-panel-game-card-body\"><h5 class=\"map-panel-game-card-title\">" +
+      escapeHtml(g.name) +
+      "</h5>" +
+      metaHtml +
+      "</div></div></a></li>"
+    );
+  }
+
+  function withCursor(url, cursor) {
+    const sep = url.indexOf("?") === -1 ? "?" : "&";
+    return url + sep + "cursor=" + encodeURIComponent(cursor);
+  }
+
+  // Appends one page of cards, plus a "Load more" button if there are more
+  function appendGamesPage(url, payload) {
+    panelList.insertAdjacentHTML(
+      "beforeend",
+      payload.games.map(gameCardHtml).join("")
+    );
+    if (!payload.next_cursor) return;
+    const moreItem = document.createElement("li");
+    const moreBtn = document.createElement("button");
+    moreBtn.type = "button";
+    moreBtn.className = "btn btn-outline-primary btn-sm w-100";
+    moreBtn.textContent = "Load more";
+    moreBtn.addEventListener("click", function () {
+      moreBtn.disabled = true;
+      fetch(withCursor(url, payload.next_cursor))
+        .then(function (res) {
+          return res.json();
+        })
+        .then(function (next) {
+          moreItem.remove();
+          appendGamesPage(url, next);
+        })
+        .catch(function () {
+          moreBtn.disabled = false;
+        });
+    });
+    moreItem.appendChild(moreBtn);
+    panelList.appendChild(moreItem);
+  }
+
+  function openLocationPanel(url, fallbackTitle) {
+    panelEl.classList.add("is-open");
+    panelBackdrop.classList.add("is-visible");
+    panelBackdrop.setAttribute("aria-hidden", "false");
+    panelTitle.textContent = fallbackTitle || "Games";
+    panelCount.textContent = "";
+    panelList.innerHTML = "";
+    panelList.style.display = "none";
+    panelEmpty.style.display = "none";
+    panelLoading.style.display = "block";
+    fetch(url)
+      .then(function (res) {
+        return res.json();
+      })
+      .then(function (payload) {
+        panelLoading.style.display = "none";
+        panelTitle.textContent =
+          payload.location_label || fallbackTitle || "Games";
+        if (payload.games && payload.games.length > 0) {
+          panelCount.textContent =
+            payload.total === 1 ? "1 game" : payload.total + " games";
+          panelList.style.display = "block";
+          appendGamesPage(url, payload);
+        } else {
+          panelCount.textContent = "";
+          panelEmpty.style.display = "block";
+        }
+      })
+      .catch(function () {
+        panelLoading.style.display = "none";
+        panelCount.textContent = "";
+        panelEmpty.textContent = "Could not load games.";
+        panelEmpty.style.display = "block";
+      });
+  }
+
+  if (panelCloseBtn) panelCloseBtn.addEventListener("click", closePanel);
+  if (panelBackdrop) panelBackdrop.addEventListener("click", closePanel);
+
+  updateBubbles();
+})();